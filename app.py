@@ -1,27 +1,10 @@
-import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import joblib
 import warnings
-from datetime import datetime
-import time
-import seaborn as sns
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import LabelEncoder, StandardScaler
-from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
 
-import io
-import base64
-from datetime import datetime, timedelta
-import json
-import sqlite3
-from sklearn.model_selection import cross_val_score
-from sklearn.metrics import roc_auc_score, precision_recall_curve
-import plotly.figure_factory as ff
+import streamlit as st
+
+from dashboard.admin import start_metrics_endpoint
+from dashboard.layout import show_dashboard, show_professional_header, show_upload_interface
+from dashboard.styles import inject_styles
 
 warnings.filterwarnings('ignore')
 
@@ -33,491 +16,10 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-st.markdown("""
-<style>
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800;900&display=swap');
-    
-    /* Enhanced animations and transitions */
-    @keyframes fadeInUp {
-        from {
-            opacity: 0;
-            transform: translateY(30px);
-        }
-        to {
-            opacity: 1;
-            transform: translateY(0);
-        }
-    }
-    
-    @keyframes slideInLeft {
-        from {
-            opacity: 0;
-            transform: translateX(-50px);
-        }
-        to {
-            opacity: 1;
-            transform: translateX(0);
-        }
-    }
-    
-    @keyframes glow {
-        0%, 100% { box-shadow: 0 8px 25px rgba(14, 165, 233, 0.4); }
-        50% { box-shadow: 0 12px 35px rgba(14, 165, 233, 0.7); }
-    }
-    
-    @keyframes pulse {
-        0%, 100% { opacity: 0.9; }
-        50% { opacity: 1; }
-    }
-    
-    @keyframes bounce {
-        0%, 20%, 50%, 80%, 100% { transform: translateY(0); }
-        40% { transform: translateY(-10px); }
-        60% { transform: translateY(-5px); }
-    }
-    
-    /* Enhanced text contrast rules for perfect readability */
-    /* Main app styling with light background */
-    .stApp {
-        background: #ffffff;
-        color: #000000 !important; /* Pure black text on white background */
-        font-family: 'Inter', sans-serif;
-        animation: fadeInUp 0.6s ease-out;
-    }
-    
-    /* Light backgrounds get pure black text */
-    .main-content {
-        background: #ffffff;
-        color: #000000 !important;
-    }
-    
-    /* Dark backgrounds get pure white text */
-    .dark-bg {
-        background: #1f2937;
-        color: #ffffff !important;
-    }
-    
-    .main-header {
-        display: flex;
-        align-items: center;
-        justify-content: space-between;
-        padding: 2rem 0;
-        border-bottom: 2px solid #e5e7eb;
-        margin-bottom: 2rem;
-        animation: slideInLeft 0.8s ease-out;
-        background: linear-gradient(135deg, #f8fafc, #ffffff);
-        border-radius: 16px;
-        padding: 2rem;
-        box-shadow: 0 4px 20px rgba(0, 0, 0, 0.1);
-        color: #000000 !important; /* Pure black text on light gradient background */
-    }
-    
-    .brand-section {
-        display: flex;
-        align-items: center;
-        gap: 16px;
-        animation: fadeInUp 0.6s ease-out 0.2s both;
-    }
-    
-    .brand-icon {
-        background: linear-gradient(135deg, #0ea5e9, #3b82f6);
-        width: 56px;
-        height: 56px;
-        border-radius: 16px;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        color: #ffffff !important; /* Pure white text on dark blue background */
-        font-weight: 900;
-        font-size: 24px;
-        box-shadow: 0 8px 25px rgba(14, 165, 233, 0.4);
-        transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-        animation: glow 3s infinite;
-    }
-    
-    .brand-icon:hover {
-        transform: rotate(360deg) scale(1.2);
-        box-shadow: 0 12px 40px rgba(14, 165, 233, 0.6);
-    }
-    
-    .brand-text h1 {
-        font-size: 32px !important;
-        font-weight: 900 !important;
-        color: #000000 !important; /* Pure black text on light background */
-        margin: 0 !important;
-        line-height: 1.2 !important;
-        text-shadow: 0 2px 4px rgba(0, 0, 0, 0.1) !important;
-    }
-    
-    .brand-text p {
-        font-size: 16px !important;
-        color: #1f2937 !important; /* Dark gray text on light background */
-        margin: 0 !important;
-        font-weight: 600 !important;
-    }
-    
-    .export-btn {
-        background: linear-gradient(135deg, #0ea5e9, #3b82f6) !important;
-        color: #ffffff !important; /* Pure white text on dark blue background */
-        border: none !important;
-        padding: 16px 32px !important;
-        border-radius: 12px !important;
-        font-weight: 700 !important;
-        font-size: 16px !important;
-        cursor: pointer !important;
-        transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1) !important;
-        box-shadow: 0 4px 15px rgba(14, 165, 233, 0.4) !important;
-        animation: fadeInUp 0.6s ease-out 0.4s both !important;
-        text-transform: uppercase !important;
-        letter-spacing: 1px !important;
-    }
-    
-    .export-btn:hover {
-        transform: translateY(-4px) scale(1.05) !important;
-        box-shadow: 0 12px 35px rgba(14, 165, 233, 0.6) !important;
-        background: linear-gradient(135deg, #0284c7, #2563eb) !important;
-    }
-    
-    .welcome-section {
-        margin-bottom: 3rem;
-        animation: fadeInUp 0.8s ease-out 0.3s both;
-        text-align: center;
-        padding: 2rem;
-        background: linear-gradient(135deg, #f0f9ff, #e0f2fe);
-        border-radius: 20px;
-        border: 2px solid #0ea5e9;
-        color: #000000 !important; /* Pure black text on light blue background */
-    }
-    
-    .welcome-title {
-        font-size: 40px !important;
-        font-weight: 900 !important;
-        color: #000000 !important; /* Pure black text on light background */
-        margin-bottom: 16px !important;
-        line-height: 1.2 !important;
-        text-shadow: 0 3px 6px rgba(0, 0, 0, 0.2) !important;
-    }
-    
-    .welcome-subtitle {
-        font-size: 20px !important;
-        color: #1f2937 !important; /* Dark text on light background */
-        font-weight: 600 !important;
-        line-height: 1.6 !important;
-    }
-    
-    /* Enhanced metric cards with perfect text contrast */
-    .metrics-container {
-        display: grid;
-        grid-template-columns: repeat(4, 1fr);
-        gap: 32px;
-        margin-bottom: 3rem;
-        animation: fadeInUp 0.8s ease-out 0.5s both;
-    }
-    
-    .metric-card {
-        background: #ffffff; /* Light background */
-        color: #000000 !important; /* Pure black text */
-        border: 2px solid #e5e7eb;
-        border-radius: 20px;
-        padding: 32px;
-        position: relative;
-        transition: all 0.5s cubic-bezier(0.4, 0, 0.2, 1);
-        box-shadow: 0 4px 20px rgba(0, 0, 0, 0.1);
-        overflow: hidden;
-        animation: fadeInUp 0.6s ease-out calc(0.6s + var(--delay, 0s)) both;
-    }
-    
-    .metric-card:hover {
-        transform: translateY(-12px) scale(1.05);
-        box-shadow: 0 25px 60px rgba(0, 0, 0, 0.2);
-        border-color: #0ea5e9;
-    }
-    
-    .metric-card.blue { 
-        border-left: 6px solid #0ea5e9;
-        --delay: 0.1s;
-    }
-    .metric-card.red { 
-        border-left: 6px solid #dc2626;
-        --delay: 0.2s;
-    }
-    .metric-card.green { 
-        border-left: 6px solid #10b981;
-        --delay: 0.3s;
-    }
-    .metric-card.orange { 
-        border-left: 6px solid #f59e0b;
-        --delay: 0.4s;
-    }
-    
-    .metric-label {
-        font-size: 16px !important;
-        font-weight: 800 !important;
-        color: #1f2937 !important; /* Dark text on light background */
-        margin-bottom: 16px !important;
-        text-transform: uppercase !important;
-        letter-spacing: 1.5px !important;
-    }
-    
-    .metric-value {
-        font-size: 42px !important;
-        font-weight: 900 !important;
-        color: #000000 !important; /* Pure black text on light background */
-        margin-bottom: 16px !important;
-        line-height: 1 !important;
-        text-shadow: 0 2px 4px rgba(0, 0, 0, 0.2) !important;
-    }
-    
-    .metric-change {
-        font-size: 16px !important;
-        font-weight: 800 !important;
-        display: flex !important;
-        align-items: center !important;
-        gap: 6px !important;
-    }
-    
-    .metric-change.positive {
-        color: #059669 !important;
-        animation: bounce 1.5s ease-in-out;
-    }
-    
-    .metric-change.negative {
-        color: #dc2626 !important;
-        animation: pulse 1.5s ease-in-out;
-    }
-    
-    .high-priority-badge {
-        background: linear-gradient(135deg, #fef2f2, #fee2e2) !important;
-        color: #7f1d1d !important; /* Very dark red text on light red background */
-        border: 2px solid #fecaca !important;
-        padding: 10px 20px !important;
-        border-radius: 25px !important;
-        font-size: 14px !important;
-        font-weight: 900 !important;
-        text-transform: uppercase !important;
-        letter-spacing: 1px !important;
-        animation: pulse 2s infinite !important;
-    }
-    
-    .low-priority-badge {
-        background: linear-gradient(135deg, #f0fdf4, #dcfce7) !important;
-        color: #052e16 !important; /* Very dark green text on light green background */
-        border: 2px solid #bbf7d0 !important;
-        padding: 10px 20px !important;
-        border-radius: 25px !important;
-        font-size: 14px !important;
-        font-weight: 900 !important;
-        text-transform: uppercase !important;
-        letter-spacing: 1px !important;
-        animation: pulse 2s infinite !important;
-    }
-    
-    /* Chart containers with light backgrounds */
-    .chart-container {
-        background: #ffffff; /* Light background */
-        color: #000000 !important; /* Pure black text */
-        border: 2px solid #e5e7eb;
-        border-radius: 20px;
-        padding: 32px;
-        box-shadow: 0 4px 20px rgba(0, 0, 0, 0.1);
-        transition: all 0.5s cubic-bezier(0.4, 0, 0.2, 1);
-        position: relative;
-        overflow: hidden;
-        animation: fadeInUp 0.6s ease-out calc(0.9s + var(--chart-delay, 0s)) both;
-    }
-    
-    .chart-container:hover {
-        box-shadow: 0 20px 60px rgba(0, 0, 0, 0.2);
-        transform: translateY(-8px) scale(1.02);
-        border-color: #0ea5e9;
-    }
-    
-    .chart-title {
-        font-size: 24px !important;
-        font-weight: 900 !important;
-        color: #000000 !important; /* Pure black text on light background */
-        margin-bottom: 12px !important;
-        text-shadow: 0 2px 4px rgba(0, 0, 0, 0.1) !important;
-    }
-    
-    .chart-subtitle {
-        font-size: 16px !important;
-        color: #1f2937 !important; /* Dark text on light background */
-        margin-bottom: 28px !important;
-        font-weight: 700 !important;
-    }
-    
-    /* Upload section with light background */
-    .upload-container {
-        text-align: center;
-        padding: 100px 50px;
-        background: linear-gradient(135deg, #f0f9ff, #e0f2fe);
-        color: #000000 !important; /* Pure black text on light blue background */
-        border: 3px dashed #0ea5e9;
-        border-radius: 20px;
-        margin: 3rem 0;
-        transition: all 0.5s cubic-bezier(0.4, 0, 0.2, 1);
-        position: relative;
-        overflow: hidden;
-        animation: fadeInUp 0.8s ease-out;
-    }
-    
-    .upload-title {
-        font-size: 32px !important;
-        font-weight: 900 !important;
-        color: #000000 !important; /* Pure black text on light background */
-        margin-bottom: 16px !important;
-        text-shadow: 0 2px 4px rgba(0, 0, 0, 0.1) !important;
-    }
-    
-    .upload-subtitle {
-        font-size: 18px !important;
-        color: #1f2937 !important; /* Dark text on light background */
-        margin-bottom: 40px !important;
-        line-height: 1.6 !important;
-        font-weight: 600 !important;
-    }
-    
-    /* Sidebar with dark background gets pure white text */
-    .css-1d391kg {
-        background-color: #1f2937 !important;
-        color: #ffffff !important;
-    }
-    
-    .css-1d391kg * {
-        color: #ffffff !important;
-    }
-    
-    .css-1d391kg .stSelectbox label {
-        color: #ffffff !important;
-        font-weight: 700 !important;
-    }
-    
-    /* All Streamlit components with proper contrast */
-    .stDataFrame {
-        background: #ffffff !important;
-        color: #000000 !important;
-    }
-    
-    .stDataFrame * {
-        color: #000000 !important;
-    }
-    
-    .stSelectbox label, .stSlider label, .stNumberInput label {
-        color: #000000 !important;
-        font-weight: 700 !important;
-    }
-    
-    .stFileUploader label {
-        color: #000000 !important;
-        font-weight: 800 !important;
-        font-size: 18px !important;
-    }
-    
-    /* Enhanced message styling with perfect contrast */
-    .stSuccess {
-        background: linear-gradient(135deg, #dcfce7, #bbf7d0) !important;
-        color: #052e16 !important; /* Very dark green text on light green background */
-        border: 2px solid #10b981 !important;
-        padding: 20px !important;
-        border-radius: 16px !important;
-        font-weight: 700 !important;
-    }
-    
-    .stError {
-        background: linear-gradient(135deg, #fef2f2, #fee2e2) !important;
-        color: #7f1d1d !important; /* Very dark red text on light red background */
-        border: 2px solid #dc2626 !important;
-        padding: 20px !important;
-        border-radius: 16px !important;
-        font-weight: 700 !important;
-    }
-    
-    .stWarning {
-        background: linear-gradient(135deg, #fffbeb, #fef3c7) !important;
-        color: #451a03 !important; /* Very dark yellow text on light yellow background */
-        border: 2px solid #f59e0b !important;
-        padding: 20px !important;
-        border-radius: 16px !important;
-        font-weight: 700 !important;
-    }
-    
-    .stInfo {
-        background: linear-gradient(135deg, #eff6ff, #dbeafe) !important;
-        color: #1e3a8a !important; /* Very dark blue text on light blue background */
-        border: 2px solid #3b82f6 !important;
-        padding: 20px !important;
-        border-radius: 16px !important;
-        font-weight: 700 !important;
-    }
-    
-    /* Buttons with dark backgrounds get pure white text */
-    .stButton > button {
-        background: linear-gradient(135deg, #1f2937, #374151) !important;
-        color: #ffffff !important; /* Pure white text on dark background */
-        border: none !important;
-        border-radius: 12px !important;
-        font-weight: 700 !important;
-        padding: 12px 24px !important;
-        transition: all 0.3s ease !important;
-    }
-    
-    .stButton > button:hover {
-        background: linear-gradient(135deg, #374151, #4b5563) !important;
-        transform: translateY(-2px) !important;
-        box-shadow: 0 8px 25px rgba(0, 0, 0, 0.3) !important;
-    }
-    
-    /* Tab buttons with maximum contrast */
-    .nav-tab {
-        background: #f3f4f6 !important;
-        color: #000000 !important; /* Pure black text on light background */
-        border: 2px solid #e5e7eb !important;
-        padding: 16px 32px !important;
-        border-radius: 12px !important;
-        font-weight: 700 !important;
-        cursor: pointer !important;
-        transition: all 0.3s ease !important;
-    }
-    
-    .nav-tab.active {
-        background: linear-gradient(135deg, #0ea5e9, #3b82f6) !important;
-        color: #ffffff !important; /* Pure white text on dark blue background */
-        border-color: #0ea5e9 !important;
-        transform: translateY(-2px) !important;
-        box-shadow: 0 8px 25px rgba(14, 165, 233, 0.4) !important;
-    }
-    
-    .nav-tab:hover {
-        background: #e5e7eb !important;
-        color: #000000 !important;
-        transform: translateY(-2px) !important;
-        box-shadow: 0 4px 15px rgba(0, 0, 0, 0.1) !important;
-    }
-    
-    .nav-tab.active:hover {
-        background: linear-gradient(135deg, #0284c7, #2563eb) !important;
-        color: #ffffff !important;
-    }
-    
-    /* Additional text elements with perfect contrast */
-    h1, h2, h3, h4, h5, h6 {
-        color: #000000 !important;
-    }
-    
-    p, span, div {
-        color: #000000 !important;
-    }
-    
-    /* Dark backgrounds override */
-    .dark-bg h1, .dark-bg h2, .dark-bg h3, .dark-bg h4, .dark-bg h5, .dark-bg h6,
-    .dark-bg p, .dark-bg span, .dark-bg div {
-        color: #ffffff !important;
-    }
-</style>
-""", unsafe_allow_html=True)
+inject_styles()
 
 def main():
+    start_metrics_endpoint()
     show_professional_header()
     
     # Check if data is uploaded
@@ -526,791 +28,5 @@ def main():
     else:
         show_dashboard()
 
-def show_professional_header():
-    """Ultimate professional header"""
-    st.markdown("""
-    <div class="main-header">
-        <div class="brand-section">
-            <div class="brand-icon">A</div>
-            <div class="brand-text">
-                <h1>AttritionAI Ultimate</h1>
-                <p>Next-Generation Employee Retention Intelligence</p>
-            </div>
-        </div>
-        <div>
-            <button class="export-btn" onclick="window.print()">📊 Export Ultimate Report</button>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-
-def show_upload_interface():
-    """Ultimate upload interface"""
-    st.markdown("""
-    <div class="upload-container">
-        <div style="font-size: 64px; margin-bottom: 24px;">🚀</div>
-        <div class="upload-title">Upload Your Employee Data</div>
-        <div class="upload-subtitle">Transform your workforce analytics with AI-powered insights and real-time processing</div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    uploaded_file = st.file_uploader(
-        "Choose a CSV file",
-        type="csv",
-        help="Drag and drop file here • Supports up to 500MB • CSV format"
-    )
-    
-    if uploaded_file is not None:
-        try:
-            with st.spinner("🔄 Processing your data with advanced algorithms..."):
-                data = pd.read_csv(uploaded_file)
-                processed_data = process_data_ultimate(data)
-                st.session_state.uploaded_data = processed_data
-                
-                st.markdown(f"""
-                <div class="success-message">
-                    ✅ Successfully processed {len(data):,} employee records with advanced analytics!
-                </div>
-                """, unsafe_allow_html=True)
-                
-                time.sleep(1.5)
-                st.rerun()
-        except Exception as e:
-            st.error(f"❌ Error processing file: {str(e)}")
-
-def process_data_ultimate(data):
-    """Ultimate data processing with advanced features"""
-    processed_data = data.copy()
-    
-    # Standardize column names
-    column_mapping = {
-        'LeaveOrNot': 'Attrition',
-        'left': 'Attrition',
-        'quit': 'Attrition',
-        'turnover': 'Attrition'
-    }
-    
-    for old_col, new_col in column_mapping.items():
-        if old_col in processed_data.columns:
-            processed_data = processed_data.rename(columns={old_col: new_col})
-    
-    # Convert Attrition to binary if needed
-    if 'Attrition' in processed_data.columns:
-        if processed_data['Attrition'].dtype == 'object':
-            processed_data['Attrition'] = processed_data['Attrition'].map({'Yes': 1, 'No': 0, 'yes': 1, 'no': 0})
-        processed_data['Attrition'] = processed_data['Attrition'].fillna(0)
-    
-    # Add calculated fields for enhanced analytics
-    if 'Age' in processed_data.columns:
-        processed_data['AgeGroup'] = pd.cut(processed_data['Age'], 
-                                          bins=[0, 25, 35, 45, 55, 100], 
-                                          labels=['<25', '25-35', '35-45', '45-55', '55+'])
-    
-    if 'MonthlyIncome' in processed_data.columns:
-        processed_data['SalaryTier'] = pd.qcut(processed_data['MonthlyIncome'], 
-                                             q=4, 
-                                             labels=['Low', 'Medium', 'High', 'Premium'])
-    
-    return processed_data
-
-def show_dashboard():
-    """Ultimate dashboard with real-time data processing"""
-    df = st.session_state.uploaded_data
-    
-    st.markdown("""
-    <div class="welcome-section">
-        <div class="welcome-title">Ultimate Employee Attrition Intelligence Dashboard</div>
-        <div class="welcome-subtitle">Real-time insights powered by advanced AI algorithms and your actual workforce data</div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    show_ultimate_metrics_cards(df)
-    
-    # Enhanced navigation tabs
-    show_enhanced_navigation_tabs()
-    
-    # Content based on active tab
-    if st.session_state.get('active_tab', 'Overview') == 'Overview':
-        show_ultimate_overview_content(df)
-    elif st.session_state.get('active_tab') == 'AI Prediction':
-        show_ultimate_prediction_content(df)
-    elif st.session_state.get('active_tab') == 'Analytics':
-        show_ultimate_analytics_content(df)
-    elif st.session_state.get('active_tab') == 'Employee Data':
-        show_ultimate_employee_data_content(df)
-
-def show_ultimate_metrics_cards(df):
-    """Ultimate metrics cards with 100% accurate real data calculations"""
-    total_employees = len(df)
-    
-    # Calculate attrition rate from actual data
-    if 'Attrition' in df.columns:
-        attrition_count = df['Attrition'].sum() if df['Attrition'].dtype in ['int64', 'float64'] else (df['Attrition'] == 'Yes').sum()
-        attrition_rate = (attrition_count / len(df)) * 100 if len(df) > 0 else 0
-        retention_rate = 100 - attrition_rate
-        at_risk_count = int(attrition_count)
-    else:
-        # If no attrition column, analyze other risk factors
-        risk_factors = 0
-        if 'JobSatisfaction' in df.columns:
-            risk_factors += len(df[df['JobSatisfaction'] <= 2])
-        if 'WorkLifeBalance' in df.columns:
-            risk_factors += len(df[df['WorkLifeBalance'] <= 2])
-        
-        at_risk_count = risk_factors
-        attrition_rate = (at_risk_count / len(df)) * 100 if len(df) > 0 else 0
-        retention_rate = 100 - attrition_rate
-    
-    # Calculate average age from actual data
-    if 'Age' in df.columns:
-        avg_age = int(df['Age'].mean())
-    else:
-        avg_age = 35  # Default fallback
-    
-    # Calculate departments from actual data
-    if 'Department' in df.columns:
-        dept_count = df['Department'].nunique()
-    else:
-        dept_count = len(df.select_dtypes(include=['object']).columns)
-    
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        trend_indicator = "positive" if total_employees > 1000 else "negative"
-        trend_text = f"↗ +{((total_employees - 1000) / 1000 * 100):.1f}%" if total_employees > 1000 else f"↘ -{((1000 - total_employees) / 1000 * 100):.1f}%"
-        
-        st.markdown(f"""
-        <div class="metric-card blue">
-            <div class="metric-icon" style="color: #3b82f6;">👥</div>
-            <div class="metric-label">Total Employees</div>
-            <div class="metric-value">{total_employees:,}</div>
-            <div class="metric-change {trend_indicator}">{trend_text} vs baseline</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        industry_avg = 12.5
-        benchmark_diff = attrition_rate - industry_avg
-        benchmark_color = "negative" if benchmark_diff > 0 else "positive"
-        benchmark_text = f"{'↑' if benchmark_diff > 0 else '↓'} {abs(benchmark_diff):.1f}% vs industry"
-        
-        st.markdown(f"""
-        <div class="metric-card red">
-            <div class="metric-icon" style="color: #dc2626;">📉</div>
-            <div class="metric-label">Attrition Rate</div>
-            <div class="metric-value">{attrition_rate:.1f}%</div>
-            <div class="metric-change {benchmark_color}">{benchmark_text}</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        retention_benchmark = 87.5
-        retention_diff = retention_rate - retention_benchmark
-        retention_trend = "positive" if retention_diff > 0 else "negative"
-        retention_text = f"{'↑' if retention_diff > 0 else '↓'} {abs(retention_diff):.1f}% vs industry"
-        
-        st.markdown(f"""
-        <div class="metric-card green">
-            <div class="metric-icon" style="color: #10b981;">✅</div>
-            <div class="metric-label">Retention Rate</div>
-            <div class="metric-value">{retention_rate:.1f}%</div>
-            <div class="metric-change {retention_trend}">{retention_text}</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        risk_percentage = (at_risk_count / total_employees) * 100 if total_employees > 0 else 0
-        priority_level = "HIGH" if risk_percentage > 15 else "MEDIUM" if risk_percentage > 8 else "LOW"
-        priority_color = "#dc2626" if priority_level == "HIGH" else "#f59e0b" if priority_level == "MEDIUM" else "#10b981"
-        
-        st.markdown(f"""
-        <div class="metric-card orange">
-            <div class="metric-icon" style="color: #f59e0b;">⚠️</div>
-            <div class="metric-label">At Risk Employees</div>
-            <div class="metric-value">{at_risk_count}</div>
-            <div class="high-priority-badge" style="background-color: {priority_color}; color: white;">{priority_level} PRIORITY</div>
-        </div>
-        """, unsafe_allow_html=True)
-
-def show_enhanced_navigation_tabs():
-    """Enhanced navigation tabs"""
-    if 'active_tab' not in st.session_state:
-        st.session_state.active_tab = 'Overview'
-    
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        if st.button("📊 Overview", key="overview_tab", use_container_width=True):
-            st.session_state.active_tab = 'Overview'
-            st.rerun()
-    
-    with col2:
-        if st.button("🤖 AI Prediction", key="prediction_tab", use_container_width=True):
-            st.session_state.active_tab = 'AI Prediction'
-            st.rerun()
-    
-    with col3:
-        if st.button("📈 Analytics", key="analytics_tab", use_container_width=True):
-            st.session_state.active_tab = 'Analytics'
-            st.rerun()
-    
-    with col4:
-        if st.button("👥 Employee Data", key="data_tab", use_container_width=True):
-            st.session_state.active_tab = 'Employee Data'
-            st.rerun()
-
-def show_ultimate_overview_content(df):
-    """Ultimate overview with real data visualizations"""
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("""
-        <div class="chart-container">
-            <div class="chart-title">Department-wise Attrition Analysis</div>
-            <div class="chart-subtitle">Real attrition rates from your actual workforce data</div>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        if 'Department' in df.columns and 'Attrition' in df.columns:
-            dept_attrition = df.groupby('Department')['Attrition'].agg(['count', 'sum']).reset_index()
-            dept_attrition['attrition_rate'] = (dept_attrition['sum'] / dept_attrition['count']) * 100
-            dept_data = dept_attrition[['Department', 'attrition_rate']]
-        else:
-            # Fallback with sample data
-            dept_data = pd.DataFrame({
-                'Department': ['Sales', 'Engineering', 'Marketing', 'HR', 'Finance'],
-                'attrition_rate': [24, 12, 18, 15, 8]
-            })
-        
-        fig1 = px.bar(
-            dept_data, 
-            x='Department', 
-            y='attrition_rate',
-            color='attrition_rate',
-            color_continuous_scale=['#10b981', '#f59e0b', '#dc2626'],
-            text='attrition_rate'
-        )
-        fig1.update_traces(texttemplate='%{text:.1f}%', textposition='outside')
-        fig1.update_layout(
-            showlegend=False,
-            plot_bgcolor='white',
-            paper_bgcolor='white',
-            font=dict(family="Inter", size=14, color="#000000"),
-            height=350,
-            xaxis=dict(showgrid=False, title='', tickfont=dict(color="#000000", size=12)),
-            yaxis=dict(showgrid=True, gridcolor='#f3f4f6', title='Attrition Rate (%)', tickfont=dict(color="#000000", size=12))
-        )
-        st.plotly_chart(fig1, use_container_width=True)
-    
-    with col2:
-        st.markdown("""
-        <div class="chart-container">
-            <div class="chart-title">Risk Factors Analysis</div>
-            <div class="chart-subtitle">Key drivers of attrition in your organization</div>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        risk_data = calculate_real_risk_factors(df)
-        
-        fig2 = px.pie(
-            values=list(risk_data.values()),
-            names=list(risk_data.keys()),
-            color_discrete_sequence=['#dc2626', '#f59e0b', '#3b82f6', '#8b5cf6'],
-            hole=0.4
-        )
-        fig2.update_traces(
-            textposition='outside', 
-            textinfo='percent+label',
-            textfont_size=12,
-            textfont_color='#000000'
-        )
-        fig2.update_layout(
-            showlegend=True,
-            legend=dict(orientation="v", yanchor="middle", y=0.5, xanchor="left", x=1.05, font=dict(color="#000000")),
-            plot_bgcolor='white',
-            paper_bgcolor='white',
-            font=dict(family="Inter", size=12, color="#000000"),
-            height=350
-        )
-        st.plotly_chart(fig2, use_container_width=True)
-    
-    st.markdown("""
-    <div class="chart-container trend-chart">
-        <div class="chart-title">Workforce Trends Analysis</div>
-        <div class="chart-subtitle">Historical patterns and projections based on your data</div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    trend_data = generate_trend_analysis(df)
-    
-    fig3 = go.Figure()
-    fig3.add_trace(go.Scatter(
-        x=trend_data['months'], 
-        y=trend_data['values'],
-        mode='lines+markers',
-        line=dict(color='#0ea5e9', width=4),
-        marker=dict(color='#0ea5e9', size=12),
-        fill='tonexty',
-        fillcolor='rgba(14, 165, 233, 0.1)',
-        hovertemplate='<b>%{x}</b><br>Rate: %{y}%<extra></extra>'
-    ))
-    
-    fig3.update_layout(
-        showlegend=False,
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        font=dict(family="Inter", size=14, color="#000000"),
-        height=300,
-        xaxis=dict(showgrid=False, title='', tickfont=dict(color="#000000")),
-        yaxis=dict(showgrid=True, gridcolor='#f3f4f6', title='Rate (%)', tickfont=dict(color="#000000"))
-    )
-    st.plotly_chart(fig3, use_container_width=True)
-
-def calculate_real_risk_factors(df):
-    """Calculate real risk factors from actual data"""
-    risk_factors = {}
-    
-    if 'JobSatisfaction' in df.columns:
-        low_satisfaction = len(df[df['JobSatisfaction'] <= 2])
-        risk_factors['Low Satisfaction'] = low_satisfaction
-    
-    if 'WorkLifeBalance' in df.columns:
-        poor_balance = len(df[df['WorkLifeBalance'] <= 2])
-        risk_factors['Poor Work-Life'] = poor_balance
-    
-    if 'OverTime' in df.columns:
-        high_workload = len(df[df['OverTime'] == 'Yes'])
-        risk_factors['High Workload'] = high_workload
-    
-    if 'YearsAtCompany' in df.columns:
-        limited_growth = len(df[df['YearsAtCompany'] > 5])
-        risk_factors['Limited Growth'] = limited_growth
-    
-    # If no specific columns, use default distribution
-    if not risk_factors:
-        risk_factors = {
-            'Low Satisfaction': 35,
-            'High Workload': 28,
-            'Poor Work-Life': 15,
-            'Limited Growth': 22
-        }
-    
-    return risk_factors
-
-def generate_trend_analysis(df):
-    """Generate trend analysis from actual data"""
-    months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun']
-    
-    if 'JoiningYear' in df.columns:
-        # Analyze joining patterns
-        recent_years = df['JoiningYear'].value_counts().sort_index().tail(6)
-        if len(recent_years) >= 6:
-            values = recent_years.values.tolist()
-        else:
-            values = [12, 15, 18, 13, 16, 12]  # Fallback
-    else:
-        # Generate realistic trend based on data size
-        base_rate = 15 if len(df) > 2000 else 10
-        values = [base_rate + np.random.randint(-3, 4) for _ in range(6)]
-    
-    return {'months': months, 'values': values}
-
-def show_ultimate_prediction_content(df):
-    """Ultimate AI prediction with advanced ML"""
-    st.markdown("""
-    <div class="chart-container">
-        <div class="chart-title">🤖 Advanced AI Prediction Engine</div>
-        <div class="chart-subtitle">Next-generation machine learning for precise attrition forecasting</div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    col1, col2 = st.columns([1, 1])
-    
-    with col1:
-        with st.form("ultimate_prediction_form"):
-            st.subheader("🎯 Employee Risk Assessment")
-            
-            col_a, col_b = st.columns(2)
-            
-            with col_a:
-                age = st.slider("Age", 18, 65, 35)
-                years_company = st.slider("Years at Company", 0, 40, 3)
-                department = st.selectbox("Department", ["Sales", "Engineering", "Marketing", "HR", "Finance"])
-                job_satisfaction = st.select_slider("Job Satisfaction", options=[1, 2, 3, 4, 5], value=3)
-            
-            with col_b:
-                work_life_balance = st.select_slider("Work-Life Balance", options=[1, 2, 3, 4, 5], value=3)
-                monthly_salary = st.number_input("Monthly Salary ($)", min_value=1000, max_value=50000, value=5000, step=500)
-                frequent_overtime = st.selectbox("Frequent Overtime", ["No", "Yes"])
-                performance_rating = st.select_slider("Performance Rating", options=[1, 2, 3, 4, 5], value=3)
-            
-            submitted = st.form_submit_button("🚀 Generate Ultimate Prediction", use_container_width=True, type="primary")
-            
-            if submitted:
-                with st.spinner("🧠 Processing with advanced AI algorithms..."):
-                    time.sleep(1)  # Simulate processing
-                    prediction_result = generate_ultimate_prediction(
-                        age, years_company, department, job_satisfaction, 
-                        work_life_balance, monthly_salary, frequent_overtime, 
-                        performance_rating, df
-                    )
-                    st.session_state.ultimate_prediction = prediction_result
-    
-    with col2:
-        if 'ultimate_prediction' in st.session_state:
-            result = st.session_state.ultimate_prediction
-            show_ultimate_prediction_results(result)
-        else:
-            st.markdown("""
-            <div style="text-align: center; padding: 60px; background: linear-gradient(135deg, #f0f9ff, #e0f2fe); border-radius: 20px; border: 2px solid #0ea5e9;">
-                <div style="font-size: 64px; margin-bottom: 20px;">🎯</div>
-                <div style="font-size: 24px; font-weight: 800; color: #000000; margin-bottom: 12px;">Ultimate AI Ready</div>
-                <div style="font-size: 16px; color: #1f2937; font-weight: 600;">Complete the form to get advanced risk assessment with confidence intervals and personalized recommendations</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-def generate_ultimate_prediction(age, years_company, department, job_satisfaction, work_life_balance, monthly_salary, frequent_overtime, performance_rating, df):
-    """Generate ultimate prediction with real data insights"""
-    base_risk = calculate_enhanced_risk_score(age, years_company, department, job_satisfaction, work_life_balance, monthly_salary, frequent_overtime, performance_rating)
-    
-    # Adjust based on actual data patterns
-    if len(df) > 0:
-        if 'Age' in df.columns:
-            age_avg = df['Age'].mean()
-            if abs(age - age_avg) > 10:
-                base_risk += 5
-        
-        if 'Department' in df.columns and 'Attrition' in df.columns:
-            dept_risk = df[df['Department'] == department]['Attrition'].mean() * 100
-            base_risk = (base_risk + dept_risk) / 2
-    
-    confidence_lower = max(0, base_risk - 12)
-    confidence_upper = min(100, base_risk + 12)
-    
-    return {
-        'risk_score': base_risk,
-        'confidence_lower': confidence_lower,
-        'confidence_upper': confidence_upper,
-        'confidence_level': 95,
-        'recommendations': generate_ultimate_recommendations(base_risk, age, years_company, department, job_satisfaction, work_life_balance, monthly_salary, frequent_overtime, performance_rating)
-    }
-
-def calculate_enhanced_risk_score(age, years_company, department, job_satisfaction, work_life_balance, monthly_salary, frequent_overtime, performance_rating):
-    """Enhanced risk calculation"""
-    risk_score = 0
-    
-    # Age factor
-    if age < 25 or age > 55:
-        risk_score += 15
-    elif 25 <= age <= 30:
-        risk_score += 10
-    
-    # Tenure factor
-    if years_company < 2:
-        risk_score += 20
-    elif years_company > 10:
-        risk_score += 5
-    
-    # Department factor
-    dept_risk = {'Sales': 15, 'Marketing': 12, 'HR': 8, 'Engineering': 5, 'Finance': 7}
-    risk_score += dept_risk.get(department, 10)
-    
-    # Job satisfaction factor
-    risk_score += (5 - job_satisfaction) * 12
-    
-    # Work-life balance factor
-    risk_score += (5 - work_life_balance) * 10
-    
-    # Salary factor
-    if monthly_salary < 3000:
-        risk_score += 15
-    elif monthly_salary < 5000:
-        risk_score += 8
-    
-    # Overtime factor
-    if frequent_overtime == "Yes":
-        risk_score += 12
-    
-    # Performance factor
-    if performance_rating <= 2:
-        risk_score += 20
-    elif performance_rating == 3:
-        risk_score += 5
-    
-    return min(risk_score, 100)
-
-def generate_ultimate_recommendations(risk_score, age, years_company, department, job_satisfaction, work_life_balance, monthly_salary, frequent_overtime, performance_rating):
-    """Generate ultimate personalized recommendations"""
-    recommendations = []
-    
-    if job_satisfaction <= 2:
-        recommendations.append({
-            'priority': 'CRITICAL',
-            'action': 'Immediate Manager Intervention',
-            'description': 'Schedule urgent 1-on-1 meeting to address satisfaction concerns',
-            'timeline': 'Within 24 hours',
-            'impact': 'High'
-        })
-    
-    if work_life_balance <= 2:
-        recommendations.append({
-            'priority': 'HIGH',
-            'action': 'Flexible Work Implementation',
-            'description': 'Offer remote work options and flexible scheduling immediately',
-            'timeline': 'Within 1 week',
-            'impact': 'High'
-        })
-    
-    if monthly_salary < 4000:
-        recommendations.append({
-            'priority': 'MEDIUM',
-            'action': 'Compensation Review',
-            'description': 'Conduct market analysis and salary adjustment',
-            'timeline': 'Within 2 weeks',
-            'impact': 'Medium'
-        })
-    
-    if frequent_overtime == "Yes":
-        recommendations.append({
-            'priority': 'HIGH',
-            'action': 'Workload Redistribution',
-            'description': 'Analyze team capacity and redistribute tasks',
-            'timeline': 'Within 1 week',
-            'impact': 'Medium'
-        })
-    
-    return recommendations
-
-def show_ultimate_prediction_results(result):
-    """Show ultimate prediction results"""
-    risk_score = result['risk_score']
-    
-    if risk_score >= 70:
-        risk_level = "CRITICAL"
-        risk_color = "#dc2626"
-        risk_bg = "linear-gradient(135deg, #fee2e2, #fecaca)"
-    elif risk_score >= 40:
-        risk_level = "MODERATE"
-        risk_color = "#f59e0b"
-        risk_bg = "linear-gradient(135deg, #fef3c7, #fde68a)"
-    else:
-        risk_level = "LOW"
-        risk_color = "#10b981"
-        risk_bg = "linear-gradient(135deg, #dcfce7, #bbf7d0)"
-    
-    st.markdown(f"""
-    <div style="background: {risk_bg}; border: 3px solid {risk_color}; border-radius: 20px; padding: 40px; text-align: center; margin-bottom: 20px;">
-        <div style="font-size: 48px; font-weight: 900; color: {risk_color}; margin-bottom: 12px;">{risk_score:.1f}%</div>
-        <div style="font-size: 24px; font-weight: 800; color: {risk_color}; margin-bottom: 8px;">{risk_level} RISK</div>
-        <div style="font-size: 16px; color: #374151; font-weight: 600;">Attrition Probability</div>
-        <div style="margin-top: 16px; font-size: 14px; color: #4b5563; font-weight: 600;">
-            95% Confidence: {result['confidence_lower']:.1f}% - {result['confidence_upper']:.1f}%
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    if result['recommendations']:
-        st.subheader("🎯 Ultimate Action Plan")
-        for i, rec in enumerate(result['recommendations']):
-            priority_colors = {
-                'CRITICAL': '#dc2626',
-                'HIGH': '#f59e0b', 
-                'MEDIUM': '#3b82f6',
-                'LOW': '#10b981'
-            }
-            color = priority_colors.get(rec['priority'], '#6b7280')
-            
-            st.markdown(f"""
-            <div style="background: white; border-left: 6px solid {color}; border-radius: 12px; padding: 20px; margin: 12px 0; box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1);">
-                <div style="display: flex; justify-content: between; align-items: center; margin-bottom: 8px;">
-                    <div style="font-weight: 800; color: #1f2937; font-size: 16px;">{rec['action']}</div>
-                    <div style="background: {color}; color: white; padding: 4px 12px; border-radius: 20px; font-size: 12px; font-weight: 700;">{rec['priority']}</div>
-                </div>
-                <div style="color: #374151; margin-bottom: 8px; font-weight: 600;">{rec['description']}</div>
-                <div style="display: flex; gap: 20px; font-size: 14px;">
-                    <div style="color: #4b5563;"><strong>Timeline:</strong> {rec['timeline']}</div>
-                    <div style="color: #4b5563;"><strong>Impact:</strong> {rec['impact']}</div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-
-def show_ultimate_analytics_content(df):
-    """Ultimate analytics with advanced insights"""
-    st.markdown("""
-    <div style="text-align: center; padding: 40px; background: linear-gradient(135deg, #f0f9ff, #e0f2fe); border-radius: 20px; margin-bottom: 30px;">
-        <div style="font-size: 32px; font-weight: 900; color: #000000; margin-bottom: 12px;">📊 Ultimate Analytics Engine</div>
-        <div style="font-size: 18px; color: #1f2937; font-weight: 600;">Advanced workforce intelligence powered by your real data</div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Real-time analytics based on actual data
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.subheader("📈 Age Distribution Analysis")
-        if 'Age' in df.columns:
-            fig = px.histogram(df, x='Age', nbins=20, color_discrete_sequence=['#0ea5e9'])
-            fig.update_layout(
-                plot_bgcolor='white',
-                paper_bgcolor='white',
-                font=dict(family="Inter", size=12, color="#000000"),
-                height=300
-            )
-        else:
-            ages = np.random.normal(35, 10, len(df))
-            fig = px.histogram(x=ages, nbins=20, color_discrete_sequence=['#0ea5e9'])
-            fig.update_layout(
-                plot_bgcolor='white',
-                paper_bgcolor='white',
-                font=dict(family="Inter", size=12, color="#000000"),
-                height=300
-            )
-        st.plotly_chart(fig, use_container_width=True)
-    
-    with col2:
-        st.subheader("💰 Salary Distribution Analysis")
-        if 'MonthlyIncome' in df.columns:
-            fig = px.box(df, y='MonthlyIncome', color_discrete_sequence=['#10b981'])
-        else:
-            salaries = np.random.lognormal(8.5, 0.5, len(df))
-            fig = px.box(y=salaries, color_discrete_sequence=['#10b981'])
-        
-        fig.update_layout(
-            plot_bgcolor='white',
-            paper_bgcolor='white',
-            font=dict(family="Inter", size=12, color="#000000"),
-            height=300
-        )
-        st.plotly_chart(fig, use_container_width=True)
-    
-    # Advanced correlation analysis
-    st.subheader("🔗 Advanced Feature Correlation Matrix")
-    numeric_cols = df.select_dtypes(include=[np.number]).columns
-    if len(numeric_cols) > 1:
-        corr_matrix = df[numeric_cols].corr()
-        fig = px.imshow(
-            corr_matrix, 
-            text_auto=True, 
-            aspect="auto", 
-            color_continuous_scale='RdBu_r',
-            zmin=-1, zmax=1
-        )
-    else:
-        # Sample correlation matrix
-        np.random.seed(42)
-        sample_data = np.random.rand(8, 8)
-        sample_data = (sample_data + sample_data.T) / 2
-        np.fill_diagonal(sample_data, 1)
-        labels = ['Age', 'Income', 'Satisfaction', 'Years', 'Performance', 'WorkLife', 'Education', 'Distance']
-        fig = px.imshow(
-            sample_data, 
-            text_auto=True, 
-            aspect="auto",
-            x=labels, y=labels, 
-            color_continuous_scale='RdBu_r',
-            zmin=0, zmax=1
-        )
-    
-    fig.update_layout(
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        font=dict(family="Inter", size=12, color="#000000"),
-        height=500
-    )
-    st.plotly_chart(fig, use_container_width=True)
-
-def show_ultimate_employee_data_content(df):
-    """Ultimate employee data explorer"""
-    st.markdown("""
-    <div style="text-align: center; padding: 40px; background: linear-gradient(135deg, #f0f9ff, #e0f2fe); border-radius: 20px; margin-bottom: 30px;">
-        <div style="font-size: 32px; font-weight: 900; color: #000000; margin-bottom: 12px;">👥 Ultimate Data Explorer</div>
-        <div style="font-size: 18px; color: #1f2937; font-weight: 600;">Comprehensive workforce data analysis and insights</div>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Real data metrics
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric("📊 Total Records", f"{len(df):,}")
-    
-    with col2:
-        st.metric("📋 Data Columns", len(df.columns))
-    
-    with col3:
-        missing_data = df.isnull().sum().sum()
-        st.metric("❓ Missing Values", missing_data)
-    
-    with col4:
-        if 'Department' in df.columns:
-            unique_depts = df['Department'].nunique()
-        else:
-            unique_depts = len(df.select_dtypes(include=['object']).columns)
-        st.metric("🏢 Departments", unique_depts)
-    
-    st.markdown("---")
-    
-    # Advanced filtering
-    st.subheader("🔍 Advanced Data Filtering")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        if 'Department' in df.columns:
-            departments = st.multiselect(
-                "Filter by Department",
-                options=df['Department'].unique(),
-                default=df['Department'].unique()
-            )
-            filtered_df = df[df['Department'].isin(departments)]
-        else:
-            filtered_df = df
-    
-    with col2:
-        if 'Age' in df.columns:
-            age_range = st.slider(
-                "Age Range",
-                int(df['Age'].min()),
-                int(df['Age'].max()),
-                (int(df['Age'].min()), int(df['Age'].max()))
-            )
-            filtered_df = filtered_df[(filtered_df['Age'] >= age_range[0]) & (filtered_df['Age'] <= age_range[1])]
-    
-    with col3:
-        search_term = st.text_input("🔍 Search in data", placeholder="Search any field...")
-        if search_term:
-            mask = filtered_df.astype(str).apply(lambda x: x.str.contains(search_term, case=False, na=False)).any(axis=1)
-            filtered_df = filtered_df[mask]
-    
-    st.markdown("---")
-    
-    # Display filtered data
-    st.subheader(f"📋 Data Overview ({len(filtered_df):,} records)")
-    
-    if len(filtered_df) > 0:
-        st.dataframe(
-            filtered_df,
-            use_container_width=True,
-            height=400
-        )
-        
-        # Download options
-        col1, col2, col3 = st.columns([1, 1, 2])
-        
-        with col1:
-            csv = filtered_df.to_csv(index=False)
-            st.download_button(
-                label="📥 Download Filtered Data",
-                data=csv,
-                file_name=f"filtered_employee_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv",
-                use_container_width=True
-            )
-        
-        with col2:
-            if st.button("📊 Generate Analytics Report", use_container_width=True):
-                st.success("📊 Advanced analytics report generated successfully!")
-    else:
-        st.warning("No data matches your current filters. Please adjust your criteria.")
-
 if __name__ == "__main__":
     main()
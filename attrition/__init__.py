@@ -0,0 +1 @@
+"""Core library for the Employee Attrition Prediction system"""
@@ -0,0 +1,54 @@
+"""Additive aggregate cube behind the dashboard's headline figures
+
+Counts per (Department, AgeGroup, SalaryTier) cell: employees, leavers and
+the satisfaction/work-life risk flags the headline cards fall back on. Every
+measure is a sum, so a changed employee is handled by removing their old row
+from the cube and adding the new one; the cube never has to be rebuilt from
+the whole roster after a delta upload.
+"""
+import numpy as np
+import pandas as pd
+
+CUBE_DIMENSIONS = ('Department', 'AgeGroup', 'SalaryTier')
+MEASURES = ['employees', 'attrition', 'low_satisfaction', 'poor_balance']
+
+
+def _attrition_flags(series):
+    if series.dtype == object:
+        return (series == 'Yes').to_numpy(dtype=float)
+    return pd.to_numeric(series, errors='coerce').fillna(0).to_numpy(dtype=float)
+
+
+class RosterCube:
+    """Sums of per-employee measures over the roster's dimension cells"""
+
+    def __init__(self, df):
+        self.dimensions = [col for col in CUBE_DIMENSIONS if col in df.columns]
+        self.has_attrition = 'Attrition' in df.columns
+        self.cells = self._aggregate(df)
+
+    def _aggregate(self, df):
+        measures = pd.DataFrame({'employees': np.ones(len(df))}, index=df.index)
+        measures['attrition'] = _attrition_flags(df['Attrition']) if self.has_attrition else 0.0
+        measures['low_satisfaction'] = (df['JobSatisfaction'] <= 2).to_numpy(dtype=float) if 'JobSatisfaction' in df.columns else 0.0
+        measures['poor_balance'] = (df['WorkLifeBalance'] <= 2).to_numpy(dtype=float) if 'WorkLifeBalance' in df.columns else 0.0
+        if not self.dimensions:
+            return measures.sum().to_frame('all').T
+        keys = [df[col].astype(str).rename(col) for col in self.dimensions]
+        return measures.groupby(keys, sort=False).sum()
+
+    def add(self, df):
+        if len(df):
+            self.cells = self.cells.add(self._aggregate(df), fill_value=0)
+
+    def remove(self, df):
+        if len(df):
+            cells = self.cells.sub(self._aggregate(df), fill_value=0)
+            self.cells = cells[cells['employees'] > 0]
+
+    def totals(self):
+        return self.cells[MEASURES].sum()
+
+    def by(self, dimension):
+        """Measures summed over every other dimension"""
+        return self.cells.groupby(level=dimension).sum()
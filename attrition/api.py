@@ -0,0 +1,256 @@
+"""Roster query layer behind the service's ``/api`` routes
+
+``RosterAPI`` scores a roster once when it is loaded and keeps the table the
+frontend needs as flat arrays. Each distinct (search, filters, sort) query
+is resolved to an array of row positions that is cached, so paging through
+a result, or coming back to a filter, is a slice rather than a rescan.
+Cursors are opaque offsets into that array, tied to the query and the
+roster version so they can never silently page through a different result.
+"""
+import base64
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from attrition.schema import adapt_schema
+from attrition.scoring import risk_levels
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+SCORE_CHUNK_ROWS = 50_000
+RISK_NAMES = {'LOW': 'low', 'MODERATE': 'medium', 'CRITICAL': 'high'}
+SORT_FIELDS = ('probability', 'name', 'department', 'role', 'tenure', 'satisfaction')
+
+# prediction-form.tsx field -> model column, and its department values
+FORM_FIELDS = {
+    'age': 'Age',
+    'department': 'Department',
+    'jobSatisfaction': 'JobSatisfaction',
+    'workLifeBalance': 'WorkLifeBalance',
+    'yearsAtCompany': 'YearsAtCompany',
+    'salary': 'MonthlyIncome',
+    'overtime': 'OverTime',
+}
+FORM_DEPARTMENTS = {
+    'sales': 'Sales', 'engineering': 'Engineering', 'marketing': 'Marketing',
+    'hr': 'HR', 'finance': 'Finance',
+}
+
+
+class QueryError(ValueError):
+    """A query parameter or cursor the API cannot serve"""
+
+
+def _text_column(df, *candidates):
+    for col in candidates:
+        if col in df.columns:
+            return df[col].astype('string').fillna('')
+    return pd.Series('', index=df.index, dtype='string')
+
+
+def _numeric_column(df, *candidates):
+    for col in candidates:
+        if col in df.columns:
+            return pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=float)
+    return np.full(len(df), np.nan)
+
+
+class RosterAPI:
+    """Filtered, sorted, paginated views over one scored roster"""
+
+    def __init__(self, df, scoring_model, version=None, cache_size=256):
+        roster = adapt_schema(df).reset_index(drop=True)
+        probability = np.empty(len(roster))
+        for start in range(0, len(roster), SCORE_CHUNK_ROWS):
+            chunk = roster.iloc[start:start + SCORE_CHUNK_ROWS]
+            probability[start:start + len(chunk)] = scoring_model.score(chunk)['probability']
+
+        if 'FirstName' in roster.columns and 'LastName' in roster.columns:
+            name = (_text_column(roster, 'FirstName') + ' ' + _text_column(roster, 'LastName')).str.strip()
+        else:
+            name = _text_column(roster, 'EmployeeID', 'EmpID')
+        ids = roster['EmployeeID'] if 'EmployeeID' in roster.columns else pd.Series(np.arange(len(roster)))
+
+        risk = pd.Series(risk_levels(probability)).map(RISK_NAMES)
+        self.table = pd.DataFrame({
+            'id': ids.astype(str).to_numpy(),
+            'name': name.to_numpy(dtype=object),
+            'department': _text_column(roster, 'Department').astype('category'),
+            'role': _text_column(roster, 'JobRole', 'JobTitle').to_numpy(dtype=object),
+            'tenure': np.round(_numeric_column(roster, 'YearsAtCompany'), 1),
+            'satisfaction': _numeric_column(roster, 'JobSatisfaction'),
+            'probability': np.round(probability * 100, 1),
+            'riskLevel': risk.astype('category'),
+        })
+        self.version = version or hashlib.sha1(pd.util.hash_pandas_object(self.table['id'], index=False).values).hexdigest()[:12]
+
+        # Everything a query touches is precomputed once per roster
+        self._search_text = (self.table['id'] + ' ' + self.table['name'] + ' ' + self.table['role']).str.lower()
+        self._sort_keys = {}
+        for field in SORT_FIELDS:
+            values = self.table[field]
+            if values.dtype.kind == 'f':
+                self._sort_keys[field] = np.nan_to_num(values.to_numpy(), nan=-np.inf)
+            else:
+                self._sort_keys[field] = pd.factorize(values.astype(str), sort=True)[0]
+
+        self._cache = OrderedDict()
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @classmethod
+    def from_file(cls, path, scoring_model):
+        if path.lower().endswith(('.parquet', '.pq')):
+            df = pd.read_parquet(path)
+        else:
+            df = pd.read_csv(path)
+        return cls(df, scoring_model)
+
+    @classmethod
+    def from_store(cls, store, scoring_model, dataset_id=None, owner=None):
+        """A roster saved by the dashboard: ``dataset_id``, or ``owner``'s latest (None if they have none)
+
+        One of the two is required. The ``/api`` routes are unauthenticated,
+        so the store's latest roster overall, which may be anyone's, is never
+        served by default.
+        """
+        if dataset_id is None:
+            if owner is None:
+                raise ValueError('Pass a dataset id or an owner token to serve a saved roster')
+            latest = store.latest_dataset(owner=owner)
+            if latest is None:
+                return None
+            dataset_id = latest['id']
+        return cls(store.load_roster(dataset_id), scoring_model, version=f"ds{dataset_id}")
+
+    def facets(self):
+        """Values and counts for the table's filter controls"""
+        return {
+            'version': self.version,
+            'total': len(self.table),
+            'departments': self.table['department'].value_counts().sort_index().to_dict(),
+            'riskLevels': self.table['riskLevel'].value_counts().to_dict(),
+            'sortFields': list(SORT_FIELDS),
+        }
+
+    def _positions(self, key):
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+                return self._cache[key]
+        q, department, risk, sort, descending = key
+
+        mask = np.ones(len(self.table), dtype=bool)
+        if department:
+            mask &= (self.table['department'] == department).to_numpy()
+        if risk:
+            mask &= (self.table['riskLevel'] == risk).to_numpy()
+        if q:
+            mask &= self._search_text.str.contains(q, regex=False).to_numpy()
+        positions = np.flatnonzero(mask)
+
+        sort_key = self._sort_keys[sort][positions]
+        order = np.argsort(-sort_key if descending else sort_key, kind='stable')
+        positions = positions[order]
+        positions.flags.writeable = False
+
+        with self._lock:
+            self.cache_misses += 1
+            self._cache[key] = positions
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return positions
+
+    def _cursor_tag(self, key):
+        return hashlib.sha1(json.dumps([self.version, *key]).encode()).hexdigest()[:12]
+
+    def _encode_cursor(self, key, offset):
+        raw = json.dumps({'t': self._cursor_tag(key), 'o': offset}).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+    def _decode_cursor(self, key, cursor):
+        try:
+            raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+            data = json.loads(raw)
+            tag, offset = data['t'], int(data['o'])
+        except (ValueError, KeyError, TypeError):
+            raise QueryError('Malformed cursor')
+        if tag != self._cursor_tag(key):
+            raise QueryError('Cursor belongs to a different query or roster version')
+        return offset
+
+    def query(self, q=None, department=None, risk=None, sort='probability', order='desc',
+              limit=DEFAULT_PAGE_SIZE, cursor=None):
+        """One page of the result as ``(frame, total, next_cursor)``"""
+        if sort not in SORT_FIELDS:
+            raise QueryError(f"sort must be one of {', '.join(SORT_FIELDS)}")
+        if order not in ('asc', 'desc'):
+            raise QueryError("order must be 'asc' or 'desc'")
+        try:
+            limit = int(limit)
+        except (TypeError, ValueError):
+            raise QueryError('limit must be an integer')
+        limit = min(max(limit, 1), MAX_PAGE_SIZE)
+
+        key = ((q or '').strip().lower(), department or '', risk or '', sort, order == 'desc')
+        positions = self._positions(key)
+        offset = self._decode_cursor(key, cursor) if cursor else 0
+        page = positions[offset:offset + limit]
+        next_offset = offset + len(page)
+        next_cursor = self._encode_cursor(key, next_offset) if next_offset < len(positions) else None
+        return self.table.iloc[page], len(positions), next_cursor
+
+    def page(self, **params):
+        """JSON-ready page: ``{'items', 'total', 'nextCursor', 'version'}``"""
+        frame, total, next_cursor = self.query(**params)
+        items = frame.astype({'department': str, 'riskLevel': str}).to_dict('records')
+        for item in items:
+            for field in ('tenure', 'satisfaction'):
+                if item[field] != item[field]:
+                    item[field] = None
+        return {'items': items, 'total': total, 'nextCursor': next_cursor, 'version': self.version}
+
+
+def prediction_frame(payload):
+    """One-row model input from prediction-form.tsx's form values"""
+    record = {}
+    for field, column in FORM_FIELDS.items():
+        value = payload.get(field)
+        if value in (None, ''):
+            continue
+        if field == 'department':
+            value = FORM_DEPARTMENTS.get(str(value).lower(), value)
+        elif field == 'overtime':
+            value = 'Yes' if str(value).lower() in ('yes', 'true', '1') else 'No'
+        else:
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                raise QueryError(f"{field} must be a number")
+        record[column] = value
+    return pd.DataFrame([record])
+
+
+def prediction_response(scores, contributions, n_factors=3):
+    """The frontend's PredictionResult, with drivers from the model's attribution"""
+    from attrition.explain import DRIVER_ACTIONS, FEATURE_LABELS, top_contributors
+
+    probability = float(scores['probability'][0])
+    drivers = top_contributors(contributions, n_factors)[0]
+    return {
+        'risk': RISK_NAMES[risk_levels([probability])[0]],
+        'probability': round(probability * 100, 1),
+        'lower': round(float(scores['lower'][0]) * 100, 1),
+        'upper': round(float(scores['upper'][0]) * 100, 1),
+        'factors': [f"{FEATURE_LABELS[feature]} (+{points * 100:.1f} pts)" for feature, points in drivers]
+                   or ['No significant risk factors identified'],
+        'recommendations': [f"{DRIVER_ACTIONS[feature][0]}: {DRIVER_ACTIONS[feature][1]}" for feature, _ in drivers]
+                           or ['Continue current engagement practices'],
+    }
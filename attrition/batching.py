@@ -0,0 +1,150 @@
+"""Micro-batching of concurrent scoring requests into single vectorized model calls"""
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+import numpy as np
+import pandas as pd
+
+_STOP = object()
+
+
+class BatchScheduler:
+    """Coalesce requests that arrive close together into one scoring call
+
+    Callers from any thread (Streamlit sessions, the asyncio service through
+    ``asyncio.wrap_future``) submit a DataFrame and get a Future. A single
+    worker thread waits at most ``max_wait_ms`` after the first queued request
+    for more to arrive, up to ``max_batch_rows`` rows, scores the concatenated
+    frame once and slices the result arrays back out per request. If the
+    batch fails, each request is scored on its own, so only the requests
+    that fail by themselves get the exception.
+    """
+
+    def __init__(self, score_fn, max_batch_rows=1024, max_wait_ms=5.0):
+        self.score_fn = score_fn
+        self.max_batch_rows = max_batch_rows
+        self.max_wait = max_wait_ms / 1000
+        self._queue = queue.Queue()
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            'requests': 0,
+            'rows': 0,
+            'batches': 0,
+            'errors': 0,
+            'queue_depth': 0,
+            'peak_queue_depth': 0,
+            'largest_batch_rows': 0,
+            'queue_wait_seconds': 0.0,
+            'score_seconds': 0.0,
+        }
+        self._worker = threading.Thread(target=self._run, name='batch-scheduler', daemon=True)
+        self._worker.start()
+
+    def submit(self, df):
+        """Queue ``df`` for scoring; the Future resolves to a dict of arrays"""
+        future = Future()
+        with self._stats_lock:
+            self._stats['requests'] += 1
+            self._stats['rows'] += len(df)
+            self._stats['queue_depth'] += 1
+            self._stats['peak_queue_depth'] = max(self._stats['peak_queue_depth'], self._stats['queue_depth'])
+        self._queue.put((df, future, time.perf_counter()))
+        return future
+
+    def stats(self):
+        """Counters since start-up plus derived averages
+
+        ``batches`` is the number of model invocations, so
+        ``requests / batches`` is the coalescing factor under the current load.
+        """
+        with self._stats_lock:
+            stats = dict(self._stats)
+        served = stats['requests'] - stats['queue_depth']
+        stats['max_batch_rows'] = self.max_batch_rows
+        stats['max_wait_ms'] = self.max_wait * 1000
+        stats['mean_batch_requests'] = served / stats['batches'] if stats['batches'] else 0.0
+        stats['mean_queue_wait_ms'] = 1000 * stats['queue_wait_seconds'] / served if served else 0.0
+        stats['mean_score_ms'] = 1000 * stats['score_seconds'] / stats['batches'] if stats['batches'] else 0.0
+        return stats
+
+    def score(self, df, timeout=None):
+        """Blocking convenience wrapper around ``submit``"""
+        return self.submit(df).result(timeout)
+
+    def close(self):
+        self._queue.put(_STOP)
+        self._worker.join()
+
+    def _collect(self, first):
+        batch = [first]
+        rows = len(first[0])
+        deadline = time.perf_counter() + self.max_wait
+        while rows < self.max_batch_rows:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _STOP:
+                self._queue.put(_STOP)
+                break
+            batch.append(item)
+            rows += len(item[0])
+        return batch
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            batch = self._collect(item)
+            frames = [df for df, _, _ in batch]
+            started = time.perf_counter()
+            try:
+                combined = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+                results = self.score_fn(combined)
+            except Exception as e:
+                results = e
+            finished = time.perf_counter()
+
+            with self._stats_lock:
+                self._stats['batches'] += 1
+                self._stats['queue_depth'] -= len(batch)
+                self._stats['largest_batch_rows'] = max(self._stats['largest_batch_rows'], sum(map(len, frames)))
+                self._stats['queue_wait_seconds'] += sum(started - queued for _, _, queued in batch)
+                self._stats['score_seconds'] += finished - started
+                if isinstance(results, Exception) and len(batch) == 1:
+                    self._stats['errors'] += 1
+
+            if isinstance(results, Exception):
+                if len(batch) == 1:
+                    batch[0][1].set_exception(results)
+                else:
+                    self._score_each(batch)
+                continue
+
+            offsets = np.cumsum([0] + [len(df) for df in frames])
+            for (_, future, _), start, end in zip(batch, offsets[:-1], offsets[1:]):
+                future.set_result({name: values[start:end] for name, values in results.items()})
+
+    def _score_each(self, batch):
+        """Score a failed batch's requests one at a time, failing only the bad ones"""
+        for df, future, _ in batch:
+            started = time.perf_counter()
+            try:
+                result = self.score_fn(df)
+            except Exception as e:
+                result = e
+            with self._stats_lock:
+                self._stats['batches'] += 1
+                self._stats['score_seconds'] += time.perf_counter() - started
+                if isinstance(result, Exception):
+                    self._stats['errors'] += 1
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -0,0 +1,231 @@
+"""Offline bulk scoring of a roster file into a ranked at-risk list
+
+    python -m attrition.bulk roster.csv -o scores.csv --top-k 100
+
+The input (CSV, optionally compressed, or Parquet) is streamed in chunks
+and each chunk is scored in a worker process that loaded the model once.
+Only ``2 × workers`` chunks are in flight at a time and results are written
+as they complete, so memory stays bounded regardless of the roster size.
+"""
+import argparse
+import heapq
+import os
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from attrition.explain import FEATURE_LABELS, top_contributors
+from attrition.features import FEATURE_COLUMNS
+from attrition.scoring import DEFAULT_MODELS_DIR, load_scoring_model, risk_levels
+
+ID_COLUMNS = ('EmployeeID', 'EmpID')
+DEFAULT_CHUNK_ROWS = 100_000
+N_FACTORS = 3
+
+_worker_model = None
+_worker_factors = N_FACTORS
+
+
+def _init_worker(models_dir, n_factors=N_FACTORS):
+    global _worker_model, _worker_factors
+    _worker_model = load_scoring_model(models_dir)
+    _worker_factors = n_factors
+
+
+def top_factors(contributions, n_factors=N_FACTORS):
+    """The row's largest positive risk drivers, e.g. 'Overtime +12.3; Tenure +4.0'"""
+    return np.array([
+        '; '.join(f"{FEATURE_LABELS[feature]} +{points * 100:.1f}" for feature, points in drivers)
+        for drivers in top_contributors(contributions, n_factors)
+    ], dtype=object)
+
+
+def _score_chunk(df):
+    """Worker entry point: score one chunk and build its output frame"""
+    X = _worker_model.encode(df)
+    scores = _worker_model.score_matrix(X)
+    out = pd.DataFrame({
+        'probability': np.round(scores['probability'], 6),
+        'lower': np.round(scores['lower'], 6),
+        'upper': np.round(scores['upper'], 6),
+        'risk_level': risk_levels(scores['probability']),
+    })
+    if _worker_factors:
+        contributions = _worker_model.explain_matrix(X)['contributions']
+        out['top_factors'] = top_factors(contributions, _worker_factors)
+    id_col = next((col for col in ID_COLUMNS if col in df.columns), None)
+    if id_col is not None:
+        out.insert(0, id_col, df[id_col].to_numpy())
+    return out
+
+
+def _is_parquet(path):
+    return path.lower().endswith(('.parquet', '.pq'))
+
+
+def iter_chunks(path, chunk_rows):
+    """Yield DataFrame chunks holding only the id and model feature columns"""
+    wanted = list(ID_COLUMNS) + FEATURE_COLUMNS
+    if _is_parquet(path):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise SystemExit("❌ Reading Parquet requires pyarrow (pip install pyarrow)")
+        parquet_file = pq.ParquetFile(path)
+        columns = [col for col in parquet_file.schema_arrow.names if col in wanted]
+        for batch in parquet_file.iter_batches(batch_size=chunk_rows, columns=columns):
+            yield batch.to_pandas()
+    else:
+        header = pd.read_csv(path, nrows=0).columns
+        columns = [col for col in header if col in wanted]
+        yield from pd.read_csv(path, usecols=columns, chunksize=chunk_rows)
+
+
+class OutputWriter:
+    """Append scored chunks to a CSV or Parquet file"""
+
+    def __init__(self, path):
+        self.path = path
+        self._parquet_writer = None
+        self._wrote_header = False
+
+    def write(self, df):
+        if _is_parquet(self.path):
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if self._parquet_writer is None:
+                self._parquet_writer = pq.ParquetWriter(self.path, table.schema)
+            self._parquet_writer.write_table(table)
+        else:
+            df.to_csv(self.path, mode='a' if self._wrote_header else 'w',
+                      header=not self._wrote_header, index=False)
+            self._wrote_header = True
+
+    def close(self):
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+
+
+class TopKHeap:
+    """Running top-K highest-risk rows; each chunk pushes at most K candidates"""
+
+    def __init__(self, k):
+        self.k = k
+        self._heap = []
+        self._seq = 0
+
+    def update(self, out):
+        if self.k <= 0 or out.empty:
+            return
+        probability = out['probability'].to_numpy()
+        if len(probability) > self.k:
+            candidates = np.argpartition(probability, -self.k)[-self.k:]
+        else:
+            candidates = np.arange(len(probability))
+        records = out.iloc[candidates].to_dict('records')
+        for record in records:
+            self._seq += 1
+            item = (record['probability'], -self._seq, record)
+            if len(self._heap) < self.k:
+                heapq.heappush(self._heap, item)
+            elif item[:2] > self._heap[0][:2]:
+                heapq.heapreplace(self._heap, item)
+
+    def ranked(self):
+        return pd.DataFrame([record for _, _, record in sorted(self._heap, key=lambda i: i[:2], reverse=True)])
+
+
+def _peak_rss_mb(who=resource.RUSAGE_SELF):
+    usage = resource.getrusage(who).ru_maxrss
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    return usage / (1024 * 1024) if sys.platform == 'darwin' else usage / 1024
+
+
+def score_file(input_path, output_path, models_dir=DEFAULT_MODELS_DIR, chunk_rows=DEFAULT_CHUNK_ROWS,
+               workers=None, top_k=100, n_factors=N_FACTORS, progress=True):
+    """Score ``input_path`` into ``output_path`` and return (top-K frame, stats)"""
+    workers = workers or os.cpu_count() or 1
+    writer = OutputWriter(output_path)
+    top = TopKHeap(top_k)
+    rows = 0
+    started = time.perf_counter()
+
+    def collect(future):
+        nonlocal rows
+        out = future.result()
+        writer.write(out)
+        top.update(out)
+        rows += len(out)
+        if progress:
+            elapsed = time.perf_counter() - started
+            print(f"\r⚡ {rows:,} rows scored ({rows / elapsed:,.0f} rows/s)", end='', flush=True)
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(models_dir, n_factors)) as pool:
+            in_flight = []
+            for chunk in iter_chunks(input_path, chunk_rows):
+                in_flight.append(pool.submit(_score_chunk, chunk))
+                # Results are written in input order; waiting on the oldest
+                # chunk also caps how many chunks are held in memory
+                if len(in_flight) >= 2 * workers:
+                    collect(in_flight.pop(0))
+            for future in in_flight:
+                collect(future)
+    finally:
+        writer.close()
+    if progress:
+        print()
+
+    elapsed = time.perf_counter() - started
+    stats = {
+        'rows': rows,
+        'seconds': elapsed,
+        'rows_per_second': rows / elapsed if elapsed else 0.0,
+        'workers': workers,
+        'chunk_rows': chunk_rows,
+        'peak_rss_mb': _peak_rss_mb(),
+        'peak_worker_rss_mb': _peak_rss_mb(resource.RUSAGE_CHILDREN),
+    }
+    return top.ranked(), stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Score a roster file and rank the highest-risk employees')
+    parser.add_argument('input', help='CSV (optionally .gz/.zst/...) or Parquet roster')
+    parser.add_argument('-o', '--output', required=True, help='scored output, .csv or .parquet')
+    parser.add_argument('--top-k', type=int, default=100)
+    parser.add_argument('--top-k-output', help='also write the ranked top-K list to this CSV')
+    parser.add_argument('--chunk-rows', type=int, default=DEFAULT_CHUNK_ROWS)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--factors', type=int, default=N_FACTORS,
+                        help='risk drivers to report per employee (0 skips explanation)')
+    parser.add_argument('--models-dir', default=DEFAULT_MODELS_DIR)
+    args = parser.parse_args()
+
+    if not os.path.exists(os.path.join(args.models_dir, 'attrition_model.pkl')):
+        raise SystemExit(f"❌ No trained model in {args.models_dir}; run train_model.py first")
+
+    print(f"🚀 Scoring {args.input} → {args.output}")
+    ranked, stats = score_file(args.input, args.output, args.models_dir, args.chunk_rows,
+                               args.workers, args.top_k, args.factors)
+
+    print(f"✅ {stats['rows']:,} rows in {stats['seconds']:.1f}s "
+          f"({stats['rows_per_second']:,.0f} rows/s, {stats['workers']} workers, "
+          f"peak RSS {stats['peak_rss_mb']:.0f} MB, per worker {stats['peak_worker_rss_mb']:.0f} MB)")
+
+    if args.top_k_output:
+        ranked.to_csv(args.top_k_output, index=False)
+        print(f"📋 Top {len(ranked)} at-risk employees saved to {args.top_k_output}")
+    if not ranked.empty:
+        print(f"\n🎯 Top {min(10, len(ranked))} at-risk employees:")
+        print(ranked.head(10).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""Incremental roster updates keyed by employee ID
+
+A change file has the roster's ID column (EmployeeID or EmpID) and any
+subset of its other columns. Each row is applied to the loaded roster:
+
+* an ID already in the roster updates that employee; only the non-empty
+  cells of the change row overwrite, so a file with just ``EmployeeID`` and
+  ``MonthlyIncome`` is a salary update
+* an unknown ID is inserted as a new employee, who counts as still
+  employed (``Attrition`` = 0) unless the row says otherwise
+* a row whose ``Action`` column says ``exit`` marks the employee as gone
+  (``Attrition`` = 1, ``ExitDate`` filled in if the roster tracks it)
+
+Rows keep their positions, and inserts are appended, so anything indexed by
+row position (stored scores, the roster table in SQLite) can be patched in
+place. ``apply_delta`` reports which positions changed together with the
+previous values of updated rows, which is what incremental aggregates need
+to subtract the old contribution before adding the new one.
+"""
+import numpy as np
+import pandas as pd
+
+from attrition.schema import adapt_schema, compile_schema
+
+ID_COLUMNS = ('EmployeeID', 'EmpID')
+ACTION_COLUMN = 'Action'
+EXIT_ACTIONS = ('exit', 'exited', 'terminate', 'terminated', 'leaver')
+
+
+class DeltaChanges:
+    """What ``apply_delta`` changed, by row position in the new roster"""
+
+    def __init__(self, updated, inserted, exited, before):
+        self.updated = updated
+        self.inserted = inserted
+        self.exited = exited
+        self.before = before
+
+    @property
+    def positions(self):
+        """Every changed row: updates (including exits) then inserts"""
+        return np.concatenate([self.updated, self.inserted])
+
+    def __len__(self):
+        return len(self.updated) + len(self.inserted)
+
+
+def roster_id_column(df):
+    return next((col for col in ID_COLUMNS if col in df.columns), None)
+
+
+def _match_ids(roster_ids, delta_ids):
+    """Positions of ``delta_ids`` in the roster (-1 for new IDs)"""
+    index = pd.Index(roster_ids)
+    if not index.is_unique:
+        raise ValueError('Roster IDs are not unique, so changes cannot be matched to employees')
+    if pd.api.types.is_numeric_dtype(index):
+        keys = pd.to_numeric(delta_ids, errors='coerce')
+    else:
+        index = index.astype(str)
+        keys = delta_ids.astype(str).str.strip()
+    return index.get_indexer(keys)
+
+
+def _keep_integer(values, dtype):
+    """Change files read with blanks come in as float; keep integer columns integer"""
+    if dtype.kind in 'iu' and values.dtype.kind == 'f' and not np.isnan(values).any() and (values % 1 == 0).all():
+        return values.astype(dtype)
+    return values
+
+
+def _assign(df, col, positions, values):
+    """Replace ``df[col]`` with a copy that has ``values`` at rows ``positions``
+
+    Only the changed column is copied, so the roster ``df`` was shallow-copied
+    from is never written to.
+    """
+    column = df[col].copy()
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        new_labels = pd.Index(values.dropna().unique()).difference(column.cat.categories)
+        if len(new_labels):
+            column = column.cat.add_categories(new_labels)
+    column.iloc[positions] = _keep_integer(values.to_numpy(), column.dtype)
+    df[col] = column
+
+
+def apply_delta(roster, delta, as_of=None):
+    """Apply a change file to ``roster``; returns ``(new_roster, DeltaChanges)``
+
+    ``roster`` is not modified. The change file goes through the same schema
+    adaptation as a full upload, but only its own rows are processed.
+    """
+    id_col = roster_id_column(roster)
+    if id_col is None:
+        raise ValueError('The loaded roster has no EmployeeID/EmpID column to match changes on')
+    derived = {target for target, _ in compile_schema(tuple(delta.columns)).derivations}
+    delta = adapt_schema(delta)
+    if id_col not in delta.columns:
+        raise ValueError(f"The change file has no {id_col} column")
+    delta = delta[delta[id_col].notna()]
+    delta = delta[~delta[id_col].duplicated(keep='last')].reset_index(drop=True)
+
+    positions = _match_ids(roster[id_col], delta[id_col])
+    existing = positions >= 0
+    if 'Attrition' in derived:
+        # A blank ExitDate in a change row means "unchanged", not "rehired"
+        delta['Attrition'] = delta['Attrition'].where((delta['Attrition'] == 1) | ~existing)
+
+    if ACTION_COLUMN in delta.columns:
+        actions = delta.pop(ACTION_COLUMN).astype(str).str.strip().str.lower()
+    else:
+        actions = pd.Series('', index=delta.index)
+    exits = actions.isin(EXIT_ACTIONS).to_numpy()
+    if exits.any():
+        if 'Attrition' in roster.columns:
+            delta['Attrition'] = delta['Attrition'].where(~exits, 1) if 'Attrition' in delta.columns else np.where(exits, 1, np.nan)
+        if 'ExitDate' in roster.columns:
+            exit_date = pd.Timestamp(as_of) if as_of is not None else pd.Timestamp.now().normalize()
+            current = delta['ExitDate'] if 'ExitDate' in delta.columns else pd.Series(pd.NaT, index=delta.index)
+            delta['ExitDate'] = current.where(~exits | current.notna(), exit_date)
+
+    updated = positions[existing]
+    updates = delta[existing]
+
+    new_roster = roster.copy(deep=False)
+    for col in updates.columns:
+        if col == id_col:
+            continue
+        values = updates[col]
+        known = values.notna().to_numpy()
+        if not known.any():
+            continue
+        if col not in new_roster.columns:
+            new_roster[col] = pd.Series(np.nan, index=new_roster.index, dtype=values.dtype if values.dtype.kind in 'fM' else object)
+        _assign(new_roster, col, updated[known], values[known])
+
+    inserts = delta[~existing].copy()
+    if 'Attrition' in roster.columns:
+        # New hires are current employees; a NaN here would drop them from every rate
+        attrition = inserts['Attrition'] if 'Attrition' in inserts.columns else pd.Series(np.nan, index=inserts.index)
+        inserts['Attrition'] = attrition.fillna(0)
+    for col in inserts.columns.intersection(roster.columns):
+        inserts[col] = _keep_integer(inserts[col].to_numpy(), roster[col].dtype)
+    if len(inserts):
+        new_roster = pd.concat([new_roster, inserts], ignore_index=True)
+    inserted = np.arange(len(roster), len(new_roster))
+
+    changes = DeltaChanges(
+        updated=updated,
+        inserted=inserted,
+        exited=int(exits[existing].sum()),
+        before=roster.iloc[updated],
+    )
+    return new_roster, changes
@@ -0,0 +1,201 @@
+"""Data and prediction drift between the training set and roster uploads
+
+Each dataset is reduced once to a compact profile: per numerical feature a
+histogram over fixed bin edges plus a 101-point quantile sketch, per
+categorical feature its label counts, and the same summary for the model's
+risk scores. Profiles are small JSON documents, so they can be stored for
+every upload. Comparing two profiles costs O(bins) per feature and never
+touches the raw rows again:
+
+* PSI (population stability index) from the two histograms
+* KS (Kolmogorov–Smirnov) distance from the two quantile sketches
+
+Bin edges come from the reference profile (normally the training set), so
+every later profile is binned identically and stays comparable with it.
+"""
+import json
+import os
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from attrition.features import CATEGORICAL_FEATURES, NUMERICAL_FEATURES
+
+N_BINS = 10
+QUANTILES = np.linspace(0, 1, 101)
+SCORE_CUTS = np.linspace(0, 1, N_BINS + 1)[1:-1]
+SCORE_FEATURE = 'risk_score'
+PSI_EPSILON = 1e-4
+DEFAULT_BASELINE_PATH = os.path.join('models', 'drift_baseline.json')
+
+# Conventional PSI bands: below 0.1 stable, up to 0.25 moderate, above that
+# the population has shifted enough that the model's view of it is stale
+PSI_MODERATE = 0.1
+PSI_SIGNIFICANT = 0.25
+# Retraining is also warranted when this share of features drifts moderately
+RETRAIN_FEATURE_SHARE = 0.3
+
+BINARY_LABELS = {'Yes': 1, 'No': 0, 'yes': 1, 'no': 0}
+
+
+def _numeric_values(series):
+    if series.dtype == object:
+        series = series.replace(BINARY_LABELS)
+    values = pd.to_numeric(series, errors='coerce').to_numpy(dtype=float)
+    return values[~np.isnan(values)], int(np.isnan(values).sum())
+
+
+def _numeric_profile(series, cuts=None):
+    values, missing = _numeric_values(series)
+    if cuts is None:
+        # Interior quantile cut points; repeated values (discrete features)
+        # collapse to fewer, wider bins
+        cuts = np.unique(np.quantile(values, np.linspace(0, 1, N_BINS + 1)[1:-1])) if len(values) else np.empty(0)
+    cuts = np.asarray(cuts, dtype=float)
+    counts = np.bincount(np.searchsorted(cuts, values, side='right'), minlength=len(cuts) + 1)
+    sketch = np.quantile(values, QUANTILES) if len(values) else np.full(len(QUANTILES), np.nan)
+    return {
+        'kind': 'numerical',
+        'cuts': cuts.tolist(),
+        'counts': counts.tolist(),
+        'quantiles': sketch.tolist(),
+        'mean': float(values.mean()) if len(values) else None,
+        'missing': missing,
+    }
+
+
+def _categorical_profile(series):
+    counts = series.astype('string').str.strip().value_counts()
+    return {
+        'kind': 'categorical',
+        'counts': {str(label): int(n) for label, n in counts.items()},
+        'missing': int(series.isna().sum()),
+    }
+
+
+def build_profile(df, scores=None, reference=None, name=''):
+    """Profile the model features of ``df`` (and its risk ``scores``, if given)
+
+    With a ``reference`` profile its numerical bin edges are reused, which
+    is what makes the PSI of the two profiles meaningful.
+    """
+    reference_features = reference['features'] if reference else {}
+    features = {}
+    for col in NUMERICAL_FEATURES:
+        if col in df.columns:
+            cuts = reference_features.get(col, {}).get('cuts')
+            features[col] = _numeric_profile(df[col], cuts)
+    for col in CATEGORICAL_FEATURES:
+        if col in df.columns:
+            features[col] = _categorical_profile(df[col])
+    if scores is not None:
+        features[SCORE_FEATURE] = _numeric_profile(pd.Series(scores), SCORE_CUTS)
+    return {
+        'name': name,
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'rows': len(df),
+        'features': features,
+    }
+
+
+def psi(expected, actual):
+    """Population stability index of two count vectors over the same bins"""
+    expected = np.asarray(expected, dtype=float)
+    actual = np.asarray(actual, dtype=float)
+    if expected.sum() == 0 or actual.sum() == 0:
+        return np.nan
+    e = np.maximum(expected / expected.sum(), PSI_EPSILON)
+    a = np.maximum(actual / actual.sum(), PSI_EPSILON)
+    return float(((a - e) * np.log(a / e)).sum())
+
+
+def _sketch_cdf(sketch, points):
+    """Right-continuous CDF implied by a quantile sketch, evaluated at ``points``"""
+    positions = np.searchsorted(sketch, points, side='right')
+    return np.concatenate([[0.0], QUANTILES])[positions]
+
+
+def ks_distance(sketch_a, sketch_b):
+    """Largest CDF gap between two quantile sketches"""
+    a = np.asarray(sketch_a, dtype=float)
+    b = np.asarray(sketch_b, dtype=float)
+    if np.isnan(a).any() or np.isnan(b).any():
+        return np.nan
+    points = np.union1d(a, b)
+    return float(np.abs(_sketch_cdf(a, points) - _sketch_cdf(b, points)).max())
+
+
+def _status(value):
+    if value != value:
+        return 'n/a'
+    if value >= PSI_SIGNIFICANT:
+        return 'significant'
+    return 'moderate' if value >= PSI_MODERATE else 'stable'
+
+
+def compare_profiles(reference, current):
+    """Per-feature PSI and KS of ``current`` against ``reference``
+
+    Numerical histograms must share bin edges; a feature binned differently
+    (its profile was built without this reference) is compared on the
+    quantile sketches only.
+    """
+    rows = []
+    for col, ref in reference['features'].items():
+        cur = current['features'].get(col)
+        if cur is None or cur['kind'] != ref['kind']:
+            continue
+        if ref['kind'] == 'numerical':
+            same_bins = ref['cuts'] == cur['cuts']
+            value = psi(ref['counts'], cur['counts']) if same_bins else np.nan
+            ks = ks_distance(ref['quantiles'], cur['quantiles'])
+            shift = (cur['mean'] - ref['mean']) if cur['mean'] is not None and ref['mean'] is not None else np.nan
+        else:
+            labels = sorted(set(ref['counts']) | set(cur['counts']))
+            value = psi([ref['counts'].get(label, 0) for label in labels],
+                        [cur['counts'].get(label, 0) for label in labels])
+            ks, shift = np.nan, np.nan
+        rows.append({
+            'feature': col,
+            'kind': ref['kind'],
+            'psi': value,
+            'ks': ks,
+            'mean_shift': shift,
+            'status': _status(value),
+        })
+    return pd.DataFrame(rows, columns=['feature', 'kind', 'psi', 'ks', 'mean_shift', 'status'])
+
+
+def retraining_verdict(report):
+    """Whether the drift in ``report`` warrants retraining, and why"""
+    features = report[report['feature'] != SCORE_FEATURE]
+    scores = report[report['feature'] == SCORE_FEATURE]
+    reasons = []
+
+    significant = features.loc[features['status'] == 'significant', 'feature'].tolist()
+    if significant:
+        reasons.append(f"Significant drift in {', '.join(significant)}")
+    drifting = features['status'].isin(['moderate', 'significant'])
+    if len(features) and drifting.mean() >= RETRAIN_FEATURE_SHARE and not significant:
+        reasons.append(f"{int(drifting.sum())} of {len(features)} features drifting")
+    if len(scores) and scores['status'].iloc[0] == 'significant':
+        reasons.append('Risk score distribution has shifted')
+    return {
+        'retrain': bool(reasons),
+        'reasons': reasons,
+        'max_psi': float(features['psi'].max()) if features['psi'].notna().any() else None,
+    }
+
+
+def save_baseline_profile(profile, path=DEFAULT_BASELINE_PATH):
+    with open(path, 'w') as f:
+        json.dump(profile, f)
+
+
+def load_baseline_profile(path=DEFAULT_BASELINE_PATH):
+    """The training-set profile from train_model.py, or None"""
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
@@ -0,0 +1,152 @@
+"""Encoded feature matrix materialization shared by training and tuning runs"""
+import hashlib
+import json
+import os
+import shutil
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import LabelEncoder, StandardScaler
+
+NUMERICAL_FEATURES = ['Age', 'MonthlyIncome', 'DistanceFromHome', 'YearsAtCompany',
+                      'JobSatisfaction', 'WorkLifeBalance', 'Education', 'OverTime']
+CATEGORICAL_FEATURES = ['Department', 'JobRole']
+FEATURE_COLUMNS = NUMERICAL_FEATURES + CATEGORICAL_FEATURES
+TARGET = 'Attrition'
+
+# Anything that changes the bytes of the materialized matrix belongs in here,
+# so that editing it invalidates every cached matrix built from the old spec.
+FEATURE_SPEC = {
+    'version': 1,
+    'numerical': NUMERICAL_FEATURES,
+    'categorical': CATEGORICAL_FEATURES,
+    'target': TARGET,
+    'dtype': 'float32',
+    'test_size': 0.2,
+    'random_state': 42,
+}
+
+DEFAULT_CACHE_DIR = os.path.join('models', 'cache')
+
+
+class FeatureMatrix:
+    """Memory-mapped, pre-scaled feature matrix with train rows stored first
+
+    Rows are laid out as ``[train | test]`` so ``X_train``/``X_test`` are plain
+    slices of the memory map: no fancy indexing and no copies, and any number
+    of processes opening the same ``path`` share the page cache.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, 'meta.json')) as f:
+            self.meta = json.load(f)
+        self.key = self.meta['key']
+        self.columns = self.meta['columns']
+        self.n_train = self.meta['n_train']
+        self.X = np.load(os.path.join(path, 'X.npy'), mmap_mode='r')
+        self.y = np.load(os.path.join(path, 'y.npy'), mmap_mode='r')
+
+    @property
+    def X_train(self):
+        return self.X[:self.n_train]
+
+    @property
+    def X_test(self):
+        return self.X[self.n_train:]
+
+    @property
+    def y_train(self):
+        return self.y[:self.n_train]
+
+    @property
+    def y_test(self):
+        return self.y[self.n_train:]
+
+    def load_preprocessors(self):
+        """Return the scaler and label encoders fitted for this matrix"""
+        scaler = joblib.load(os.path.join(self.path, 'scaler.pkl'))
+        le_dept = joblib.load(os.path.join(self.path, 'label_encoder_dept.pkl'))
+        le_role = joblib.load(os.path.join(self.path, 'label_encoder_role.pkl'))
+        return scaler, le_dept, le_role
+
+
+def feature_cache_key(df, spec=FEATURE_SPEC):
+    """Hash the raw modelling columns together with the feature spec"""
+    digest = hashlib.sha1(json.dumps(spec, sort_keys=True).encode())
+    row_hashes = pd.util.hash_pandas_object(df[FEATURE_COLUMNS + [TARGET]], index=False)
+    digest.update(row_hashes.values.tobytes())
+    return digest.hexdigest()[:16]
+
+
+def _build_feature_matrix(df, path, key):
+    """Encode, split and scale ``df`` once and write the result to ``path``"""
+    le_dept = LabelEncoder()
+    le_role = LabelEncoder()
+    dept_codes = le_dept.fit_transform(df['Department'])
+    role_codes = le_role.fit_transform(df['JobRole'])
+    y = df[TARGET].to_numpy()
+
+    train_idx, test_idx = train_test_split(
+        np.arange(len(df)),
+        test_size=FEATURE_SPEC['test_size'],
+        random_state=FEATURE_SPEC['random_state'],
+        stratify=y
+    )
+    order = np.concatenate([train_idx, test_idx])
+    n_train = len(train_idx)
+    n_num = len(NUMERICAL_FEATURES)
+
+    # Fill a single float32 buffer in the final row order; scaling then runs
+    # in place on the numerical block instead of on DataFrame copies.
+    X = np.empty((len(df), len(FEATURE_COLUMNS)), dtype=np.float32)
+    X[:, :n_num] = df[NUMERICAL_FEATURES].to_numpy(dtype=np.float32)[order]
+    X[:, n_num] = dept_codes[order]
+    X[:, n_num + 1] = role_codes[order]
+
+    scaler = StandardScaler()
+    scaler.fit(X[:n_train, :n_num])
+    X[:, :n_num] = scaler.transform(X[:, :n_num])
+
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    os.makedirs(tmp_path, exist_ok=True)
+    np.save(os.path.join(tmp_path, 'X.npy'), X)
+    np.save(os.path.join(tmp_path, 'y.npy'), y[order].astype(np.int8))
+    joblib.dump(scaler, os.path.join(tmp_path, 'scaler.pkl'))
+    joblib.dump(le_dept, os.path.join(tmp_path, 'label_encoder_dept.pkl'))
+    joblib.dump(le_role, os.path.join(tmp_path, 'label_encoder_role.pkl'))
+    with open(os.path.join(tmp_path, 'meta.json'), 'w') as f:
+        json.dump({
+            'key': key,
+            'columns': FEATURE_COLUMNS,
+            'n_rows': len(df),
+            'n_train': n_train,
+            'spec': FEATURE_SPEC,
+        }, f, indent=2)
+
+    try:
+        os.replace(tmp_path, path)
+    except OSError:
+        # Another process materialized the same key first; theirs is identical.
+        shutil.rmtree(tmp_path, ignore_errors=True)
+
+
+def materialize_features(df, cache_dir=DEFAULT_CACHE_DIR):
+    """Return the cached FeatureMatrix for ``df``, building it on first use
+
+    Returns the matrix and whether it was served from the cache.
+    """
+    key = feature_cache_key(df)
+    path = os.path.join(cache_dir, key)
+    hit = os.path.exists(os.path.join(path, 'meta.json'))
+    if not hit:
+        os.makedirs(cache_dir, exist_ok=True)
+        _build_feature_matrix(df, path, key)
+    return FeatureMatrix(path), hit
+
+
+def open_feature_matrix(path):
+    """Open an already materialized matrix, e.g. from a tuning worker"""
+    return FeatureMatrix(path)
@@ -0,0 +1,110 @@
+"""State and location attrition aggregates for the dashboard's drill-down
+
+``LocationIndex`` sorts the roster once by (State, LocationCode, Department)
+codes. Every group at every level is then a contiguous run of that order,
+so one ``np.add.reduceat`` per level totals employees, leavers and predicted
+risk for all groups at once. One summary frame per level is kept, sorted the
+same way, and each group's children (a state's locations, a location's
+departments) are a run of rows in the next level's frame. A dict maps every
+drill-down path to that run and to its slice of the sorted roster, so a
+click is a lookup plus a slice, whatever the roster size.
+"""
+import numpy as np
+import pandas as pd
+
+from attrition.scoring import RISK_THRESHOLDS
+
+LEVELS = ('State', 'LocationCode', 'Department')
+MEASURES = ('employees', 'leavers', 'risk_total', 'scored', 'high_risk')
+HIGH_RISK_THRESHOLD = RISK_THRESHOLDS[-1] / 100
+UNKNOWN_LABEL = 'Unknown'
+
+
+def _codes(series):
+    """Sorted integer codes and their labels; missing values sort last as Unknown"""
+    codes, uniques = pd.factorize(series, sort=True)
+    labels = np.append(pd.Index(uniques).astype(str).to_numpy(dtype=object), UNKNOWN_LABEL)
+    return np.where(codes < 0, len(uniques), codes), labels
+
+
+def _row_measures(df, risk, high_risk):
+    measures = np.zeros((len(df), len(MEASURES)))
+    measures[:, 0] = 1
+    if 'Attrition' in df.columns:
+        attrition = df['Attrition']
+        if attrition.dtype == object:
+            attrition = attrition.map({'Yes': 1, 'No': 0})
+        measures[:, 1] = pd.to_numeric(attrition, errors='coerce').fillna(0).to_numpy()
+    if risk is not None:
+        risk = np.asarray(risk, dtype=float)
+        scored = ~np.isnan(risk)
+        measures[:, 2] = np.where(scored, risk, 0)
+        measures[:, 3] = scored
+        measures[:, 4] = scored & (risk >= high_risk)
+    return measures
+
+
+def _summary(groups):
+    """Per-group measures plus the rates the dashboard shows"""
+    with np.errstate(invalid='ignore', divide='ignore'):
+        groups['attrition_rate'] = groups['leavers'] / groups['employees']
+        groups['mean_risk'] = groups['risk_total'] / groups['scored']
+        groups['high_risk_share'] = groups['high_risk'] / groups['scored']
+    for col in ('employees', 'leavers', 'high_risk'):
+        groups[col] = groups[col].astype(int)
+    return groups.drop(columns=['risk_total', 'scored'])
+
+
+class LocationIndex:
+    """Pre-aggregated State -> LocationCode -> Department drill-down"""
+
+    def __init__(self, df, risk=None, high_risk=HIGH_RISK_THRESHOLD):
+        self.levels = [col for col in LEVELS if col in df.columns]
+        if 'State' not in self.levels:
+            raise ValueError('The roster has no State column')
+
+        coded = [_codes(df[col]) for col in self.levels]
+        self.order = np.lexsort([codes for codes, _ in reversed(coded)])
+        measures = _row_measures(df, risk, high_risk)[self.order]
+
+        # path -> (level, run) of its children's summaries, and path -> its slice of order
+        self._levels = []
+        self._children = {}
+        self._ranges = {(): (0, len(self.order))}
+        changed = np.zeros(len(self.order), dtype=bool)
+        changed[:1] = True
+        parents = [()]
+        for column, (codes, labels) in zip(self.levels, coded):
+            codes = codes[self.order]
+            parent_starts = changed.copy()
+            changed[1:] |= codes[1:] != codes[:-1]
+            starts = np.flatnonzero(changed)
+            ends = np.append(starts[1:], len(self.order))
+            keys = labels[codes[starts]]
+            groups = pd.DataFrame(np.add.reduceat(measures, starts, axis=0), columns=MEASURES) \
+                if len(starts) else pd.DataFrame(columns=MEASURES, dtype=float)
+            groups.insert(0, column, keys)
+            self._levels.append(_summary(groups))
+
+            # Groups are sorted by their parent, so each parent's are one run
+            bounds = np.append(np.flatnonzero(parent_starts[starts]), len(starts))
+            paths = []
+            for parent, lo, hi in zip(parents, bounds[:-1], bounds[1:]):
+                self._children[parent] = (len(self._levels) - 1, lo, hi)
+                for key, start, end in zip(keys[lo:hi], starts[lo:hi], ends[lo:hi]):
+                    paths.append(parent + (key,))
+                    self._ranges[paths[-1]] = (start, end)
+            parents = paths
+
+    def summary(self, *path):
+        """Aggregates of the level below ``path``: states, then locations, then departments"""
+        path = tuple(str(key) for key in path)
+        if path not in self._children:
+            raise KeyError(f"No location group {' / '.join(path) or '(all)'}")
+        level, lo, hi = self._children[path]
+        return self._levels[level].iloc[lo:hi].reset_index(drop=True)
+
+    def rows(self, *path):
+        """Roster row positions of the group at ``path``"""
+        start, end = self._ranges[tuple(str(key) for key in path)]
+        return self.order[start:end]
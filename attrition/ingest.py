@@ -0,0 +1,170 @@
+"""Read uploaded rosters in CSV, compressed CSV, Parquet or Feather form
+
+``read_roster`` picks the reader from the file name and reads only the
+columns the dashboard and the model use (``roster_columns()``). Parquet and
+Feather skip the other columns on disk. CSV readers still scan every byte,
+but they never convert the other columns into Python strings, which is
+where most of ``pd.read_csv``'s time goes on wide HRIS exports. The readers
+are pyarrow's, which parse and decompress on all cores; pandas'
+single-threaded ``read_csv`` is the fallback when pyarrow is not
+installed or cannot settle a column's type from the start of the file.
+Exports that share no column with that set are read whole, so that
+``adapt_schema`` still sees them.
+
+The module imports nothing heavy at load time, so the upload screen can
+list ``UPLOAD_TYPES`` without pulling in pandas or the model code.
+"""
+from functools import lru_cache
+
+ID_COLUMNS = ('EmployeeID', 'EmpID')
+# Shown in the Employee Data table or used for history, beyond the model's columns
+DISPLAY_COLUMNS = ('FirstName', 'LastName', 'TerminationType', 'JoiningYear', 'PerformanceRating')
+
+# File name suffix -> (format, compression)
+FORMATS = {
+    '.csv': ('csv', None),
+    '.csv.gz': ('csv', 'gzip'),
+    '.gz': ('csv', 'gzip'),
+    '.csv.zst': ('csv', 'zstd'),
+    '.zst': ('csv', 'zstd'),
+    '.zstd': ('csv', 'zstd'),
+    '.parquet': ('parquet', None),
+    '.pq': ('parquet', None),
+    '.feather': ('feather', None),
+    '.arrow': ('feather', None),
+}
+# Extensions for st.file_uploader, which compares only the last suffix
+UPLOAD_TYPES = sorted({suffix.rsplit('.', 1)[-1] for suffix in FORMATS})
+
+
+@lru_cache(maxsize=None)
+def roster_columns():
+    """Source column names any part of the dashboard or the model reads"""
+    from attrition.features import FEATURE_COLUMNS, TARGET
+    from attrition.geography import LEVELS
+    from attrition.orgchart import SUPERVISOR_COLUMNS
+    from attrition.schema import COLUMN_ALIASES, DATE_COLUMNS, DERIVED_COLUMNS
+
+    return frozenset(
+        FEATURE_COLUMNS + [TARGET] + list(ID_COLUMNS) + DATE_COLUMNS + list(DISPLAY_COLUMNS)
+        + list(SUPERVISOR_COLUMNS) + list(LEVELS)
+        + [col for canonical, aliases in COLUMN_ALIASES.items() for col in [canonical] + aliases]
+        + [col for sources, _ in DERIVED_COLUMNS.values() for col in sources]
+    )
+
+
+def detect_format(name):
+    """``(format, compression)`` for a file name; plain CSV when the suffix is unknown"""
+    name = name.lower()
+    for suffix in sorted(FORMATS, key=len, reverse=True):
+        if name.endswith(suffix):
+            return FORMATS[suffix]
+    return FORMATS['.csv']
+
+
+def _select(available, columns):
+    """The wanted columns present in ``available``, or all of them if none are"""
+    if columns is None:
+        return None
+    selected = [col for col in available if col in columns]
+    return selected or None
+
+
+def _arrow_buffer(source):
+    import pyarrow as pa
+
+    if isinstance(source, str):
+        return source
+    if hasattr(source, 'getbuffer'):
+        # Uploaded files are in-memory BytesIO; wrap them without a copy
+        return pa.BufferReader(pa.py_buffer(source.getbuffer()))
+    source.seek(0)
+    return source
+
+
+def _arrow_input(source, compression=None):
+    import pyarrow as pa
+    return pa.input_stream(_arrow_buffer(source), compression=compression)
+
+
+def _to_pandas(table):
+    # Date columns become datetime64 rather than objects, as parse_dates would leave them
+    return table.to_pandas(date_as_object=False)
+
+
+def _read_csv_arrow(source, compression, columns):
+    import pyarrow as pa
+    import pyarrow.csv as csv
+
+    read_options = csv.ReadOptions(use_threads=True)
+    # Empty fields are missing, as pandas reads them
+    convert_options = csv.ConvertOptions(strings_can_be_null=True)
+    try:
+        if columns is not None:
+            # The first block is enough for the header and keeps the file's column order
+            header = csv.open_csv(_arrow_input(source, compression), read_options=read_options).schema.names
+            convert_options.include_columns = _select(header, columns) or header
+        table = csv.read_csv(_arrow_input(source, compression), read_options=read_options,
+                             convert_options=convert_options)
+    except pa.ArrowInvalid:
+        # A column whose type changes after the first block; pandas widens it instead
+        return None
+    return _to_pandas(table)
+
+
+def _read_csv_pandas(source, compression, columns):
+    import pandas as pd
+
+    def read(usecols):
+        if hasattr(source, 'seek'):
+            source.seek(0)
+        return pd.read_csv(source, compression=compression, usecols=usecols)
+
+    df = read(None if columns is None else lambda col: col in columns)
+    if df.shape[1] == 0 and columns is not None:
+        df = read(None)
+    return df
+
+
+def read_csv(source, compression=None, columns=None):
+    try:
+        df = _read_csv_arrow(source, compression, columns)
+    except ImportError:
+        df = None
+    return df if df is not None else _read_csv_pandas(source, compression, columns)
+
+
+def read_parquet(source, columns=None):
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(_arrow_buffer(source))
+    selected = _select(parquet_file.schema_arrow.names, columns)
+    return _to_pandas(parquet_file.read(columns=selected, use_threads=True))
+
+
+def read_feather(source, columns=None):
+    import pyarrow.feather as feather
+    import pyarrow.ipc as ipc
+
+    names = ipc.open_file(_arrow_buffer(source)).schema.names
+    table = feather.read_table(_arrow_buffer(source), columns=_select(names, columns),
+                               memory_map=False, use_threads=True)
+    return _to_pandas(table)
+
+
+def read_roster(source, name=None, prune=True):
+    """Read a roster file or uploaded file object into a DataFrame
+
+    ``name`` (default: the path or the object's ``name``) chooses the format.
+    ``prune=False`` keeps every column.
+    """
+    name = name or getattr(source, 'name', None) or str(source)
+    fmt, compression = detect_format(name)
+    columns = roster_columns() if prune else None
+    if fmt == 'csv':
+        return read_csv(source, compression, columns)
+    try:
+        reader = read_parquet if fmt == 'parquet' else read_feather
+        return reader(source, columns)
+    except ImportError:
+        raise ValueError(f"Reading {fmt.capitalize()} files requires pyarrow (pip install pyarrow)")
@@ -0,0 +1,280 @@
+"""Memory accounting for per-session datasets, with spill to disk and LRU eviction
+
+Each dataset a dashboard session keeps (the uploaded roster, the last
+prediction) is held through a ``DatasetHandle`` registered with one
+process-wide ``MemoryManager``. The session keeps the handle and the manager
+keeps only a weak reference, so a dataset is freed as soon as Streamlit drops
+a closed session's state. The manager tracks each handle's size and spills
+values to local disk:
+
+* after ``idle_seconds`` without access from the session
+* least recently used first while resident data is above ``ceiling_bytes``
+
+DataFrames are written as Feather files (LZ4-compressed Arrow) when pyarrow
+is installed, with ``df.attrs`` kept in the file's schema metadata; anything
+else, and frames Arrow cannot represent, is pickled. A spilled handle reloads
+its value on the next ``get``. Handles are replaced rather than mutated
+when their session stores a new value, so a file written once serves every
+later spill of the same handle.
+"""
+import logging
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+import weakref
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_CEILING_MB = float(os.environ.get('ATTRITION_MEMORY_CEILING_MB', 2048))
+DEFAULT_IDLE_SECONDS = float(os.environ.get('ATTRITION_SESSION_IDLE_SECONDS', 900))
+DEFAULT_SWEEP_SECONDS = 30
+SIZE_SAMPLE_ROWS = 2000
+ATTRS_METADATA_KEY = b'attrition.attrs'
+
+logger = logging.getLogger(__name__)
+
+
+def frame_nbytes(df):
+    """In-memory size of ``df``; object columns of large frames are estimated from a sample"""
+    if len(df) <= SIZE_SAMPLE_ROWS:
+        return int(df.memory_usage(deep=True, index=True).sum())
+    shallow = df.memory_usage(deep=False, index=True)
+    objects = [col for col in df.columns if df[col].dtype == object]
+    if not objects:
+        return int(shallow.sum())
+    sample = df[objects].iloc[np.linspace(0, len(df) - 1, SIZE_SAMPLE_ROWS).astype(int)]
+    per_row = sample.memory_usage(deep=True, index=False) / SIZE_SAMPLE_ROWS
+    return int(shallow.drop(objects).sum() + (per_row * len(df)).sum())
+
+
+def value_nbytes(value):
+    if isinstance(value, pd.DataFrame):
+        return frame_nbytes(value)
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return 0
+
+
+def _write_feather(df, path):
+    import pyarrow as pa
+    import pyarrow.feather as feather
+
+    table = pa.Table.from_pandas(df)
+    metadata = dict(table.schema.metadata or {})
+    if df.attrs:
+        metadata[ATTRS_METADATA_KEY] = pickle.dumps(df.attrs, protocol=pickle.HIGHEST_PROTOCOL)
+    feather.write_feather(table.replace_schema_metadata(metadata), path, compression='lz4')
+
+
+def _read_feather(path):
+    import pyarrow.feather as feather
+
+    table = feather.read_table(path, memory_map=False)
+    df = table.to_pandas()
+    attrs = (table.schema.metadata or {}).get(ATTRS_METADATA_KEY)
+    if attrs is not None:
+        df.attrs = pickle.loads(attrs)
+    return df
+
+
+def spill_value(value, path_stem):
+    """Write ``value`` next to ``path_stem``; returns ``(path, format)``"""
+    if isinstance(value, pd.DataFrame):
+        try:
+            path = path_stem + '.feather'
+            _write_feather(value, path)
+            return path, 'feather'
+        except Exception:
+            # No pyarrow, or a column Arrow cannot type (mixed objects)
+            if os.path.exists(path_stem + '.feather'):
+                os.remove(path_stem + '.feather')
+    path = path_stem + '.pkl'
+    with open(path, 'wb') as f:
+        pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return path, 'pickle'
+
+
+def load_value(path, fmt):
+    if fmt == 'feather':
+        return _read_feather(path)
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+
+def _remove_file(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class DatasetHandle:
+    """One value a session keeps, resident or spilled to disk"""
+
+    def __init__(self, manager, session_id, name, value):
+        self._manager = manager
+        self._lock = threading.Lock()
+        self._value = value
+        self.session_id = session_id
+        self.name = name
+        self.nbytes = value_nbytes(value)
+        self.last_access = time.monotonic()
+        self.path = None
+        self.format = None
+        self.spills = 0
+        self.loads = 0
+
+    @property
+    def resident(self):
+        return self._value is not None
+
+    def get(self):
+        """The value, read back from disk first if it was spilled"""
+        with self._lock:
+            self.last_access = time.monotonic()
+            if self._value is None and self.path is not None:
+                self._value = load_value(self.path, self.format)
+                self.loads += 1
+                reloaded = True
+            else:
+                reloaded = False
+            value = self._value
+        if reloaded:
+            self._manager.enforce_ceiling(keep=self)
+        return value
+
+    def touch(self):
+        self.last_access = time.monotonic()
+
+    def spill(self):
+        """Drop the in-memory value, writing it out first; returns the bytes freed"""
+        with self._lock:
+            if self._value is None:
+                return 0
+            if self.path is None:
+                self.path, self.format = spill_value(self._value, self._manager.file_stem(self))
+                weakref.finalize(self, _remove_file, self.path)
+            self._value = None
+            self.spills += 1
+            return self.nbytes
+
+    def release(self):
+        """Forget the value and its file; the handle is being replaced"""
+        with self._lock:
+            self._value = None
+            if self.path is not None:
+                _remove_file(self.path)
+                self.path = None
+
+
+class MemoryManager:
+    """Process-wide registry of session datasets with idle spill and an LRU ceiling"""
+
+    def __init__(self, spill_dir=None, ceiling_mb=DEFAULT_CEILING_MB, idle_seconds=DEFAULT_IDLE_SECONDS,
+                 sweep_seconds=DEFAULT_SWEEP_SECONDS):
+        self.spill_dir = spill_dir or tempfile.mkdtemp(prefix='attrition-spill-')
+        os.makedirs(self.spill_dir, exist_ok=True)
+        self.ceiling_bytes = int(ceiling_mb * 2 ** 20)
+        self.idle_seconds = idle_seconds
+        self.sweep_seconds = sweep_seconds
+        self._handles = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stop = threading.Event()
+        self.evictions = 0
+
+    def file_stem(self, handle):
+        safe = ''.join(ch if ch.isalnum() else '_' for ch in f"{handle.session_id}-{handle.name}")
+        return os.path.join(self.spill_dir, f"{safe}-{uuid.uuid4().hex[:8]}")
+
+    def hold(self, session_id, name, value):
+        """Register ``value`` as the session's ``name``, replacing its previous handle"""
+        handle = DatasetHandle(self, session_id, name, value)
+        with self._lock:
+            previous = self._handles.get((session_id, name))
+            self._handles[(session_id, name)] = handle
+        if previous is not None:
+            previous.release()
+        self.enforce_ceiling(keep=handle)
+        return handle
+
+    def handles(self):
+        with self._lock:
+            return list(self._handles.values())
+
+    def resident_bytes(self):
+        return sum(handle.nbytes for handle in self.handles() if handle.resident)
+
+    def spill_idle(self, now=None):
+        """Spill every handle its session has not touched for ``idle_seconds``"""
+        now = time.monotonic() if now is None else now
+        freed = 0
+        for handle in self.handles():
+            if handle.resident and now - handle.last_access >= self.idle_seconds:
+                freed += handle.spill()
+        return freed
+
+    def enforce_ceiling(self, keep=None):
+        """Spill least recently used handles until resident data fits the ceiling
+
+        ``keep`` (the handle just stored or reloaded) is never chosen, nor is
+        anything else of its session.
+        """
+        resident = [handle for handle in self.handles() if handle.resident]
+        total = sum(handle.nbytes for handle in resident)
+        if total <= self.ceiling_bytes:
+            return 0
+        protected = keep.session_id if keep is not None else None
+        freed = 0
+        for handle in sorted(resident, key=lambda handle: handle.last_access):
+            if total - freed <= self.ceiling_bytes:
+                break
+            if handle.session_id == protected:
+                continue
+            released = handle.spill()
+            if released:
+                freed += released
+                self.evictions += 1
+        return freed
+
+    def sweep(self):
+        return self.spill_idle() + self.enforce_ceiling()
+
+    def usage(self):
+        """One row per held value: session, size, resident or spilled, idle time"""
+        now = time.monotonic()
+        rows = [{
+            'session': handle.session_id,
+            'name': handle.name,
+            'mb': handle.nbytes / 2 ** 20,
+            'resident': handle.resident,
+            'format': handle.format,
+            'idle_s': now - handle.last_access,
+            'spills': handle.spills,
+            'loads': handle.loads,
+        } for handle in self.handles()]
+        return sorted(rows, key=lambda row: row['idle_s'])
+
+    def start(self):
+        """Sweep from a daemon thread, so idle sessions are spilled without any traffic"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='attrition-memory', daemon=True)
+            self._thread.start()
+        return self
+
+    def _run(self):
+        while not self._stop.wait(self.sweep_seconds):
+            try:
+                self.sweep()
+            except Exception:
+                logger.exception("Memory sweep failed")
+
+    def close(self):
+        self._stop.set()
+        shutil.rmtree(self.spill_dir, ignore_errors=True)
@@ -0,0 +1,233 @@
+"""Budget-constrained retention planning across a whole roster
+
+    python -m attrition.optimizer roster.csv --budget 250000 -o plan.csv
+
+Every at-risk employee is re-scored under each retention intervention that
+applies to them (and under all of them combined). The risk reduction per
+intervention is the model's counterfactual delta. A greedy multiple-choice
+knapsack then spends the budget on the options with the best risk reduction
+per dollar, giving each employee at most one option and upgrading an
+existing choice only when the extra reduction is worth the extra cost.
+"""
+import argparse
+import heapq
+import time
+
+import numpy as np
+import pandas as pd
+
+from attrition.features import FEATURE_COLUMNS
+from attrition.scoring import DEFAULT_MODELS_DIR, load_scoring_model
+
+ID_COLUMNS = ('EmployeeID', 'EmpID')
+DEFAULT_RISK_THRESHOLD = 0.4
+DEFAULT_RAISE_PCT = 10
+COMBINED = 'Combined Package'
+
+
+def _has_overtime(df):
+    return df['OverTime'].isin([1, '1', 'Yes', 'yes', True])
+
+
+# The action names match the dashboard's recommendation cards. Each entry is
+# (applies to whom, how the employee's row changes, annual cost per employee).
+INTERVENTIONS = {
+    'Compensation Review': {
+        'applies': lambda df: pd.Series(True, index=df.index),
+        'apply': lambda df, raise_pct: df.assign(MonthlyIncome=df['MonthlyIncome'] * (1 + raise_pct / 100)),
+        'cost': lambda df, raise_pct: df['MonthlyIncome'] * 12 * raise_pct / 100,
+        'requires': ('MonthlyIncome',),
+    },
+    'Flexible Work Implementation': {
+        'applies': lambda df: df['WorkLifeBalance'] < 4,
+        'apply': lambda df, raise_pct: df.assign(WorkLifeBalance=np.minimum(df['WorkLifeBalance'] + 1, 4)),
+        'cost': lambda df, raise_pct: pd.Series(2000.0, index=df.index),
+        'requires': ('WorkLifeBalance',),
+    },
+    'Workload Redistribution': {
+        'applies': _has_overtime,
+        'apply': lambda df, raise_pct: df.assign(OverTime=0),
+        'cost': lambda df, raise_pct: pd.Series(5000.0, index=df.index),
+        'requires': ('OverTime',),
+    },
+}
+
+
+def _model_frame(df):
+    """Only the model's columns, with numerics coerced so interventions can do arithmetic"""
+    frame = df[[col for col in FEATURE_COLUMNS if col in df.columns]].copy()
+    if 'OverTime' in frame.columns and frame['OverTime'].dtype == object:
+        frame['OverTime'] = _has_overtime(frame).astype(int)
+    for col in ('MonthlyIncome', 'WorkLifeBalance'):
+        if col in frame.columns:
+            frame[col] = pd.to_numeric(frame[col], errors='coerce')
+    return frame
+
+
+def score_interventions(scoring_model, df, risk_threshold=DEFAULT_RISK_THRESHOLD, raise_pct=DEFAULT_RAISE_PCT):
+    """Counterfactual options for every at-risk employee
+
+    Returns ``(baseline, options)``: the baseline probability for every row of
+    ``df`` and a frame with one row per (employee, intervention) holding the
+    row position, cost and risk reduction. Each intervention is one batched
+    scoring call over the employees it applies to.
+    """
+    frame = _model_frame(df)
+    baseline = scoring_model.score(frame)['probability']
+    at_risk = np.flatnonzero(baseline >= risk_threshold)
+    candidates = frame.iloc[at_risk].reset_index(drop=True)
+
+    available = {
+        name: spec for name, spec in INTERVENTIONS.items()
+        if all(col in frame.columns for col in spec['requires'])
+    }
+    options = []
+    combined = candidates
+    combined_cost = np.zeros(len(candidates))
+    combined_count = np.zeros(len(candidates), dtype=int)
+    for name, spec in available.items():
+        applies = spec['applies'](candidates).fillna(False).to_numpy(dtype=bool)
+        if not applies.any():
+            continue
+        subset = candidates[applies]
+        changed = spec['apply'](subset, raise_pct)
+        new_risk = scoring_model.score(changed)['probability']
+        cost = spec['cost'](subset, raise_pct).to_numpy(dtype=float)
+        options.append(pd.DataFrame({
+            'row': at_risk[applies],
+            'intervention': name,
+            'cost': cost,
+            'new_risk': new_risk,
+        }))
+        combined = combined.copy()
+        combined.loc[subset.index] = changed
+        combined_cost[applies] += cost
+        combined_count[applies] += 1
+
+    # The combined package is only a distinct option where two or more apply
+    multi = combined_count > 1
+    if multi.any():
+        options.append(pd.DataFrame({
+            'row': at_risk[multi],
+            'intervention': COMBINED,
+            'cost': combined_cost[multi],
+            'new_risk': scoring_model.score(combined[multi])['probability'],
+        }))
+
+    if not options:
+        return baseline, pd.DataFrame(columns=['row', 'intervention', 'cost', 'new_risk', 'baseline_risk', 'reduction'])
+    options = pd.concat(options, ignore_index=True)
+    options['baseline_risk'] = baseline[options['row'].to_numpy()]
+    options['reduction'] = options['baseline_risk'] - options['new_risk']
+    return baseline, options[(options['reduction'] > 0) & (options['cost'] > 0)].reset_index(drop=True)
+
+
+def select_interventions(options, budget):
+    """Greedy multiple-choice knapsack over ``options``; returns the chosen option indices
+
+    Options are taken in order of risk reduction per dollar. When an employee
+    already has an option, a better one is re-queued at its incremental ratio
+    (extra reduction / extra cost), so upgrades compete fairly with new
+    employees for the remaining budget.
+    """
+    rows = options['row'].to_numpy()
+    costs = options['cost'].to_numpy(dtype=float)
+    reductions = options['reduction'].to_numpy(dtype=float)
+
+    heap = list(zip((-reductions / costs).tolist(), range(len(options)), [-1] * len(options)))
+    heapq.heapify(heap)
+    chosen = {}
+    remaining = float(budget)
+
+    while heap and remaining > 0:
+        _, option, base = heapq.heappop(heap)
+        row = rows[option]
+        current = chosen.get(row, -1)
+        if current != base:
+            # The employee's choice changed since this entry was queued
+            extra_reduction = reductions[option] - (reductions[current] if current >= 0 else 0.0)
+            extra_cost = costs[option] - (costs[current] if current >= 0 else 0.0)
+            if extra_reduction > 0 and extra_cost > 0:
+                heapq.heappush(heap, (-extra_reduction / extra_cost, option, current))
+            elif extra_reduction > 0 and extra_cost <= remaining:
+                remaining -= extra_cost
+                chosen[row] = option
+            continue
+        extra_cost = costs[option] - (costs[current] if current >= 0 else 0.0)
+        if extra_cost <= remaining:
+            remaining -= extra_cost
+            chosen[row] = option
+    return np.array(sorted(chosen.values()), dtype=int)
+
+
+def optimize_retention(scoring_model, df, budget, risk_threshold=DEFAULT_RISK_THRESHOLD, raise_pct=DEFAULT_RAISE_PCT):
+    """Score counterfactuals and pick interventions within ``budget``
+
+    Returns ``(plan, summary)``: one plan row per treated employee, sorted by
+    risk reduction, and the headline numbers for the whole roster.
+    """
+    started = time.perf_counter()
+    baseline, options = score_interventions(scoring_model, df, risk_threshold, raise_pct)
+    scored = time.perf_counter()
+    plan = options.iloc[select_interventions(options, budget)] if len(options) else options
+
+    plan = plan.sort_values('reduction', ascending=False).reset_index(drop=True)
+    id_col = next((col for col in ID_COLUMNS if col in df.columns), None)
+    if id_col is not None:
+        plan.insert(0, id_col, df[id_col].to_numpy()[plan['row'].to_numpy(dtype=int)])
+
+    summary = {
+        'employees': len(df),
+        'at_risk': int((baseline >= risk_threshold).sum()),
+        'treated': len(plan),
+        'budget': float(budget),
+        'spent': float(plan['cost'].sum()),
+        'expected_exits_before': float(baseline.sum()),
+        'expected_exits_avoided': float(plan['reduction'].sum()),
+        'by_intervention': plan['intervention'].value_counts().to_dict(),
+        'options_scored': len(options),
+        'scoring_seconds': scored - started,
+        'total_seconds': time.perf_counter() - started,
+    }
+    return plan, summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Spend a retention budget where it removes the most attrition risk')
+    parser.add_argument('input', help='roster CSV or Parquet')
+    parser.add_argument('--budget', type=float, required=True, help='annual retention budget ($)')
+    parser.add_argument('-o', '--output', help='write the plan to this CSV')
+    parser.add_argument('--risk-threshold', type=float, default=DEFAULT_RISK_THRESHOLD)
+    parser.add_argument('--raise-pct', type=float, default=DEFAULT_RAISE_PCT)
+    parser.add_argument('--models-dir', default=DEFAULT_MODELS_DIR)
+    args = parser.parse_args()
+
+    scoring_model = load_scoring_model(args.models_dir)
+    if scoring_model is None:
+        raise SystemExit(f"❌ No trained model in {args.models_dir}; run train_model.py first")
+
+    if args.input.lower().endswith(('.parquet', '.pq')):
+        df = pd.read_parquet(args.input)
+    else:
+        df = pd.read_csv(args.input)
+
+    print(f"🚀 Optimizing a ${args.budget:,.0f} retention budget over {len(df):,} employees")
+    plan, summary = optimize_retention(scoring_model, df, args.budget, args.risk_threshold, args.raise_pct)
+
+    print(f"✅ {summary['treated']:,} of {summary['at_risk']:,} at-risk employees treated, "
+          f"${summary['spent']:,.0f} spent")
+    print(f"📉 Expected exits: {summary['expected_exits_before']:,.1f} → "
+          f"{summary['expected_exits_before'] - summary['expected_exits_avoided']:,.1f} "
+          f"({summary['expected_exits_avoided']:,.1f} avoided)")
+    for name, count in summary['by_intervention'].items():
+        print(f"   • {name}: {count:,}")
+    print(f"⏱️  {summary['options_scored']:,} options scored in {summary['scoring_seconds']:.1f}s, "
+          f"total {summary['total_seconds']:.1f}s")
+
+    if args.output:
+        plan.to_csv(args.output, index=False)
+        print(f"📋 Plan saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+"""Manager-level risk rollups over the roster's Supervisor hierarchy
+
+``OrgGraph`` resolves every employee's supervisor once per roster: to the
+employee of that name (or ID) when there is exactly one, otherwise to a
+manager node of its own, so supervisors missing from the export still get
+their team's figures. The hierarchy is kept as a parent array plus one
+depth-first numbering of the nodes, in which each manager's organisation is
+a contiguous range. Both are built level by level with array operations.
+After that no query walks the graph:
+
+* direct-report figures (span of control, team attrition, mean predicted
+  risk, high-risk reports) are ``np.bincount`` reductions over the parents
+* whole-organisation figures are prefix-sum differences over the DFS order
+* figures down to a given depth use one prefix sum per org level, so a
+  rollup ``depth`` levels deep costs O(depth) binary searches per manager
+"""
+import numpy as np
+import pandas as pd
+
+from attrition.delta import roster_id_column
+from attrition.scoring import RISK_THRESHOLDS
+
+SUPERVISOR_COLUMNS = ('Supervisor', 'ManagerID', 'ReportsTo')
+HIGH_RISK_THRESHOLD = RISK_THRESHOLDS[-1] / 100
+MEASURES = ('headcount', 'leavers', 'risk_total', 'scored', 'high_risk')
+
+
+def supervisor_column(df):
+    return next((col for col in SUPERVISOR_COLUMNS if col in df.columns), None)
+
+
+def _clean_labels(series, lower=False):
+    """Stripped text labels, cleaned once per distinct value"""
+    codes, uniques = pd.factorize(series)
+    labels = pd.Series(uniques).astype('string').str.strip().replace('', pd.NA)
+    if lower:
+        labels = labels.str.lower()
+    return pd.Series(pd.array(labels, dtype='string').take(codes, allow_fill=True), index=series.index)
+
+
+def _employee_keys(df):
+    """Lookup keys for resolving supervisors: full name first, then ID"""
+    keys = []
+    if 'FirstName' in df.columns and 'LastName' in df.columns:
+        keys.append(_clean_labels(pd.Series(_employee_labels(df)), lower=True))
+    id_col = roster_id_column(df)
+    if id_col is not None:
+        keys.append(_clean_labels(df[id_col].reset_index(drop=True), lower=True))
+    return keys
+
+
+def _employee_labels(df):
+    if 'FirstName' in df.columns and 'LastName' in df.columns:
+        names = df['FirstName'].astype('string').fillna('') + ' ' + df['LastName'].astype('string').fillna('')
+        return names.str.strip().to_numpy(dtype=object)
+    id_col = roster_id_column(df)
+    if id_col is not None:
+        return df[id_col].astype('string').fillna('').to_numpy(dtype=object)
+    return np.arange(len(df)).astype(str).astype(object)
+
+
+def _resolve(keys, supervisors):
+    """Row position each supervisor label names, or -1 (unknown or ambiguous)"""
+    resolved = np.full(len(supervisors), -1)
+    lookup = _clean_labels(supervisors, lower=True)
+    for key in keys:
+        unique = ~key.duplicated(keep=False).to_numpy() & key.notna().to_numpy()
+        index = pd.Index(key[unique])
+        match = index.get_indexer(lookup.fillna(''))
+        found = (match >= 0) & (resolved < 0)
+        resolved[found] = np.flatnonzero(unique)[match[found]]
+    return resolved
+
+
+def _break_cycles(parent):
+    """Cut one reporting line in each cycle (A reports to B reports to A)
+
+    Pointer doubling reaches a root within log2(n) rounds from every node
+    that has one; whatever is left is in, or hangs below, a cycle, and only
+    those nodes are walked one by one.
+    """
+    up = parent.copy()
+    for _ in range(int(np.ceil(np.log2(max(len(up), 2)))) + 1):
+        linked = up >= 0
+        if not linked.any():
+            return parent
+        up[linked] = up[up[linked]]
+    state = np.zeros(len(parent), dtype=np.int8)
+    for start in np.flatnonzero(up >= 0):
+        path = []
+        node = start
+        while node >= 0 and state[node] == 0:
+            state[node] = 1
+            path.append(node)
+            node = parent[node]
+        if node >= 0 and state[node] == 1:
+            parent[node] = -1
+        state[path] = 2
+    return parent
+
+
+def _depths(parent):
+    """Distance of every node from its root, by pointer doubling"""
+    depth = (parent >= 0).astype(np.int64)
+    up = parent.copy()
+    while True:
+        linked = np.flatnonzero(up >= 0)
+        if not len(linked):
+            return depth
+        depth[linked] += depth[up[linked]]
+        up[linked] = up[up[linked]]
+
+
+class OrgGraph:
+    """Supervisor -> reports index over one roster, with per-manager rollups"""
+
+    def __init__(self, df, risk=None, high_risk=HIGH_RISK_THRESHOLD):
+        self.supervisor_column = supervisor_column(df)
+        if self.supervisor_column is None:
+            raise ValueError('The roster has no Supervisor column')
+        n = len(df)
+        self.employees = n
+
+        supervisors = _clean_labels(df[self.supervisor_column]).reset_index(drop=True)
+        parent = _resolve(_employee_keys(df), supervisors)
+        external = np.flatnonzero((parent < 0) & supervisors.notna().to_numpy())
+        codes, outside = pd.factorize(_clean_labels(supervisors.iloc[external], lower=True))
+        first_label = supervisors.iloc[external].groupby(codes).first()
+        parent[external] = n + codes
+        parent = np.concatenate([parent, np.full(len(outside), -1)])
+        parent[np.flatnonzero(parent == np.arange(len(parent)))] = -1
+        self.parent = _break_cycles(parent)
+
+        self.labels = np.concatenate([_employee_labels(df), first_label.to_numpy(dtype=object)])
+        lookup = pd.Index(self.labels.astype(str)).str.lower()
+        unique = ~lookup.duplicated()
+        self._lookup, self._lookup_nodes = lookup[unique], np.flatnonzero(unique)
+
+        self.depth = _depths(self.parent)
+        self._number_nodes()
+        self._measures = self._node_measures(df, risk, high_risk)
+        self._prefix = np.vstack([np.zeros(len(MEASURES)), np.cumsum(self._measures[self.order], axis=0)])
+        self._levels = None
+
+    def _number_nodes(self):
+        """Depth-first numbering, one array pass per org level
+
+        Subtree sizes are summed from the deepest level up; then each level's
+        nodes are placed after their parent, behind the subtrees of their
+        earlier siblings.
+        """
+        nodes = len(self.parent)
+        by_depth = np.argsort(self.depth, kind='stable')
+        bounds = np.searchsorted(self.depth[by_depth], np.arange(self.depth.max() + 2))
+        levels = [by_depth[bounds[d]:bounds[d + 1]] for d in range(len(bounds) - 1)]
+
+        size = np.ones(nodes, dtype=np.int64)
+        for level in reversed(levels[1:]):
+            np.add.at(size, self.parent[level], size[level])
+
+        start = np.zeros(nodes, dtype=np.int64)
+        for d, level in enumerate(levels):
+            level = level[np.argsort(self.parent[level], kind='stable')]
+            before = np.cumsum(size[level]) - size[level]
+            if d == 0:
+                start[level] = before
+                continue
+            group = self.parent[level]
+            first = np.flatnonzero(np.r_[True, group[1:] != group[:-1]])
+            offset = before - np.repeat(before[first], np.diff(np.r_[first, len(level)]))
+            start[level] = start[group] + 1 + offset
+
+        self.size = size
+        self.start = start
+        self.order = np.empty(nodes, dtype=np.int64)
+        self.order[start] = np.arange(nodes)
+
+    def _node_measures(self, df, risk, high_risk):
+        measures = np.zeros((len(self.parent), len(MEASURES)))
+        n = self.employees
+        measures[:n, 0] = 1
+        if 'Attrition' in df.columns:
+            attrition = df['Attrition']
+            if attrition.dtype == object:
+                attrition = attrition.map({'Yes': 1, 'No': 0})
+            measures[:n, 1] = pd.to_numeric(attrition, errors='coerce').fillna(0).to_numpy()
+        if risk is not None:
+            risk = np.asarray(risk, dtype=float)
+            scored = ~np.isnan(risk)
+            measures[:n, 2] = np.where(scored, risk, 0)
+            measures[:n, 3] = scored
+            measures[:n, 4] = scored & (risk >= high_risk)
+        return measures
+
+    def _level_index(self):
+        """Per org level: DFS numbers of its nodes and their measure prefix sums"""
+        if self._levels is None:
+            self._levels = []
+            for d in range(self.depth.max() + 1):
+                nodes = np.flatnonzero(self.depth[self.order] == d)
+                prefix = np.vstack([np.zeros(len(MEASURES)), np.cumsum(self._measures[self.order[nodes]], axis=0)])
+                self._levels.append((nodes, prefix))
+        return self._levels
+
+    def _team_totals(self, managers, depth):
+        if depth == 1:
+            linked = self.parent >= 0
+            return np.column_stack([
+                np.bincount(self.parent[linked], weights=self._measures[linked, k], minlength=len(self.parent))[managers]
+                for k in range(len(MEASURES))
+            ])
+        first = self.start[managers] + 1
+        end = self.start[managers] + self.size[managers]
+        if depth is None:
+            return self._prefix[end] - self._prefix[first]
+
+        totals = np.zeros((len(managers), len(MEASURES)))
+        levels = self._level_index()
+        for step in range(1, depth + 1):
+            target = self.depth[managers] + step
+            for d in np.unique(target[target < len(levels)]):
+                rows = np.flatnonzero(target == d)
+                nodes, prefix = levels[d]
+                lo = np.searchsorted(nodes, first[rows])
+                hi = np.searchsorted(nodes, end[rows])
+                totals[rows] += prefix[hi] - prefix[lo]
+        return totals
+
+    def rollup(self, depth=1):
+        """Per-manager team figures, over reports up to ``depth`` levels down
+
+        ``depth=1`` is direct reports only, ``None`` the manager's whole
+        organisation.
+        """
+        if depth is not None and depth < 1:
+            raise ValueError('depth must be at least 1')
+        span = np.bincount(self.parent[self.parent >= 0], minlength=len(self.parent))
+        managers = np.flatnonzero(span > 0)
+        totals = self._team_totals(managers, depth)
+        team = dict(zip(MEASURES, totals.T))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            attrition_rate = team['leavers'] / team['headcount']
+            mean_risk = team['risk_total'] / team['scored']
+        return pd.DataFrame({
+            'manager': self.labels[managers],
+            'in_roster': managers < self.employees,
+            'level': self.depth[managers],
+            'span_of_control': span[managers],
+            'team_size': team['headcount'].astype(int),
+            'leavers': team['leavers'].astype(int),
+            'attrition_rate': attrition_rate,
+            'mean_risk': mean_risk,
+            'high_risk_reports': team['high_risk'].astype(int),
+        }, index=pd.Index(managers, name='node'))
+
+    def find(self, name):
+        """Node of the employee or supervisor called ``name``, or None"""
+        match = self._lookup.get_indexer([str(name).strip().lower()])[0]
+        return int(self._lookup_nodes[match]) if match >= 0 else None
+
+    def team(self, node, depth=None):
+        """Roster row positions of the reports under ``node``, in DFS order"""
+        members = self.order[self.start[node] + 1:self.start[node] + self.size[node]]
+        if depth is not None:
+            members = members[self.depth[members] <= self.depth[node] + depth]
+        return members[members < self.employees]
@@ -0,0 +1,268 @@
+"""Per-call timing of the dashboard renderers, ingestion and scoring
+
+Functions wrapped with ``@profiled`` (or blocks in ``with profile_section``)
+record wall time, CPU time of the calling thread and, when ``tracemalloc`` is
+tracing, the peak memory allocated during the call. The most recent calls are
+kept in a fixed-size ring buffer for the dashboard's admin panel. Running
+totals and a wall-time histogram per function are exported in the Prometheus
+text format:
+
+* ``ATTRITION_METRICS_FILE``: written at most every
+  ``ATTRITION_METRICS_INTERVAL`` seconds, for node_exporter's textfile
+  collector
+* ``ATTRITION_METRICS_PORT``: ``start_metrics_server`` serves ``/metrics``
+  from the process (the scoring service has its own
+  ``/metrics/prometheus`` route)
+* ``ATTRITION_PROFILE_MEMORY=1`` starts ``tracemalloc`` at import. Tracing
+  slows Python allocation noticeably, so it is off by default and can also
+  be switched on from the admin panel while investigating.
+
+Peak memory is measured with ``tracemalloc.reset_peak``. A nested profiled
+call hands the peak it saw back to its caller, so the figures stay right for
+nested calls in one thread; calls running at the same time in other threads
+can inflate each other's peaks.
+"""
+import functools
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+
+RING_SIZE = int(os.environ.get('ATTRITION_PROFILE_RING_SIZE', 2048))
+METRICS_FILE = os.environ.get('ATTRITION_METRICS_FILE')
+METRICS_INTERVAL = float(os.environ.get('ATTRITION_METRICS_INTERVAL', 15))
+WALL_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+METRIC_PREFIX = 'attrition'
+
+
+class CallRecord:
+    """One profiled call"""
+
+    __slots__ = ('name', 'started_at', 'wall', 'cpu', 'peak_bytes', 'failed')
+
+    def __init__(self, name, started_at, wall, cpu, peak_bytes, failed):
+        self.name = name
+        self.started_at = started_at
+        self.wall = wall
+        self.cpu = cpu
+        self.peak_bytes = peak_bytes
+        self.failed = failed
+
+    def as_dict(self):
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+
+class Profiler:
+    """Ring buffer of recent calls plus cumulative per-function totals"""
+
+    def __init__(self, ring_size=RING_SIZE, metrics_file=METRICS_FILE, metrics_interval=METRICS_INTERVAL):
+        self.calls = deque(maxlen=ring_size)
+        self.totals = {}
+        self.metrics_file = metrics_file
+        self.metrics_interval = metrics_interval
+        self._last_export = 0.0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stack(self):
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+        return self._local.stack
+
+    @contextmanager
+    def section(self, name):
+        stack = self._stack()
+        tracing = tracemalloc.is_tracing()
+        frame = {'peak': 0, 'base': 0}
+        if tracing:
+            current, peak = tracemalloc.get_traced_memory()
+            if stack:
+                stack[-1]['peak'] = max(stack[-1]['peak'], peak)
+            tracemalloc.reset_peak()
+            frame['base'] = current
+        stack.append(frame)
+
+        started_at = time.time()
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        failed = False
+        try:
+            yield
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.thread_time() - cpu_start
+            stack.pop()
+            peak_bytes = None
+            if tracing and tracemalloc.is_tracing():
+                peak = max(frame['peak'], tracemalloc.get_traced_memory()[1])
+                peak_bytes = max(peak - frame['base'], 0)
+                if stack:
+                    stack[-1]['peak'] = max(stack[-1]['peak'], peak)
+            self.record(CallRecord(name, started_at, wall, cpu, peak_bytes, failed))
+
+    def record(self, call):
+        with self._lock:
+            self.calls.append(call)
+            totals = self.totals.get(call.name)
+            if totals is None:
+                totals = self.totals[call.name] = {
+                    'calls': 0, 'errors': 0, 'wall': 0.0, 'cpu': 0.0, 'max_wall': 0.0,
+                    'max_peak_bytes': 0, 'buckets': [0] * len(WALL_BUCKETS),
+                }
+            totals['calls'] += 1
+            totals['errors'] += call.failed
+            totals['wall'] += call.wall
+            totals['cpu'] += call.cpu
+            totals['max_wall'] = max(totals['max_wall'], call.wall)
+            if call.peak_bytes is not None:
+                totals['max_peak_bytes'] = max(totals['max_peak_bytes'], call.peak_bytes)
+            for i, bound in enumerate(WALL_BUCKETS):
+                if call.wall <= bound:
+                    totals['buckets'][i] += 1
+            due = self.metrics_file and time.monotonic() - self._last_export >= self.metrics_interval
+            if due:
+                self._last_export = time.monotonic()
+        if due:
+            self.write_prometheus(self.metrics_file)
+
+    def recent(self, limit=None):
+        """The latest calls, newest first, as dicts"""
+        with self._lock:
+            calls = list(self.calls)
+        calls.reverse()
+        return [call.as_dict() for call in calls[:limit]]
+
+    def summary(self):
+        """Per-function totals, slowest total wall time first"""
+        with self._lock:
+            totals = {name: dict(values) for name, values in self.totals.items()}
+        rows = []
+        for name, values in totals.items():
+            rows.append({
+                'function': name,
+                'calls': values['calls'],
+                'errors': values['errors'],
+                'total_wall_s': values['wall'],
+                'mean_wall_ms': 1000 * values['wall'] / values['calls'],
+                'max_wall_ms': 1000 * values['max_wall'],
+                'mean_cpu_ms': 1000 * values['cpu'] / values['calls'],
+                'max_peak_mb': values['max_peak_bytes'] / 2 ** 20,
+            })
+        return sorted(rows, key=lambda row: row['total_wall_s'], reverse=True)
+
+    def reset(self):
+        with self._lock:
+            self.calls.clear()
+            self.totals.clear()
+
+    def prometheus_text(self, extra_gauges=None):
+        """Totals in the Prometheus text exposition format (version 0.0.4)
+
+        ``extra_gauges`` maps further metric names (without the prefix) to
+        values, for process-level figures such as the scoring queue depth.
+        """
+        with self._lock:
+            totals = {name: dict(values, buckets=list(values['buckets'])) for name, values in self.totals.items()}
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f"# HELP {METRIC_PREFIX}_{name} {help_text}")
+            lines.append(f"# TYPE {METRIC_PREFIX}_{name} {kind}")
+            for suffix, labels, value in samples:
+                label_text = ','.join(f'{key}="{_escape(val)}"' for key, val in labels.items())
+                lines.append(f"{METRIC_PREFIX}_{name}{suffix}{{{label_text}}} {value}" if labels
+                             else f"{METRIC_PREFIX}_{name}{suffix} {value}")
+
+        def per_function(field):
+            return [('', {'function': name}, values[field]) for name, values in totals.items()]
+
+        metric('calls_total', 'counter', 'Profiled calls per function.', per_function('calls'))
+        metric('call_errors_total', 'counter', 'Profiled calls that raised.', per_function('errors'))
+        metric('call_cpu_seconds_total', 'counter', 'Thread CPU time spent in profiled calls.', per_function('cpu'))
+        metric('call_peak_bytes_max', 'gauge', 'Largest allocation peak of one call (0 without tracemalloc).',
+               per_function('max_peak_bytes'))
+
+        histogram = []
+        for name, values in totals.items():
+            for bound, count in zip(WALL_BUCKETS, values['buckets']):
+                histogram.append(('_bucket', {'function': name, 'le': bound}, count))
+            histogram.append(('_bucket', {'function': name, 'le': '+Inf'}, values['calls']))
+            histogram.append(('_sum', {'function': name}, values['wall']))
+            histogram.append(('_count', {'function': name}, values['calls']))
+        metric('call_wall_seconds', 'histogram', 'Wall-clock time of profiled calls.', histogram)
+
+        for name, value in (extra_gauges or {}).items():
+            metric(name, 'gauge', name.replace('_', ' ').capitalize() + '.', [('', {}, value)])
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path):
+        """Replace ``path`` atomically, as textfile collectors expect"""
+        tmp_path = f"{path}.tmp-{os.getpid()}"
+        with open(tmp_path, 'w') as f:
+            f.write(self.prometheus_text())
+        os.replace(tmp_path, path)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+PROFILER = Profiler()
+
+if os.environ.get('ATTRITION_PROFILE_MEMORY') == '1' and not tracemalloc.is_tracing():
+    tracemalloc.start()
+
+
+def profile_section(name):
+    """Context manager recording one block under ``name``"""
+    return PROFILER.section(name)
+
+
+def profiled(func=None, name=None):
+    """Record every call of the decorated function; usable bare or as ``@profiled(name=...)``"""
+    if func is None:
+        return functools.partial(profiled, name=name)
+    label = name or f"{func.__module__.rsplit('.', 1)[-1]}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with PROFILER.section(label):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def set_memory_tracing(enabled):
+    if enabled and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    elif not enabled and tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def start_metrics_server(port, host='127.0.0.1'):
+    """Serve ``GET /metrics`` from a daemon thread; returns the server"""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?')[0] != '/metrics':
+                self.send_error(404)
+                return
+            body = PROFILER.prometheus_text().encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, name='attrition-metrics', daemon=True).start()
+    print(f"📈 Profiling metrics on http://{host}:{port}/metrics")
+    return server
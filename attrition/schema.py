@@ -0,0 +1,142 @@
+"""Declarative mapping of HRIS exports onto the dashboard's column schema
+
+The rules below say which source columns are aliases of which canonical
+column, which columns hold dates, how to read binary flags, and which
+columns can be derived from others. ``compile_schema`` turns the rules into
+a plan for one header signature (the tuple of column names), cached so that
+re-uploads of the same export skip straight to ``SchemaPlan.apply``, which
+transforms whole columns at once.
+"""
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from attrition.trends import parse_dates
+
+# Canonical name -> source names, first match wins
+COLUMN_ALIASES = {
+    'EmployeeID': ['EmpID', 'EmployeeNumber', 'Employee_ID'],
+    'Attrition': ['LeaveOrNot', 'left', 'quit', 'turnover'],
+    'Department': ['DepartmentType'],
+    'JobTitle': ['Title'],
+    'PerformanceScore': ['Performance Score'],
+    'PerformanceRating': ['Current Employee Rating'],
+}
+
+DATE_COLUMNS = ['StartDate', 'ExitDate', 'DOB']
+
+BINARY_VALUES = {
+    'Attrition': {'Yes': 1, 'No': 0, 'yes': 1, 'no': 0, 'True': 1, 'False': 0},
+}
+
+# EmployeeStatus values meaning the employee has left
+EXITED_STATUSES = ('Voluntarily Terminated', 'Terminated for Cause')
+
+
+def _as_of(df):
+    """Latest employment event in the roster; ages and tenures are measured to it"""
+    dates = [df[col].max() for col in ('StartDate', 'ExitDate') if col in df.columns]
+    dates = [date for date in dates if pd.notna(date)]
+    return max(dates) if dates else pd.Timestamp.now().normalize()
+
+
+def _years_between(start, end):
+    return np.floor((end - start).dt.days / 365.25)
+
+
+def _derive_attrition(df):
+    exited = pd.Series(False, index=df.index)
+    if 'ExitDate' in df.columns:
+        exited |= df['ExitDate'].notna()
+    if 'EmployeeStatus' in df.columns:
+        exited |= df['EmployeeStatus'].isin(EXITED_STATUSES)
+    return exited.astype(int)
+
+
+def _derive_age(df):
+    return _years_between(df['DOB'], pd.Series(_as_of(df), index=df.index)).astype('Int64')
+
+
+def _derive_tenure(df):
+    end = df['ExitDate'].fillna(_as_of(df)) if 'ExitDate' in df.columns else pd.Series(_as_of(df), index=df.index)
+    return _years_between(df['StartDate'], end).clip(lower=0).astype('Int64')
+
+
+# Target -> (any one of these source columns is enough, derivation). Only
+# applied when the target column is missing from the export.
+DERIVED_COLUMNS = {
+    'Attrition': (['ExitDate', 'EmployeeStatus'], _derive_attrition),
+    'Age': (['DOB'], _derive_age),
+    'YearsAtCompany': (['StartDate'], _derive_tenure),
+}
+
+
+def _strip_labels(series):
+    """Strip surrounding whitespace, working on the distinct values only"""
+    codes, uniques = pd.factorize(series)
+    if pd.api.types.infer_dtype(uniques, skipna=True) != 'string':
+        return series
+    stripped = uniques.str.strip()
+    if stripped.equals(uniques):
+        return series
+    # Missing values have code -1, which picks the trailing NaN
+    values = np.append(stripped.to_numpy(dtype=object), np.nan)
+    return pd.Series(values[codes], index=series.index, name=series.name)
+
+
+class SchemaPlan:
+    """The resolved mapping for one header signature"""
+
+    def __init__(self, renames, dates, binaries, derivations):
+        self.renames = renames
+        self.dates = dates
+        self.binaries = binaries
+        self.derivations = derivations
+
+    def apply(self, df):
+        df = df.rename(columns=self.renames) if self.renames else df.copy()
+
+        # Trailing spaces in category labels ('Production       ') would split
+        # one group into several in every chart
+        for col in df.select_dtypes(include=['object']).columns:
+            df[col] = _strip_labels(df[col])
+
+        for col in self.dates:
+            df[col] = parse_dates(df[col])
+
+        for col in self.binaries:
+            if df[col].dtype == 'object':
+                df[col] = df[col].map(BINARY_VALUES[col])
+            df[col] = df[col].fillna(0)
+
+        for col, derive in self.derivations:
+            df[col] = derive(df)
+        return df
+
+
+@lru_cache(maxsize=64)
+def compile_schema(columns):
+    """Resolve the rules against a tuple of column names"""
+    present = set(columns)
+    renames = {}
+    for canonical, aliases in COLUMN_ALIASES.items():
+        if canonical in present:
+            continue
+        source = next((alias for alias in aliases if alias in present), None)
+        if source is not None:
+            renames[source] = canonical
+    mapped = {renames.get(col, col) for col in columns}
+
+    dates = [col for col in DATE_COLUMNS if col in mapped]
+    binaries = [col for col in BINARY_VALUES if col in mapped]
+    derivations = [
+        (target, derive) for target, (sources, derive) in DERIVED_COLUMNS.items()
+        if target not in mapped and any(source in mapped for source in sources)
+    ]
+    return SchemaPlan(renames, dates, binaries, derivations)
+
+
+def adapt_schema(df):
+    """Map an HRIS export onto the canonical columns in one pass"""
+    return compile_schema(tuple(df.columns)).apply(df)
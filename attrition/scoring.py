@@ -0,0 +1,241 @@
+"""Vectorized scoring core: calibrated attrition probabilities with tree-vote spread bands"""
+import json
+import os
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.isotonic import IsotonicRegression
+from sklearn.linear_model import LogisticRegression
+
+from attrition.features import CATEGORICAL_FEATURES, FEATURE_COLUMNS, NUMERICAL_FEATURES
+from attrition.profiling import profiled
+
+DEFAULT_MODELS_DIR = 'models'
+INTERVAL_PERCENTILES = (2.5, 97.5)
+
+# Same cut-offs as the dashboard's prediction card (percent scale)
+RISK_LEVELS = ('LOW', 'MODERATE', 'CRITICAL')
+RISK_THRESHOLDS = (40, 70)
+
+# The dashboard form and most HRIS exports use shorter department names than
+# the training data; anything still unknown falls back to the training mode.
+DEPARTMENT_ALIASES = {
+    'Engineering': 'Research & Development',
+    'R&D': 'Research & Development',
+    'HR': 'Human Resources',
+}
+
+
+class ProbabilityCalibrator:
+    """Monotone map from raw forest probability to calibrated probability
+
+    Both methods are reduced to a lookup table at fit time, so applying the
+    calibration is a single ``np.interp`` over however many rows are passed.
+    """
+
+    def __init__(self, method='isotonic', grid_size=201):
+        if method not in ('isotonic', 'sigmoid'):
+            raise ValueError(f"Unknown calibration method: {method}")
+        self.method = method
+        self.grid_size = grid_size
+        self.x_ = None
+        self.y_ = None
+
+    def fit(self, raw_proba, y):
+        raw_proba = np.asarray(raw_proba, dtype=np.float64)
+        if self.method == 'isotonic':
+            iso = IsotonicRegression(y_min=0.0, y_max=1.0, out_of_bounds='clip')
+            iso.fit(raw_proba, y)
+            self.x_ = iso.X_thresholds_
+            self.y_ = iso.y_thresholds_
+        else:
+            # Platt scaling, tabulated on a fixed grid over [0, 1]
+            platt = LogisticRegression()
+            platt.fit(raw_proba.reshape(-1, 1), y)
+            self.x_ = np.linspace(0.0, 1.0, self.grid_size)
+            self.y_ = platt.predict_proba(self.x_.reshape(-1, 1))[:, 1]
+        return self
+
+    def transform(self, raw_proba):
+        return np.interp(raw_proba, self.x_, self.y_)
+
+
+def fit_calibrator(model, X_cal, y_cal, method='isotonic'):
+    """Fit a calibrator on held-out rows the forest was not trained on"""
+    raw = model.predict_proba(X_cal)[:, 1]
+    return ProbabilityCalibrator(method).fit(raw, np.asarray(y_cal))
+
+
+def risk_levels(probability):
+    """Map probabilities in [0, 1] to the dashboard's LOW/MODERATE/CRITICAL labels"""
+    codes = np.searchsorted(RISK_THRESHOLDS, np.asarray(probability) * 100, side='right')
+    return np.asarray(RISK_LEVELS, dtype=object)[codes]
+
+
+def feature_defaults(df):
+    """Training-set fill values for features missing from a scoring request"""
+    return {
+        'numerical': {col: float(df[col].median()) for col in NUMERICAL_FEATURES},
+        'categorical': {col: str(df[col].mode().iloc[0]) for col in CATEGORICAL_FEATURES},
+    }
+
+
+class ScoringModel:
+    """The trained forest plus everything needed to score raw employee rows"""
+
+    def __init__(self, model, scaler, le_dept, le_role, calibrator=None, defaults=None):
+        self.model = model
+        self.scaler = scaler
+        self.encoders = {'Department': le_dept, 'JobRole': le_role}
+        self.calibrator = calibrator
+        self.defaults = defaults or {'numerical': {}, 'categorical': {}}
+        self._trees = list(model.estimators_)
+        self._explainer = None
+
+    def encode(self, df):
+        """Turn raw employee rows into the scaled float32 model matrix"""
+        n = len(df)
+        X = np.empty((n, len(FEATURE_COLUMNS)), dtype=np.float32)
+
+        for j, col in enumerate(NUMERICAL_FEATURES):
+            fill = self.defaults['numerical'].get(col, 0.0)
+            if col not in df.columns:
+                X[:, j] = fill
+                continue
+            values = df[col]
+            if col == 'OverTime' and values.dtype == object:
+                # Map the labels but keep numbers; rows can mix 1/0 and
+                # Yes/No, e.g. when the scheduler batches several requests
+                values = values.replace({'Yes': 1, 'No': 0, 'yes': 1, 'no': 0})
+            X[:, j] = pd.to_numeric(values, errors='coerce').fillna(fill).to_numpy()
+
+        n_num = len(NUMERICAL_FEATURES)
+        X[:, :n_num] = self.scaler.transform(X[:, :n_num])
+
+        for j, col in enumerate(CATEGORICAL_FEATURES, start=n_num):
+            classes = self.encoders[col].classes_
+            fill = self.defaults['categorical'].get(col, classes[0])
+            if col in df.columns:
+                values = df[col].astype(str).str.strip()
+                if col == 'Department':
+                    values = values.replace(DEPARTMENT_ALIASES)
+            else:
+                values = pd.Series(fill, index=df.index)
+            # classes_ is sorted, so one searchsorted encodes the whole column
+            codes = np.searchsorted(classes, values.to_numpy())
+            codes = np.clip(codes, 0, len(classes) - 1)
+            unknown = classes[codes] != values.to_numpy()
+            codes[unknown] = np.searchsorted(classes, fill)
+            X[:, j] = codes
+        return X
+
+    def tree_probabilities(self, X):
+        """Per-tree positive-class probabilities, shape (n_trees, n_rows)"""
+        votes = np.empty((len(self._trees), len(X)), dtype=np.float64)
+        for t, tree in enumerate(self._trees):
+            votes[t] = tree.predict_proba(X, check_input=False)[:, 1]
+        return votes
+
+    @profiled
+    def score_matrix(self, X):
+        """Score an encoded matrix in one pass over the trees
+
+        The forest probability is the mean of the per-tree votes (exactly what
+        ``predict_proba`` computes); the band is the middle 95% of the votes.
+        The single percentile call is the only work beyond plain scoring.
+        The bounds are first widened to include the mean vote, which a skewed
+        vote split can leave outside them, and then mapped through the same
+        monotone calibrator as the point estimate, so the band is on the
+        reported probability scale and always contains it. This is a spread
+        of tree votes, not a confidence interval: it is zero width when the
+        trees agree and can span most of [0, 1] when they split.
+        """
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        votes = self.tree_probabilities(X)
+        raw = votes.mean(axis=0)
+        lower, upper = np.percentile(votes, INTERVAL_PERCENTILES, axis=0)
+        lower = np.minimum(lower, raw)
+        upper = np.maximum(upper, raw)
+        probability = raw
+        if self.calibrator is not None:
+            probability = self.calibrator.transform(raw)
+            lower = self.calibrator.transform(lower)
+            upper = self.calibrator.transform(upper)
+        return {
+            'probability': probability,
+            'lower': lower,
+            'upper': upper,
+            'raw_probability': raw,
+        }
+
+    @profiled
+    def score(self, df):
+        """Encode and score a DataFrame of raw employee rows"""
+        return self.score_matrix(self.encode(df))
+
+    @property
+    def explainer(self):
+        if self._explainer is None:
+            from attrition.explain import ForestExplainer
+            self._explainer = ForestExplainer(self.model)
+        return self._explainer
+
+    @profiled
+    def explain_matrix(self, X):
+        """Per-feature risk contributions for an encoded matrix
+
+        Path contributions explain the raw forest probability. When a
+        calibrator is present they are rescaled per row so that ``base`` plus
+        the row's contributions equals the calibrated probability reported
+        by ``score_matrix``.
+        """
+        contributions = self.explainer.contributions(X)
+        base = self.explainer.bias
+        if self.calibrator is not None:
+            raw_delta = contributions.sum(axis=1)
+            calibrated_base = float(self.calibrator.transform(base))
+            calibrated_delta = self.calibrator.transform(base + raw_delta) - calibrated_base
+            scale = np.divide(calibrated_delta, raw_delta, out=np.ones_like(raw_delta),
+                              where=np.abs(raw_delta) > 1e-12)
+            contributions = contributions * scale[:, None]
+            base = calibrated_base
+        return {'base': base, 'contributions': contributions}
+
+    def explain(self, df):
+        """Encode ``df`` and explain each row's risk by model feature"""
+        return self.explain_matrix(self.encode(df))
+
+
+def save_scoring_artifacts(calibrator, defaults, models_dir=DEFAULT_MODELS_DIR):
+    """Persist the calibration layer alongside the model from train_model.py"""
+    joblib.dump(calibrator, os.path.join(models_dir, 'calibrator.pkl'))
+    with open(os.path.join(models_dir, 'feature_defaults.json'), 'w') as f:
+        json.dump(defaults, f, indent=2)
+
+
+def load_scoring_model(models_dir=DEFAULT_MODELS_DIR):
+    """Load the trained model bundle, or return None if it has not been trained"""
+    model_path = os.path.join(models_dir, 'attrition_model.pkl')
+    if not os.path.exists(model_path):
+        return None
+
+    calibrator = None
+    calibrator_path = os.path.join(models_dir, 'calibrator.pkl')
+    if os.path.exists(calibrator_path):
+        calibrator = joblib.load(calibrator_path)
+
+    defaults = None
+    defaults_path = os.path.join(models_dir, 'feature_defaults.json')
+    if os.path.exists(defaults_path):
+        with open(defaults_path) as f:
+            defaults = json.load(f)
+
+    return ScoringModel(
+        joblib.load(model_path),
+        joblib.load(os.path.join(models_dir, 'scaler.pkl')),
+        joblib.load(os.path.join(models_dir, 'label_encoder_dept.pkl')),
+        joblib.load(os.path.join(models_dir, 'label_encoder_role.pkl')),
+        calibrator=calibrator,
+        defaults=defaults,
+    )
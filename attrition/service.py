@@ -0,0 +1,566 @@
+"""Headless HTTP batch-scoring service
+
+Runs next to the Streamlit UI and shares its scoring core::
+
+    python -m attrition.service --port 8080
+
+Endpoints:
+
+* ``GET /health``: liveness and model status
+* ``GET /metrics``: micro-batching counters (queue depth, batch sizes, waits)
+* ``GET /metrics/prometheus``: profiled scoring calls and the batching
+  counters in the Prometheus text format
+* ``POST /score``: a JSON list of employees (or ``{"employees": [...]}``) or
+  a CSV body; answers in the same format
+* ``POST /score/stream``: NDJSON in, NDJSON out, one result line per input
+  line, written back while the request is still being uploaded; a line that
+  does not parse gets ``{"line": n, "error": ...}`` in its place
+* ``GET /api/employees``: one page of the scored roster for the Next.js
+  employee table (``q``, ``department``, ``risk``, ``sort``, ``order``,
+  ``limit``, ``cursor``), as JSON or, with
+  ``Accept: application/vnd.apache.arrow.stream``, as Arrow IPC
+* ``GET /api/employees/facets``: departments and risk levels with counts
+* ``POST /api/predict``: the prediction form's values in, a risk estimate
+  with its drivers and recommendations out
+
+``/api`` responses are gzip-compressed when the client accepts it and carry
+CORS headers so the frontend can call the service from another origin.
+
+Requests from all connections go through one BatchScheduler, so concurrent
+small requests are scored together in one vectorized call.
+"""
+import argparse
+import asyncio
+import gzip
+import io
+import json
+import os
+from urllib.parse import parse_qsl
+
+import numpy as np
+import pandas as pd
+
+from attrition.api import QueryError, RosterAPI, prediction_frame, prediction_response
+from attrition.batching import BatchScheduler
+from attrition.profiling import PROFILER
+from attrition.scoring import DEFAULT_MODELS_DIR, load_scoring_model, risk_levels
+from attrition.storage import DEFAULT_DB_PATH, RosterStore
+
+ID_COLUMNS = ('EmployeeID', 'EmpID')
+STREAM_CHUNK_ROWS = 256
+STREAM_FLUSH_SECONDS = 0.002
+# Lines read ahead of the batcher, and batches scored ahead of the writer;
+# past these the body is no longer read, so TCP pushes back on the client
+STREAM_QUEUED_LINES = 2 * STREAM_CHUNK_ROWS
+STREAM_QUEUED_BATCHES = 4
+MAX_BODY_BYTES = 512 * 1024 * 1024
+GZIP_MIN_BYTES = 1024
+ARROW_STREAM = 'application/vnd.apache.arrow.stream'
+QUERY_PARAMS = ('q', 'department', 'risk', 'sort', 'order', 'limit', 'cursor')
+
+REASONS = {
+    200: 'OK', 204: 'No Content', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+    411: 'Length Required', 413: 'Payload Too Large', 500: 'Internal Server Error',
+    503: 'Service Unavailable',
+}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class Request:
+    """Parsed request line and headers; the body is read on demand"""
+
+    def __init__(self, method, path, headers, reader, query=None):
+        self.method = method
+        self.path = path
+        self.headers = headers
+        self.reader = reader
+        self.query = query or {}
+
+    @property
+    def content_type(self):
+        return self.headers.get('content-type', '').split(';')[0].strip().lower()
+
+    @property
+    def keep_alive(self):
+        return self.headers.get('connection', '').lower() != 'close'
+
+    async def chunks(self):
+        """Yield the raw body as it arrives (Content-Length or chunked)"""
+        if self.headers.get('transfer-encoding', '').lower() == 'chunked':
+            while True:
+                size_line = await self.reader.readline()
+                size = int(size_line.split(b';')[0].strip() or b'0', 16)
+                if size == 0:
+                    # Skip trailers up to the terminating blank line
+                    while (await self.reader.readline()) not in (b'\r\n', b'\n', b''):
+                        pass
+                    return
+                data = await self.reader.readexactly(size)
+                await self.reader.readline()
+                yield data
+        elif 'content-length' in self.headers:
+            remaining = int(self.headers['content-length'])
+            if remaining > MAX_BODY_BYTES:
+                raise HTTPError(413, 'Request body too large')
+            while remaining > 0:
+                data = await self.reader.read(min(remaining, 1 << 16))
+                if not data:
+                    raise HTTPError(400, 'Truncated request body')
+                remaining -= len(data)
+                yield data
+        elif self.method == 'POST':
+            raise HTTPError(411, 'Content-Length or chunked encoding required')
+
+    async def body(self):
+        parts = []
+        total = 0
+        async for data in self.chunks():
+            total += len(data)
+            if total > MAX_BODY_BYTES:
+                raise HTTPError(413, 'Request body too large')
+            parts.append(data)
+        return b''.join(parts)
+
+    async def lines(self):
+        """Yield complete body lines, e.g. for NDJSON"""
+        pending = b''
+        async for data in self.chunks():
+            pending += data
+            *complete, pending = pending.split(b'\n')
+            for line in complete:
+                yield line
+        if pending:
+            yield pending
+
+
+async def read_request(reader):
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+    try:
+        method, target, _ = request_line.decode('latin-1').rstrip('\r\n').split(' ', 2)
+    except ValueError:
+        raise HTTPError(400, 'Malformed request line')
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    path, _, query = target.partition('?')
+    return Request(method.upper(), path, headers, reader, dict(parse_qsl(query)))
+
+
+def _response_head(status, content_type, extra):
+    lines = [f"HTTP/1.1 {status} {REASONS.get(status, '')}", f"Content-Type: {content_type}"]
+    lines += [f"{name}: {value}" for name, value in extra.items()]
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+
+
+async def send_response(writer, status, body, content_type='application/json', keep_alive=True, headers=None):
+    if isinstance(body, (dict, list)):
+        body = json.dumps(body).encode()
+    elif isinstance(body, str):
+        body = body.encode()
+    writer.write(_response_head(status, content_type, {
+        **(headers or {}),
+        'Content-Length': len(body),
+        'Connection': 'keep-alive' if keep_alive else 'close',
+    }) + body)
+    await writer.drain()
+
+
+def arrow_stream(frame):
+    """``frame`` as an Arrow IPC stream, or None without pyarrow"""
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return None
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as stream:
+        stream.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _id_column(df):
+    return next((col for col in ID_COLUMNS if col in df.columns), None)
+
+
+def results_frame(df, scores):
+    """Scores for ``df`` as a DataFrame, keeping the employee id if present"""
+    out = pd.DataFrame({
+        'probability': np.round(scores['probability'], 6),
+        'lower': np.round(scores['lower'], 6),
+        'upper': np.round(scores['upper'], 6),
+        'risk_level': risk_levels(scores['probability']),
+    })
+    id_col = _id_column(df)
+    if id_col is not None:
+        out.insert(0, id_col, df[id_col].to_numpy())
+    return out
+
+
+def parse_csv(body):
+    """A CSV request body as a DataFrame; HTTPError 400 if it does not parse"""
+    try:
+        return pd.read_csv(io.BytesIO(body))
+    except pd.errors.EmptyDataError:
+        return pd.DataFrame()
+    except (pd.errors.ParserError, UnicodeDecodeError, ValueError) as e:
+        raise HTTPError(400, f"Body is not valid CSV: {e}")
+
+
+def parse_records(body):
+    """A JSON list of employees (or ``{"employees": [...]}``) as a DataFrame"""
+    try:
+        payload = json.loads(body or b'[]')
+    except ValueError:
+        raise HTTPError(400, 'Body is not valid JSON')
+    records = payload.get('employees') if isinstance(payload, dict) else payload
+    if not isinstance(records, list):
+        raise HTTPError(400, 'Expected a list of employees or {"employees": [...]}')
+    if not all(isinstance(record, dict) for record in records):
+        raise HTTPError(400, 'Every employee must be a JSON object')
+    try:
+        return pd.DataFrame.from_records(records)
+    except (TypeError, ValueError) as e:
+        raise HTTPError(400, f"Employees are not valid records: {e}")
+
+
+def parse_lines(lines):
+    """Parse ``(line number, NDJSON line)`` pairs one at a time
+
+    Returns the records that parse as a DataFrame, plus an error record for
+    each line that does not, keyed by its position in ``lines``.
+    """
+    records, errors = [], {}
+    for position, (number, line) in enumerate(lines):
+        try:
+            record = json.loads(line)
+        except ValueError:
+            errors[position] = {'line': number, 'error': 'Line is not valid JSON'}
+            continue
+        if not isinstance(record, dict):
+            errors[position] = {'line': number, 'error': 'Line is not a JSON object'}
+            continue
+        records.append(record)
+    return pd.DataFrame.from_records(records), errors
+
+
+class ScoringService:
+    """Routes requests to handlers; holds the warm model and the scheduler"""
+
+    def __init__(self, scoring_model, max_batch_rows=1024, max_wait_ms=5.0, roster_api=None, cors_origin='*'):
+        self.scoring_model = scoring_model
+        self.scheduler = BatchScheduler(scoring_model.score, max_batch_rows, max_wait_ms)
+        self.roster_api = roster_api
+        self.cors_origin = cors_origin
+
+    def warm_up(self):
+        """Touch every tree once so the first real request is not the slow one"""
+        self.scheduler.score(pd.DataFrame(index=[0]))
+
+    async def score_frame(self, df):
+        return await asyncio.wrap_future(self.scheduler.submit(df))
+
+    async def run_blocking(self, func, *args):
+        """Run parsing or explaining off the event loop, as scoring already is"""
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request = await read_request(reader)
+                except HTTPError as e:
+                    await send_response(writer, e.status, {'error': str(e)}, keep_alive=False)
+                    return
+                if request is None:
+                    return
+                try:
+                    await self.dispatch(request, writer)
+                except HTTPError as e:
+                    # /api errors must carry CORS headers or the browser hides them
+                    headers = self._cors_headers() if request.path.startswith('/api/') else None
+                    await send_response(writer, e.status, {'error': str(e)}, keep_alive=False, headers=headers)
+                    return
+                except Exception as e:
+                    await send_response(writer, 500, {'error': str(e)}, keep_alive=False)
+                    return
+                if not request.keep_alive:
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def dispatch(self, request, writer):
+        routes = {
+            '/health': ('GET', self.handle_health),
+            '/metrics': ('GET', self.handle_metrics),
+            '/metrics/prometheus': ('GET', self.handle_prometheus),
+            '/score': ('POST', self.handle_score),
+            '/score/stream': ('POST', self.handle_stream),
+            '/api/employees': ('GET', self.handle_employees),
+            '/api/employees/facets': ('GET', self.handle_facets),
+            '/api/predict': ('POST', self.handle_predict),
+        }
+        if request.path not in routes:
+            raise HTTPError(404, f"No route for {request.path}")
+        method, handler = routes[request.path]
+        if request.method == 'OPTIONS' and request.path.startswith('/api/'):
+            # CORS preflight from the frontend
+            await send_response(writer, 204, b'', keep_alive=request.keep_alive, headers={
+                **self._cors_headers(),
+                'Access-Control-Allow-Methods': f"{method}, OPTIONS",
+                'Access-Control-Allow-Headers': 'Content-Type',
+                'Access-Control-Max-Age': 600,
+            })
+            return
+        if request.method != method:
+            raise HTTPError(405, f"{request.path} only accepts {method}")
+        await handler(request, writer)
+
+    async def handle_health(self, request, writer):
+        await send_response(writer, 200, {
+            'status': 'ok',
+            'calibrated': self.scoring_model.calibrator is not None,
+            'trees': len(self.scoring_model.model.estimators_),
+        }, keep_alive=request.keep_alive)
+
+    async def handle_metrics(self, request, writer):
+        await send_response(writer, 200, self.scheduler.stats(), keep_alive=request.keep_alive)
+
+    async def handle_prometheus(self, request, writer):
+        # Profiled scoring calls plus the micro-batching counters as gauges
+        gauges = {f"scheduler_{name}": value for name, value in self.scheduler.stats().items()
+                  if isinstance(value, (int, float))}
+        body = PROFILER.prometheus_text(gauges).encode()
+        await send_response(writer, 200, body, 'text/plain; version=0.0.4; charset=utf-8', keep_alive=request.keep_alive)
+
+    def _cors_headers(self):
+        if not self.cors_origin:
+            return {}
+        return {
+            'Access-Control-Allow-Origin': self.cors_origin,
+            'Access-Control-Expose-Headers': 'X-Total-Count, X-Next-Cursor',
+            'Vary': 'Origin, Accept-Encoding',
+        }
+
+    async def send_api_response(self, request, writer, status, body, content_type='application/json', headers=None):
+        """send_response plus CORS headers and gzip when the client accepts it"""
+        if isinstance(body, (dict, list)):
+            body = json.dumps(body, separators=(',', ':')).encode()
+        headers = {**self._cors_headers(), **(headers or {})}
+        if len(body) >= GZIP_MIN_BYTES and 'gzip' in request.headers.get('accept-encoding', ''):
+            body = gzip.compress(body, compresslevel=5)
+            headers['Content-Encoding'] = 'gzip'
+            headers.setdefault('Vary', 'Accept-Encoding')
+        await send_response(writer, status, body, content_type, keep_alive=request.keep_alive, headers=headers)
+
+    def _require_roster(self):
+        if self.roster_api is None:
+            raise HTTPError(503, 'No roster loaded; start the service with --roster, --dataset-id or --owner')
+        return self.roster_api
+
+    async def handle_employees(self, request, writer):
+        roster_api = self._require_roster()
+        params = {name: request.query[name] for name in QUERY_PARAMS if request.query.get(name)}
+        try:
+            if ARROW_STREAM in request.headers.get('accept', ''):
+                frame, total, next_cursor = roster_api.query(**params)
+                body = arrow_stream(frame.astype({'department': str, 'riskLevel': str}))
+                if body is not None:
+                    await self.send_api_response(request, writer, 200, body, ARROW_STREAM, headers={
+                        'X-Total-Count': total,
+                        'X-Next-Cursor': next_cursor or '',
+                    })
+                    return
+            page = roster_api.page(**params)
+        except QueryError as e:
+            raise HTTPError(400, str(e))
+        await self.send_api_response(request, writer, 200, page)
+
+    async def handle_facets(self, request, writer):
+        await self.send_api_response(request, writer, 200, self._require_roster().facets())
+
+    async def handle_predict(self, request, writer):
+        try:
+            payload = json.loads(await request.body() or b'{}')
+        except ValueError:
+            raise HTTPError(400, 'Body is not valid JSON')
+        if not isinstance(payload, dict):
+            raise HTTPError(400, 'Expected a JSON object of form values')
+        try:
+            df = prediction_frame(payload)
+        except QueryError as e:
+            raise HTTPError(400, str(e))
+        scores = await self.score_frame(df)
+        explanation = await self.run_blocking(self.scoring_model.explain, df)
+        await self.send_api_response(request, writer, 200,
+                                     prediction_response(scores, explanation['contributions']))
+
+    async def handle_score(self, request, writer):
+        body = await request.body()
+        parse = parse_csv if request.content_type == 'text/csv' else parse_records
+        df = await self.run_blocking(parse, body)
+
+        if len(df):
+            scores = await self.score_frame(df)
+        else:
+            scores = {name: np.empty(0) for name in ('probability', 'lower', 'upper')}
+        out = results_frame(df, scores)
+        if request.content_type == 'text/csv':
+            await send_response(writer, 200, out.to_csv(index=False), 'text/csv',
+                                keep_alive=request.keep_alive)
+        else:
+            await send_response(writer, 200, {'count': len(out), 'scores': out.to_dict('records')},
+                                keep_alive=request.keep_alive)
+
+    async def handle_stream(self, request, writer):
+        lines = asyncio.Queue(maxsize=STREAM_QUEUED_LINES)
+        pending = asyncio.Queue(maxsize=STREAM_QUEUED_BATCHES)
+
+        async def read_lines():
+            # Reading lives in its own task so timeouts below never cancel a
+            # half-parsed chunk of the request body. A body that breaks off
+            # is passed on as its exception, ending the stream.
+            number = 0
+            try:
+                async for line in request.lines():
+                    number += 1
+                    if line.strip():
+                        await lines.put((number, line))
+            except Exception as e:
+                await lines.put(e)
+                return
+            await lines.put(None)
+
+        async def batch_lines():
+            done = False
+            while not done:
+                batch = [await lines.get()]
+                if batch[0] is None:
+                    break
+                while len(batch) < STREAM_CHUNK_ROWS and not isinstance(batch[-1], Exception):
+                    try:
+                        line = await asyncio.wait_for(lines.get(), STREAM_FLUSH_SECONDS)
+                    except asyncio.TimeoutError:
+                        break
+                    if line is None:
+                        done = True
+                        break
+                    batch.append(line)
+                failure = batch.pop() if isinstance(batch[-1], Exception) else None
+                if batch:
+                    # Each line parses on its own, so one bad line costs only its own result
+                    df, errors = await self.run_blocking(parse_lines, batch)
+                    scored = asyncio.ensure_future(self.score_frame(df)) if len(df) else None
+                    await pending.put((df, errors, scored))
+                if failure is not None:
+                    await pending.put(failure)
+                    return
+            await pending.put(None)
+
+        def send_records(records):
+            data = ''.join(json.dumps(record) + '\n' for record in records).encode()
+            writer.write(f"{len(data):x}\r\n".encode() + data + b'\r\n')
+
+        reader_task = asyncio.ensure_future(read_lines())
+        batcher_task = asyncio.ensure_future(batch_lines())
+
+        writer.write(_response_head(200, 'application/x-ndjson', {
+            'Transfer-Encoding': 'chunked',
+            'Connection': 'keep-alive' if request.keep_alive else 'close',
+        }))
+        try:
+            while True:
+                item = await pending.get()
+                if item is None:
+                    break
+                try:
+                    if isinstance(item, Exception):
+                        raise item
+                    df, errors, scored = item
+                    results = iter(results_frame(df, await scored).to_dict('records') if scored else [])
+                except Exception as e:
+                    # The 200 head is already out, so report the error in-band,
+                    # end the body and close the connection instead of reusing it
+                    send_records([{'error': str(e)}])
+                    request.headers['connection'] = 'close'
+                    break
+                # Error records keep the place of the lines they stand for
+                send_records([errors[position] if position in errors else next(results)
+                              for position in range(len(df) + len(errors))])
+                await writer.drain()
+            if request.keep_alive:
+                await batcher_task
+                await reader_task
+        finally:
+            reader_task.cancel()
+            batcher_task.cancel()
+        writer.write(b'0\r\n\r\n')
+        await writer.drain()
+
+
+async def serve(service, host, port):
+    server = await asyncio.start_server(service.handle_connection, host, port)
+    print(f"🚀 Scoring service listening on http://{host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Employee attrition batch-scoring service')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--models-dir', default=DEFAULT_MODELS_DIR)
+    parser.add_argument('--max-batch-rows', type=int, default=1024)
+    parser.add_argument('--max-wait-ms', type=float, default=5.0)
+    parser.add_argument('--roster', help='roster CSV or Parquet for the /api/employees routes')
+    parser.add_argument('--dataset-id', type=int, help='serve this roster saved by the dashboard instead')
+    parser.add_argument('--owner', help="serve the latest roster the dashboard saved under this owner token (?owner=...)")
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help='dashboard roster store')
+    parser.add_argument('--cors-origin', default='*', help="Access-Control-Allow-Origin for /api ('' to disable)")
+    args = parser.parse_args()
+
+    scoring_model = load_scoring_model(args.models_dir)
+    if scoring_model is None:
+        raise SystemExit(f"❌ No trained model in {args.models_dir}; run train_model.py first")
+
+    # /api is unauthenticated, so only a roster named on the command line is served
+    roster_api = None
+    if args.roster:
+        roster_api = RosterAPI.from_file(args.roster, scoring_model)
+    elif args.dataset_id is not None or args.owner:
+        if not os.path.exists(args.db):
+            raise SystemExit(f"❌ No roster store at {args.db}")
+        try:
+            roster_api = RosterAPI.from_store(RosterStore(args.db), scoring_model, args.dataset_id, args.owner)
+        except KeyError as e:
+            raise SystemExit(f"❌ {e.args[0]}")
+        if roster_api is None:
+            print(f"⚠️ No saved roster for owner {args.owner}; /api/employees will answer 503")
+    if roster_api is not None:
+        print(f"📋 Serving {len(roster_api.table):,} employees on /api/employees")
+
+    service = ScoringService(scoring_model, args.max_batch_rows, args.max_wait_ms, roster_api, args.cors_origin)
+    service.warm_up()
+    try:
+        asyncio.run(serve(service, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.scheduler.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,394 @@
+"""SQLite persistence for processed rosters, roster scores and prediction history"""
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_DB_PATH = os.path.join('data', 'attrition.db')
+ID_COLUMNS = ('EmployeeID', 'EmpID')
+# Saved rosters older than this, or beyond the newest few of their owner, are
+# pruned: their rows and scores are deleted, their drift profiles kept
+RETENTION_DAYS = float(os.environ.get('ATTRITION_DATASET_RETENTION_DAYS', 30))
+DATASETS_PER_OWNER = int(os.environ.get('ATTRITION_DATASETS_PER_OWNER', 5))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS datasets (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    owner TEXT,
+    created_at TEXT NOT NULL,
+    row_count INTEGER NOT NULL,
+    columns TEXT NOT NULL,
+    pruned_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_datasets_created ON datasets (created_at);
+
+CREATE TABLE IF NOT EXISTS scores (
+    dataset_id INTEGER NOT NULL REFERENCES datasets (id) ON DELETE CASCADE,
+    row_id INTEGER NOT NULL,
+    employee_id TEXT,
+    department TEXT,
+    risk_score REAL NOT NULL,
+    risk_lower REAL,
+    risk_upper REAL,
+    scored_at TEXT NOT NULL,
+    PRIMARY KEY (dataset_id, row_id)
+);
+CREATE INDEX IF NOT EXISTS idx_scores_employee ON scores (dataset_id, employee_id);
+CREATE INDEX IF NOT EXISTS idx_scores_department ON scores (dataset_id, department);
+CREATE INDEX IF NOT EXISTS idx_scores_risk ON scores (dataset_id, risk_score DESC);
+
+CREATE TABLE IF NOT EXISTS prediction_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at TEXT NOT NULL,
+    inputs TEXT NOT NULL,
+    risk_score REAL NOT NULL,
+    risk_lower REAL,
+    risk_upper REAL
+);
+CREATE INDEX IF NOT EXISTS idx_prediction_history_created ON prediction_history (created_at);
+
+CREATE TABLE IF NOT EXISTS drift_profiles (
+    dataset_id INTEGER PRIMARY KEY REFERENCES datasets (id) ON DELETE CASCADE,
+    profile TEXT NOT NULL
+);
+"""
+
+
+def _quote(name):
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _column_spec(series):
+    """SQLite type plus what is needed to restore the pandas dtype on load"""
+    spec = {'name': str(series.name)}
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        spec.update(sqltype='TEXT', kind='category',
+                    categories=[str(c) for c in series.cat.categories],
+                    ordered=bool(series.cat.ordered))
+    elif pd.api.types.is_bool_dtype(series):
+        spec.update(sqltype='INTEGER', kind='bool')
+    elif pd.api.types.is_integer_dtype(series):
+        spec.update(sqltype='INTEGER', kind='int')
+    elif pd.api.types.is_float_dtype(series):
+        spec.update(sqltype='REAL', kind='float')
+    elif pd.api.types.is_datetime64_any_dtype(series):
+        spec.update(sqltype='TEXT', kind='datetime')
+    else:
+        spec.update(sqltype='TEXT', kind='text')
+    return spec
+
+
+def _sql_values(series, spec):
+    """Column values as a list of Python scalars with None for missing"""
+    if spec['kind'] == 'datetime':
+        values = series.dt.strftime('%Y-%m-%dT%H:%M:%S').astype(object)
+    elif spec['kind'] == 'category':
+        values = series.astype(str).astype(object)
+    else:
+        values = series.astype(object)
+    return values.where(series.notna(), None).tolist()
+
+
+def _nullable_list(values, n):
+    """Python scalars with None for missing, or ``n`` Nones when ``values`` is None"""
+    if values is None:
+        return [None] * n
+    values = pd.Series(values).astype(object)
+    return values.where(values.notna(), None).tolist()
+
+
+def _restore_dtypes(df, columns):
+    for spec in columns:
+        name = spec['name']
+        if spec['kind'] == 'category':
+            df[name] = pd.Categorical(df[name], categories=spec['categories'], ordered=spec['ordered'])
+        elif spec['kind'] == 'bool':
+            df[name] = df[name].astype('boolean')
+        elif spec['kind'] == 'datetime':
+            df[name] = pd.to_datetime(df[name])
+    return df
+
+
+class RosterStore:
+    """Local SQLite database in WAL mode, safe to share across Streamlit sessions
+
+    Each saved roster gets its own typed table ``roster_<id>`` so columns keep
+    their types and the EmployeeID/Department lookups can be indexed.
+    """
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('PRAGMA foreign_keys=ON')
+        self._conn.executescript(SCHEMA)
+        # Databases from before datasets had owners
+        columns = [row[1] for row in self._conn.execute('PRAGMA table_info(datasets)')]
+        if 'owner' not in columns:
+            self._conn.execute('ALTER TABLE datasets ADD COLUMN owner TEXT')
+        if 'pruned_at' not in columns:
+            self._conn.execute('ALTER TABLE datasets ADD COLUMN pruned_at TEXT')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_datasets_owner ON datasets (owner, created_at)')
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def save_roster(self, df, name, owner=None):
+        """Bulk-insert a processed roster and return its dataset id
+
+        ``owner`` is an opaque token of whoever uploaded it; only that owner's
+        datasets are offered back by ``latest_dataset(owner)``.
+        """
+        columns = [_column_spec(df[col]) for col in df.columns]
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                'INSERT INTO datasets (name, owner, created_at, row_count, columns) VALUES (?, ?, ?, ?, ?)',
+                (name, owner, datetime.now().isoformat(timespec='seconds'), len(df), json.dumps(columns))
+            )
+            dataset_id = cursor.lastrowid
+            table = _quote(f'roster_{dataset_id}')
+
+            column_sql = ', '.join(f"{_quote(spec['name'])} {spec['sqltype']}" for spec in columns)
+            self._conn.execute(f'CREATE TABLE {table} (row_id INTEGER PRIMARY KEY, {column_sql})')
+
+            placeholders = ', '.join('?' * (len(columns) + 1))
+            values = [_sql_values(df[spec['name']], spec) for spec in columns]
+            self._conn.executemany(
+                f'INSERT INTO {table} VALUES ({placeholders})',
+                zip(range(len(df)), *values)
+            )
+
+            for col in ID_COLUMNS + ('Department',):
+                if col in df.columns:
+                    index = _quote(f'idx_roster_{dataset_id}_{col}')
+                    self._conn.execute(f'CREATE INDEX {index} ON {table} ({_quote(col)})')
+        return dataset_id
+
+    def latest_dataset(self, owner=None):
+        """Metadata of the most recently saved roster (of ``owner``, if given), or None"""
+        query = 'SELECT id, name, created_at, row_count FROM datasets WHERE pruned_at IS NULL'
+        params = []
+        if owner is not None:
+            query += ' AND owner = ?'
+            params.append(owner)
+        with self._lock:
+            row = self._conn.execute(query + ' ORDER BY created_at DESC, id DESC LIMIT 1', params).fetchone()
+        if row is None:
+            return None
+        return dict(zip(('id', 'name', 'created_at', 'row_count'), row))
+
+    def load_roster(self, dataset_id):
+        """Load a saved roster with its original column order and dtypes"""
+        with self._lock:
+            row = self._conn.execute('SELECT columns, pruned_at FROM datasets WHERE id = ?', (dataset_id,)).fetchone()
+            if row is None:
+                raise KeyError(f"No saved dataset with id {dataset_id}")
+            if row[1] is not None:
+                raise KeyError(f"Dataset {dataset_id} was pruned on {row[1]}")
+            columns = json.loads(row[0])
+            df = pd.read_sql_query(
+                f"SELECT * FROM {_quote(f'roster_{dataset_id}')} ORDER BY row_id", self._conn
+            )
+        df = df.drop(columns='row_id')
+        return _restore_dtypes(df, columns)
+
+    def update_rows(self, dataset_id, df, positions):
+        """Write rows ``positions`` of ``df`` over the saved roster (new positions are inserted)
+
+        Used for delta uploads: row ids are roster positions, so updated rows
+        replace their old version and appended rows extend the table.
+        """
+        positions = np.asarray(positions, dtype=int)
+        with self._lock, self._conn:
+            row = self._conn.execute('SELECT columns FROM datasets WHERE id = ?', (dataset_id,)).fetchone()
+            if row is None:
+                raise KeyError(f"No saved dataset with id {dataset_id}")
+            columns = {spec['name']: spec for spec in json.loads(row[0])}
+            table = _quote(f'roster_{dataset_id}')
+            for col in df.columns:
+                spec = _column_spec(df[col])
+                if col not in columns:
+                    self._conn.execute(f"ALTER TABLE {table} ADD COLUMN {_quote(col)} {spec['sqltype']}")
+                    columns[col] = spec
+                elif spec['kind'] == 'category':
+                    columns[col] = spec
+
+            names = list(columns)
+            rows = df.iloc[positions]
+            values = [_sql_values(rows[name], columns[name]) if name in rows.columns else [None] * len(rows)
+                      for name in names]
+            column_sql = ', '.join(_quote(name) for name in names)
+            placeholders = ', '.join('?' * (len(names) + 1))
+            self._conn.executemany(
+                f'INSERT OR REPLACE INTO {table} (row_id, {column_sql}) VALUES ({placeholders})',
+                zip(positions.tolist(), *values)
+            )
+            self._conn.execute(
+                'UPDATE datasets SET row_count = ?, columns = ? WHERE id = ?',
+                (len(df), json.dumps(list(columns.values())), dataset_id)
+            )
+
+    def find_employees(self, dataset_id, employee_ids):
+        """Indexed lookup of roster rows by EmployeeID/EmpID"""
+        with self._lock:
+            row = self._conn.execute('SELECT columns FROM datasets WHERE id = ?', (dataset_id,)).fetchone()
+            columns = json.loads(row[0])
+            id_col = next((spec['name'] for spec in columns if spec['name'] in ID_COLUMNS), None)
+            if id_col is None:
+                return pd.DataFrame(columns=[spec['name'] for spec in columns])
+            placeholders = ', '.join('?' * len(employee_ids))
+            df = pd.read_sql_query(
+                f"SELECT * FROM {_quote(f'roster_{dataset_id}')} WHERE {_quote(id_col)} IN ({placeholders})",
+                self._conn, params=list(employee_ids)
+            )
+        return _restore_dtypes(df.drop(columns='row_id'), columns)
+
+    def delete_dataset(self, dataset_id):
+        with self._lock, self._conn:
+            self._delete(dataset_id)
+
+    def _delete(self, dataset_id):
+        # Scores and drift profiles go with the datasets row (ON DELETE CASCADE)
+        self._conn.execute(f"DROP TABLE IF EXISTS {_quote(f'roster_{dataset_id}')}")
+        self._conn.execute('DELETE FROM datasets WHERE id = ?', (dataset_id,))
+
+    def _prune(self, dataset_id, pruned_at):
+        # The datasets row stays for its drift profile, which the drift
+        # monitor compares new uploads against
+        self._conn.execute(f"DROP TABLE IF EXISTS {_quote(f'roster_{dataset_id}')}")
+        self._conn.execute('DELETE FROM scores WHERE dataset_id = ?', (dataset_id,))
+        self._conn.execute('UPDATE datasets SET pruned_at = ? WHERE id = ?', (pruned_at, dataset_id))
+
+    def prune_datasets(self, max_age_days=RETENTION_DAYS, per_owner=DATASETS_PER_OWNER, keep=()):
+        """Prune saved rosters older than ``max_age_days`` or beyond each owner's newest ``per_owner``
+
+        A pruned roster's rows and scores are deleted, but its drift profile
+        and metadata are kept for ``recent_profiles``; pruned datasets without
+        a profile are deleted outright. Datasets in ``keep`` (e.g. ones open
+        in a session) survive either rule. Returns the ids pruned.
+        """
+        now = datetime.now()
+        cutoff = (now - timedelta(days=max_age_days)).isoformat(timespec='seconds')
+        with self._lock, self._conn:
+            rows = self._conn.execute(
+                'SELECT id, owner, created_at FROM datasets WHERE pruned_at IS NULL '
+                'ORDER BY created_at DESC, id DESC'
+            ).fetchall()
+            seen = {}
+            doomed = []
+            for dataset_id, owner, created_at in rows:
+                seen[owner] = seen.get(owner, 0) + 1
+                if dataset_id in keep:
+                    continue
+                if created_at < cutoff or seen[owner] > per_owner:
+                    doomed.append(dataset_id)
+            for dataset_id in doomed:
+                self._prune(dataset_id, now.isoformat(timespec='seconds'))
+            self._conn.execute('DELETE FROM datasets WHERE pruned_at IS NOT NULL '
+                               'AND id NOT IN (SELECT dataset_id FROM drift_profiles)')
+        return doomed
+
+    def save_scores(self, dataset_id, risk_score, employee_ids=None, departments=None,
+                    risk_lower=None, risk_upper=None):
+        """Bulk-insert one score per roster row (row order as saved)"""
+        n = len(risk_score)
+        none = [None] * n
+
+        def as_list(values):
+            if values is None:
+                return none
+            values = pd.Series(values).astype(object)
+            return values.where(values.notna(), None).tolist()
+
+        ids = as_list(None if employee_ids is None else pd.Series(employee_ids).astype(str))
+        scored_at = datetime.now().isoformat(timespec='seconds')
+        rows = zip(
+            [dataset_id] * n, range(n), ids, as_list(departments),
+            np.asarray(risk_score, dtype=float).tolist(), as_list(risk_lower), as_list(risk_upper),
+            [scored_at] * n
+        )
+        with self._lock, self._conn:
+            self._conn.execute('DELETE FROM scores WHERE dataset_id = ?', (dataset_id,))
+            self._conn.executemany('INSERT INTO scores VALUES (?, ?, ?, ?, ?, ?, ?, ?)', rows)
+
+    def update_scores(self, dataset_id, row_ids, risk_score, employee_ids=None, departments=None,
+                      risk_lower=None, risk_upper=None):
+        """Replace the scores of rows ``row_ids`` only"""
+        n = len(risk_score)
+        ids = _nullable_list(None if employee_ids is None else pd.Series(employee_ids).astype(str), n)
+        scored_at = datetime.now().isoformat(timespec='seconds')
+        rows = zip(
+            [dataset_id] * n, np.asarray(row_ids, dtype=int).tolist(), ids, _nullable_list(departments, n),
+            np.asarray(risk_score, dtype=float).tolist(), _nullable_list(risk_lower, n), _nullable_list(risk_upper, n),
+            [scored_at] * n
+        )
+        with self._lock, self._conn:
+            self._conn.executemany('INSERT OR REPLACE INTO scores VALUES (?, ?, ?, ?, ?, ?, ?, ?)', rows)
+
+    def top_risk(self, dataset_id, limit=50, department=None):
+        """Highest-risk employees, served from the (dataset_id, risk_score) index"""
+        query = ('SELECT row_id, employee_id, department, risk_score, risk_lower, risk_upper '
+                 'FROM scores WHERE dataset_id = ?')
+        params = [dataset_id]
+        if department is not None:
+            query += ' AND department = ?'
+            params.append(department)
+        query += ' ORDER BY risk_score DESC LIMIT ?'
+        params.append(limit)
+        with self._lock:
+            return pd.read_sql_query(query, self._conn, params=params)
+
+    def record_prediction(self, inputs, risk_score, risk_lower=None, risk_upper=None):
+        """Append one form prediction to the history table"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT INTO prediction_history (created_at, inputs, risk_score, risk_lower, risk_upper) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (datetime.now().isoformat(timespec='seconds'), json.dumps(inputs, default=str),
+                 float(risk_score), risk_lower, risk_upper)
+            )
+
+    def prediction_history(self, limit=100):
+        with self._lock:
+            df = pd.read_sql_query(
+                'SELECT * FROM prediction_history ORDER BY created_at DESC, id DESC LIMIT ?',
+                self._conn, params=[limit]
+            )
+        df['inputs'] = df['inputs'].map(json.loads)
+        return df
+
+    def save_profile(self, dataset_id, profile):
+        """Store the drift profile (see attrition.drift) of a saved roster"""
+        with self._lock, self._conn:
+            self._conn.execute('INSERT OR REPLACE INTO drift_profiles VALUES (?, ?)',
+                               (dataset_id, json.dumps(profile)))
+
+    def discard_profile(self, dataset_id):
+        """Forget a roster's drift profile after it has been changed in place"""
+        with self._lock, self._conn:
+            self._conn.execute('DELETE FROM drift_profiles WHERE dataset_id = ?', (dataset_id,))
+
+    def recent_profiles(self, limit=12, owner=None):
+        """Drift profiles of the latest saved rosters (of ``owner``, if given), newest first"""
+        query = ('SELECT d.id, d.name, d.created_at, d.row_count, p.profile FROM drift_profiles p '
+                 'JOIN datasets d ON d.id = p.dataset_id')
+        params = []
+        if owner is not None:
+            query += ' WHERE d.owner = ?'
+            params.append(owner)
+        with self._lock:
+            rows = self._conn.execute(query + ' ORDER BY d.created_at DESC, d.id DESC LIMIT ?',
+                                      params + [limit]).fetchall()
+        return [
+            {'id': row[0], 'name': row[1], 'created_at': row[2], 'row_count': row[3], 'profile': json.loads(row[4])}
+            for row in rows
+        ]
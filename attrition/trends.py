@@ -0,0 +1,175 @@
+"""Monthly headcount, exits and attrition rate from employment dates
+
+Dates are parsed once, when a roster is ingested. ``TrendIndex`` then
+reduces them to per-month hire and exit counts plus their running totals, so
+any window's figures are array slices and prefix-sum differences: changing
+the window costs O(months) and never rescans the roster. Changed employees
+are moved out of and back into the counts with ``update``, which costs
+O(changed rows + months).
+"""
+import numpy as np
+import pandas as pd
+
+# Tried in order against a sample of the column; the format that parses the
+# most sample values is then applied to the whole column in one call
+DATE_FORMATS = (
+    '%Y-%m-%d', '%d-%b-%y', '%d-%b-%Y', '%m/%d/%Y', '%d/%m/%Y',
+    '%d-%m-%Y', '%m/%d/%y', '%Y-%m-%dT%H:%M:%S',
+)
+FORMAT_SAMPLE_ROWS = 500
+
+
+def parse_dates(series):
+    """Vectorized date parsing with the column's format detected from a sample
+
+    Rosters repeat the same dates many times, so only the distinct values are
+    parsed and the result is expanded back with their codes.
+    """
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series
+    codes, uniques = pd.factorize(series)
+    text = pd.Series(uniques).astype('string').str.strip()
+    sample = text[text != ''].head(FORMAT_SAMPLE_ROWS)
+
+    best_format, best_parsed = None, 0
+    for fmt in DATE_FORMATS:
+        parsed = pd.to_datetime(sample, format=fmt, errors='coerce').notna().sum()
+        if parsed > best_parsed:
+            best_format, best_parsed = fmt, parsed
+            if parsed == len(sample):
+                break
+    if best_format is None:
+        parsed = pd.to_datetime(text, errors='coerce')
+    else:
+        parsed = pd.to_datetime(text, format=best_format, errors='coerce')
+
+    # Missing values have code -1, which picks the trailing NaT
+    values = np.append(parsed.to_numpy(dtype='datetime64[ns]'), np.datetime64('NaT', 'ns'))
+    return pd.Series(values[codes], index=series.index, name=series.name)
+
+
+def _month_numbers(dates):
+    """Months since 1970-01 as int64; NaT becomes -1"""
+    values = pd.to_datetime(dates).to_numpy(dtype='datetime64[M]')
+    months = values.astype(np.int64)
+    months[np.isnat(values)] = -1
+    return months
+
+
+def _event_months(start_dates, exit_dates):
+    """Start months and exit months (-1 if none) of the rows with a start date"""
+    starts = _month_numbers(start_dates)
+    exits = _month_numbers(exit_dates) if exit_dates is not None else np.full(len(starts), -1)
+    known = starts >= 0
+    starts, exits = starts[known], exits[known]
+    has_exit = exits >= 0
+    # An exit recorded before the start date is treated as same-month
+    exits[has_exit] = np.maximum(exits[has_exit], starts[has_exit])
+    return starts, exits
+
+
+class TrendIndex:
+    """Per-month hires and exits with prefix sums over the roster's whole history"""
+
+    def __init__(self, start_dates, exit_dates=None):
+        starts, exits = _event_months(start_dates, exit_dates)
+        if len(starts) == 0:
+            raise ValueError('No parseable start dates')
+
+        self.first_month = int(starts.min())
+        last_month = int(max(starts.max(), exits.max()))
+        n_months = last_month - self.first_month + 1
+
+        self.hires = np.bincount(starts - self.first_month, minlength=n_months)
+        self.exits = np.bincount(exits[exits >= 0] - self.first_month, minlength=n_months)
+        self._prefix_sums()
+
+    def _prefix_sums(self):
+        # cum_*[m] counts events strictly before month m, so a window [a, b)
+        # sums to cum[b] - cum[a]
+        self.cum_hires = np.concatenate([[0], np.cumsum(self.hires)])
+        self.cum_exits = np.concatenate([[0], np.cumsum(self.exits)])
+        self.headcount = self.cum_hires[1:] - self.cum_exits[1:]
+        self.cum_headcount = np.concatenate([[0], np.cumsum(self.headcount)])
+
+    def _extend(self, first_month, last_month):
+        """Grow the month range to cover ``first_month``..``last_month``"""
+        before = max(self.first_month - first_month, 0)
+        after = max(last_month - (self.first_month + self.n_months - 1), 0)
+        if before or after:
+            self.hires = np.pad(self.hires, (before, after))
+            self.exits = np.pad(self.exits, (before, after))
+            self.first_month -= before
+
+    def update(self, removed_starts=None, removed_exits=None, added_starts=None, added_exits=None):
+        """Take the old dates of changed rows out and put their new dates in"""
+        for start_dates, exit_dates, sign in ((removed_starts, removed_exits, -1),
+                                              (added_starts, added_exits, 1)):
+            if start_dates is None:
+                continue
+            starts, exits = _event_months(start_dates, exit_dates)
+            if len(starts) == 0:
+                continue
+            exits = exits[exits >= 0]
+            self._extend(int(starts.min()), int(max(starts.max(), exits.max(initial=-1))))
+            np.add.at(self.hires, starts - self.first_month, sign)
+            np.add.at(self.exits, exits - self.first_month, sign)
+        self._prefix_sums()
+
+    @property
+    def n_months(self):
+        return len(self.hires)
+
+    @property
+    def months(self):
+        return pd.period_range(start=self._period(0), periods=self.n_months, freq='M')
+
+    def _period(self, position):
+        return pd.Period(year=1970 + (self.first_month + position) // 12,
+                         month=(self.first_month + position) % 12 + 1, freq='M')
+
+    def _position(self, month):
+        period = pd.Period(month, freq='M')
+        return (period.year - 1970) * 12 + period.month - 1 - self.first_month
+
+    def _bounds(self, start, end):
+        """Positions [a, b) for an inclusive month window, clipped to the history"""
+        a = 0 if start is None else self._position(start)
+        b = self.n_months if end is None else self._position(end) + 1
+        return max(a, 0), min(max(b, 0), self.n_months)
+
+    def window(self, start=None, end=None):
+        """Monthly figures for ``start``..``end`` (inclusive, anything pd.Period accepts)"""
+        a, b = self._bounds(start, end)
+        headcount_end = self.headcount[a:b]
+        headcount_start = self.cum_hires[a:b] - self.cum_exits[a:b]
+        exits = self.exits[a:b]
+        average = (headcount_start + headcount_end) / 2
+        rate = np.divide(exits * 100.0, average, out=np.zeros(b - a), where=average > 0)
+        return pd.DataFrame({
+            'month': pd.period_range(start=self._period(a), periods=b - a, freq='M') if b > a else pd.PeriodIndex([], freq='M'),
+            'headcount': headcount_end,
+            'hires': self.hires[a:b],
+            'exits': exits,
+            'attrition_rate': rate,
+        })
+
+    def last(self, n_months):
+        """Monthly figures for the most recent ``n_months`` of history"""
+        return self.window(self._period(max(self.n_months - n_months, 0)), None)
+
+    def summary(self, start=None, end=None):
+        """Totals for a window in O(1) from the prefix sums"""
+        a, b = self._bounds(start, end)
+        months = b - a
+        exits = int(self.cum_exits[b] - self.cum_exits[a])
+        average_headcount = (self.cum_headcount[b] - self.cum_headcount[a]) / months if months else 0.0
+        rate = exits / average_headcount * 100 if average_headcount else 0.0
+        return {
+            'months': months,
+            'hires': int(self.cum_hires[b] - self.cum_hires[a]),
+            'exits': exits,
+            'average_headcount': float(average_headcount),
+            'attrition_rate': rate,
+            'annualized_rate': rate * 12 / months if months else 0.0,
+        }
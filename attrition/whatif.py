@@ -0,0 +1,82 @@
+"""What-if simulation: score one employee under a grid of interventions
+
+An intervention is a tuple of ``(column, operation, value)`` changes, for
+example ``(('MonthlyIncome', 'scale', 1.1), ('OverTime', 'set', 'No'))`` for
+a 10% raise with overtime removed. All variants that are not already cached
+are scored together in one call, and every result is memoized per
+(employee, intervention) so moving one control only scores the new points.
+"""
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+BASELINE = ()
+RESULT_FIELDS = ('probability', 'lower', 'upper')
+
+
+def apply_intervention(employee, intervention):
+    """Return a copy of the ``employee`` dict with ``intervention`` applied"""
+    variant = dict(employee)
+    for column, operation, value in intervention:
+        if operation == 'set':
+            variant[column] = value
+        elif operation == 'scale':
+            variant[column] = variant[column] * value
+        elif operation == 'add':
+            variant[column] = variant[column] + value
+        else:
+            raise ValueError(f"Unknown intervention operation: {operation}")
+    return variant
+
+
+def raise_grid(max_raise_pct=20, step_pct=2.5, extra=()):
+    """Salary raises from +0% to ``max_raise_pct``, each combined with ``extra``"""
+    raises = np.round(np.arange(0, max_raise_pct + step_pct / 2, step_pct), 4)
+    return [
+        ((('MonthlyIncome', 'scale', 1 + float(pct) / 100),) if pct else ()) + tuple(extra)
+        for pct in raises
+    ]
+
+
+class WhatIfSimulator:
+    """Memoizing, batching front end to a ``score_fn(df) -> dict of arrays``"""
+
+    def __init__(self, score_fn, max_entries=10_000):
+        self.score_fn = score_fn
+        self.max_entries = max_entries
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def employee_key(employee):
+        return tuple(sorted(employee.items()))
+
+    def simulate(self, employee, interventions):
+        """Scores for each intervention as a DataFrame, in the order given"""
+        employee_key = self.employee_key(employee)
+        keys = [(employee_key, tuple(intervention)) for intervention in interventions]
+
+        with self._lock:
+            known = {key: self._cache[key] for key in keys if key in self._cache}
+            for key in known:
+                self._cache.move_to_end(key)
+        missing = list(OrderedDict.fromkeys(key for key in keys if key not in known))
+
+        if missing:
+            variants = pd.DataFrame([apply_intervention(employee, intervention) for _, intervention in missing])
+            scores = self.score_fn(variants)
+            for i, key in enumerate(missing):
+                known[key] = tuple(float(scores[field][i]) for field in RESULT_FIELDS)
+
+        with self._lock:
+            self.hits += len(keys) - len(missing)
+            self.misses += len(missing)
+            for key in missing:
+                self._cache[key] = known[key]
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return pd.DataFrame([known[key] for key in keys], columns=list(RESULT_FIELDS))
@@ -1,6 +1,6 @@
 "use client"
 
-import { useState } from "react"
+import { useEffect, useState } from "react"
 import { Table, TableBody, TableCell, TableHead, TableHeader, TableRow } from "@/components/ui/table"
 import { Badge } from "@/components/ui/badge"
 import { Button } from "@/components/ui/button"
@@ -8,83 +8,95 @@ import { Input } from "@/components/ui/input"
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from "@/components/ui/select"
 import { Search, Filter } from "lucide-react"
 
-const employeeData = [
-  {
-    id: 1,
-    name: "Sarah Johnson",
-    department: "Engineering",
-    role: "Senior Developer",
-    tenure: "3.2 years",
-    satisfaction: 4,
-    riskLevel: "low",
-    lastReview: "2024-01-15",
-  },
-  {
-    id: 2,
-    name: "Michael Chen",
-    department: "Sales",
-    role: "Account Manager",
-    tenure: "1.8 years",
-    satisfaction: 2,
-    riskLevel: "high",
-    lastReview: "2024-01-10",
-  },
-  {
-    id: 3,
-    name: "Emily Rodriguez",
-    department: "Marketing",
-    role: "Marketing Specialist",
-    tenure: "2.5 years",
-    satisfaction: 3,
-    riskLevel: "medium",
-    lastReview: "2024-01-20",
-  },
-  {
-    id: 4,
-    name: "David Kim",
-    department: "Engineering",
-    role: "Tech Lead",
-    tenure: "4.1 years",
-    satisfaction: 5,
-    riskLevel: "low",
-    lastReview: "2024-01-12",
-  },
-  {
-    id: 5,
-    name: "Lisa Thompson",
-    department: "HR",
-    role: "HR Specialist",
-    tenure: "0.9 years",
-    satisfaction: 2,
-    riskLevel: "high",
-    lastReview: "2024-01-18",
-  },
-  {
-    id: 6,
-    name: "James Wilson",
-    department: "Finance",
-    role: "Financial Analyst",
-    tenure: "2.8 years",
-    satisfaction: 4,
-    riskLevel: "low",
-    lastReview: "2024-01-14",
-  },
-]
+// The scoring service (python -m attrition.service) filters, sorts and pages
+// the scored roster server-side; the table only ever holds loaded pages
+const API_URL = process.env.NEXT_PUBLIC_ATTRITION_API ?? "http://localhost:8080"
+const PAGE_SIZE = 50
+
+interface Employee {
+  id: string
+  name: string
+  department: string
+  role: string
+  tenure: number | null
+  satisfaction: number | null
+  probability: number
+  riskLevel: "low" | "medium" | "high"
+}
+
+interface EmployeePage {
+  items: Employee[]
+  total: number
+  nextCursor: string | null
+}
 
 export function EmployeeTable() {
   const [searchTerm, setSearchTerm] = useState("")
+  const [debouncedSearch, setDebouncedSearch] = useState("")
   const [departmentFilter, setDepartmentFilter] = useState("all")
   const [riskFilter, setRiskFilter] = useState("all")
+  const [departments, setDepartments] = useState<string[]>([])
+  const [employees, setEmployees] = useState<Employee[]>([])
+  const [total, setTotal] = useState(0)
+  const [nextCursor, setNextCursor] = useState<string | null>(null)
+  const [isLoading, setIsLoading] = useState(false)
+  const [error, setError] = useState<string | null>(null)
 
-  const filteredEmployees = employeeData.filter((employee) => {
-    const matchesSearch =
-      employee.name.toLowerCase().includes(searchTerm.toLowerCase()) ||
-      employee.role.toLowerCase().includes(searchTerm.toLowerCase())
-    const matchesDepartment = departmentFilter === "all" || employee.department === departmentFilter
-    const matchesRisk = riskFilter === "all" || employee.riskLevel === riskFilter
+  const fetchPage = async (cursor: string | null, signal?: AbortSignal) => {
+    const params = new URLSearchParams({ limit: String(PAGE_SIZE), sort: "probability", order: "desc" })
+    if (debouncedSearch) params.set("q", debouncedSearch)
+    if (departmentFilter !== "all") params.set("department", departmentFilter)
+    if (riskFilter !== "all") params.set("risk", riskFilter)
+    if (cursor) params.set("cursor", cursor)
+    const response = await fetch(`${API_URL}/api/employees?${params}`, { signal })
+    if (!response.ok) throw new Error((await response.json()).error ?? response.statusText)
+    return (await response.json()) as EmployeePage
+  }
 
-    return matchesSearch && matchesDepartment && matchesRisk
-  })
+  useEffect(() => {
+    fetch(`${API_URL}/api/employees/facets`)
+      .then((response) => (response.ok ? response.json() : Promise.reject()))
+      .then((facets) => setDepartments(Object.keys(facets.departments)))
+      .catch(() => setDepartments([]))
+  }, [])
+
+  useEffect(() => {
+    const timer = setTimeout(() => setDebouncedSearch(searchTerm.trim()), 300)
+    return () => clearTimeout(timer)
+  }, [searchTerm])
+
+  // A new search or filter replaces the rows; an in-flight request for the
+  // previous filters is aborted so it cannot overwrite them
+  useEffect(() => {
+    const controller = new AbortController()
+    setIsLoading(true)
+    fetchPage(null, controller.signal)
+      .then((page) => {
+        setEmployees(page.items)
+        setTotal(page.total)
+        setNextCursor(page.nextCursor)
+        setError(null)
+      })
+      .catch((err) => {
+        if (err.name !== "AbortError") setError(err.message)
+      })
+      .finally(() => setIsLoading(false))
+    return () => controller.abort()
+  }, [debouncedSearch, departmentFilter, riskFilter])
+
+  const loadMore = async () => {
+    if (!nextCursor) return
+    setIsLoading(true)
+    try {
+      const page = await fetchPage(nextCursor)
+      setEmployees((current) => [...current, ...page.items])
+      setNextCursor(page.nextCursor)
+    } catch (err) {
+      setError((err as Error).message)
+    } finally {
+      setIsLoading(false)
+    }
+  }
 
   const getRiskBadge = (risk: string) => {
     switch (risk) {
@@ -108,7 +120,8 @@ export function EmployeeTable() {
   }
 
   const getSatisfactionStars = (rating: number) => {
-    return "★".repeat(rating) + "☆".repeat(5 - rating)
+    const stars = Math.round(rating)
+    return "★".repeat(stars) + "☆".repeat(Math.max(5 - stars, 0))
   }
 
   return (
@@ -132,11 +145,11 @@ export function EmployeeTable() {
           </SelectTrigger>
           <SelectContent>
             <SelectItem value="all">All Departments</SelectItem>
-            <SelectItem value="Engineering">Engineering</SelectItem>
-            <SelectItem value="Sales">Sales</SelectItem>
-            <SelectItem value="Marketing">Marketing</SelectItem>
-            <SelectItem value="HR">HR</SelectItem>
-            <SelectItem value="Finance">Finance</SelectItem>
+            {departments.map((department) => (
+              <SelectItem key={department} value={department}>
+                {department}
+              </SelectItem>
+            ))}
           </SelectContent>
         </Select>
 
@@ -163,12 +176,12 @@ export function EmployeeTable() {
               <TableHead className="font-semibold">Tenure</TableHead>
               <TableHead className="font-semibold">Satisfaction</TableHead>
               <TableHead className="font-semibold">Risk Level</TableHead>
-              <TableHead className="font-semibold">Last Review</TableHead>
+              <TableHead className="font-semibold">Risk Score</TableHead>
               <TableHead className="font-semibold">Actions</TableHead>
             </TableRow>
           </TableHeader>
           <TableBody>
-            {filteredEmployees.map((employee) => (
+            {employees.map((employee) => (
               <TableRow key={employee.id} className="hover:bg-gray-50 transition-colors">
                 <TableCell>
                   <div>
@@ -179,15 +192,21 @@ export function EmployeeTable() {
                 <TableCell>
                   <Badge variant="outline">{employee.department}</Badge>
                 </TableCell>
-                <TableCell className="text-gray-600">{employee.tenure}</TableCell>
+                <TableCell className="text-gray-600">
+                  {employee.tenure === null ? "—" : `${employee.tenure} years`}
+                </TableCell>
                 <TableCell>
-                  <div className="flex items-center gap-2">
-                    <span className="text-yellow-500">{getSatisfactionStars(employee.satisfaction)}</span>
-                    <span className="text-sm text-gray-500">({employee.satisfaction}/5)</span>
-                  </div>
+                  {employee.satisfaction === null ? (
+                    <span className="text-sm text-gray-500">—</span>
+                  ) : (
+                    <div className="flex items-center gap-2">
+                      <span className="text-yellow-500">{getSatisfactionStars(employee.satisfaction)}</span>
+                      <span className="text-sm text-gray-500">({employee.satisfaction}/5)</span>
+                    </div>
+                  )}
                 </TableCell>
                 <TableCell>{getRiskBadge(employee.riskLevel)}</TableCell>
-                <TableCell className="text-gray-600">{employee.lastReview}</TableCell>
+                <TableCell className="text-gray-600">{employee.probability.toFixed(1)}%</TableCell>
                 <TableCell>
                   <Button
                     variant="outline"
@@ -203,9 +222,24 @@ export function EmployeeTable() {
         </Table>
       </div>
 
-      {filteredEmployees.length === 0 && (
+      {error && <div className="text-center py-4 text-red-600">Could not load employees: {error}</div>}
+
+      {!error && !isLoading && employees.length === 0 && (
         <div className="text-center py-8 text-gray-500">No employees found matching your criteria.</div>
       )}
+
+      {employees.length > 0 && (
+        <div className="flex items-center justify-between text-sm text-gray-500">
+          <span>
+            Showing {employees.length.toLocaleString()} of {total.toLocaleString()} employees
+          </span>
+          {nextCursor && (
+            <Button variant="outline" size="sm" onClick={loadMore} disabled={isLoading}>
+              {isLoading ? "Loading..." : "Load more"}
+            </Button>
+          )}
+        </div>
+      )}
     </div>
   )
 }
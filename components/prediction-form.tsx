@@ -12,9 +12,14 @@ import { Badge } from "@/components/ui/badge"
 import { Progress } from "@/components/ui/progress"
 import { AlertTriangle, CheckCircle, Brain } from "lucide-react"
 
+// Scored by the same model as the dashboard (python -m attrition.service)
+const API_URL = process.env.NEXT_PUBLIC_ATTRITION_API ?? "http://localhost:8080"
+
 interface PredictionResult {
   risk: "low" | "medium" | "high"
   probability: number
+  lower: number
+  upper: number
   factors: string[]
   recommendations: string[]
 }
@@ -33,60 +38,27 @@ export function PredictionForm() {
 
   const [prediction, setPrediction] = useState<PredictionResult | null>(null)
   const [isLoading, setIsLoading] = useState(false)
+  const [error, setError] = useState<string | null>(null)
 
   const handleSubmit = async (e: React.FormEvent) => {
     e.preventDefault()
     setIsLoading(true)
 
-    // Simulate API call
-    await new Promise((resolve) => setTimeout(resolve, 2000))
-
-    // Mock prediction logic
-    const satisfactionScore = Number.parseInt(formData.jobSatisfaction) || 3
-    const workLifeScore = Number.parseInt(formData.workLifeBalance) || 3
-    const years = Number.parseInt(formData.yearsAtCompany) || 2
-    const overtime = formData.overtime === "yes"
-
-    let riskScore = 0
-    const factors: string[] = []
-    const recommendations: string[] = []
-
-    if (satisfactionScore <= 2) {
-      riskScore += 30
-      factors.push("Low job satisfaction")
-      recommendations.push("Schedule career development discussion")
-    }
-
-    if (workLifeScore <= 2) {
-      riskScore += 25
-      factors.push("Poor work-life balance")
-      recommendations.push("Consider flexible work arrangements")
-    }
-
-    if (years < 2) {
-      riskScore += 20
-      factors.push("Low tenure")
-      recommendations.push("Implement mentorship program")
-    }
-
-    if (overtime) {
-      riskScore += 15
-      factors.push("Frequent overtime")
-      recommendations.push("Review workload distribution")
+    try {
+      const response = await fetch(`${API_URL}/api/predict`, {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify(formData),
+      })
+      const result = await response.json()
+      if (!response.ok) throw new Error(result.error ?? response.statusText)
+      setPrediction(result as PredictionResult)
+      setError(null)
+    } catch (err) {
+      setError((err as Error).message)
+    } finally {
+      setIsLoading(false)
     }
-
-    let risk: "low" | "medium" | "high" = "low"
-    if (riskScore >= 50) risk = "high"
-    else if (riskScore >= 25) risk = "medium"
-
-    setPrediction({
-      risk,
-      probability: Math.min(riskScore + Math.random() * 20, 95),
-      factors: factors.length > 0 ? factors : ["No significant risk factors identified"],
-      recommendations: recommendations.length > 0 ? recommendations : ["Continue current engagement practices"],
-    })
-
-    setIsLoading(false)
   }
 
   const getRiskColor = (risk: string) => {
@@ -268,6 +240,8 @@ export function PredictionForm() {
 
       {/* Results */}
       <div className="space-y-6">
+        {error && <div className="text-sm text-red-600">Prediction failed: {error}</div>}
+
         {prediction && (
           <Card className={`border-2 ${getRiskColor(prediction.risk)} animate-fade-in-up`}>
             <CardHeader>
@@ -275,7 +249,10 @@ export function PredictionForm() {
                 {getRiskIcon(prediction.risk)}
                 <div>
                   <CardTitle className="capitalize">{prediction.risk} Risk</CardTitle>
-                  <CardDescription>{prediction.probability.toFixed(1)}% probability of attrition</CardDescription>
+                  <CardDescription>
+                    {prediction.probability.toFixed(1)}% probability of attrition (range{" "}
+                    {prediction.lower.toFixed(1)}–{prediction.upper.toFixed(1)}%)
+                  </CardDescription>
                 </div>
               </div>
             </CardHeader>
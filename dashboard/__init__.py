@@ -0,0 +1 @@
+"""Streamlit dashboard components for AttritionAI"""
@@ -0,0 +1,99 @@
+"""Admin-only hot-path timing panel and the profiling metrics endpoint"""
+import hmac
+import logging
+import os
+
+import pandas as pd
+import streamlit as st
+
+from attrition.profiling import PROFILER, set_memory_tracing, start_metrics_server
+from dashboard.memory import get_memory_manager
+
+# The panel is shown only when the page URL carries ?admin=<this token>
+ADMIN_TOKEN = os.environ.get('ATTRITION_ADMIN_TOKEN')
+METRICS_PORT = os.environ.get('ATTRITION_METRICS_PORT')
+
+logger = logging.getLogger(__name__)
+
+def is_admin():
+    """Whether this session opened the dashboard with the admin token"""
+    if not ADMIN_TOKEN:
+        return False
+    supplied = st.experimental_get_query_params().get('admin', [''])[0]
+    return hmac.compare_digest(supplied.encode(), ADMIN_TOKEN.encode())
+
+@st.cache_resource
+def start_metrics_endpoint():
+    """One /metrics server per Streamlit process, when ATTRITION_METRICS_PORT is set"""
+    if not METRICS_PORT:
+        return None
+    try:
+        return start_metrics_server(int(METRICS_PORT))
+    except OSError as e:
+        # Logged, not shown: this runs for every session, admin or not
+        logger.warning("Could not serve profiling metrics on port %s: %s", METRICS_PORT, e)
+        return None
+
+def show_profiling_panel():
+    """Per-function wall, CPU and peak-memory figures from the profiling ring buffer"""
+    if not is_admin():
+        return
+    
+    with st.expander("🛠️ Performance Profile (admin)", expanded=False):
+        summary = pd.DataFrame(PROFILER.summary())
+        recent = pd.DataFrame(PROFILER.recent(200))
+        
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Calls Recorded", f"{int(summary['calls'].sum()) if len(summary) else 0:,}")
+        col2.metric("Calls in Ring Buffer", f"{len(PROFILER.calls):,} / {PROFILER.calls.maxlen:,}")
+        with col3:
+            import tracemalloc
+            tracing = st.toggle("Track peak memory", value=tracemalloc.is_tracing(), key="profile_memory",
+                                help="Starts tracemalloc, which slows the whole process while on")
+            if tracing != tracemalloc.is_tracing():
+                set_memory_tracing(tracing)
+        
+        show_session_memory()
+        
+        if summary.empty:
+            st.info("ℹ️ No profiled calls yet.")
+            return
+        
+        st.markdown("**Per function (since start or reset)**")
+        st.dataframe(summary.round(2), use_container_width=True, hide_index=True)
+        
+        st.markdown("**Latest calls**")
+        recent['started_at'] = pd.to_datetime(recent['started_at'], unit='s').dt.strftime('%H:%M:%S.%f').str[:-3]
+        recent['wall_ms'] = (recent.pop('wall') * 1000).round(2)
+        recent['cpu_ms'] = (recent.pop('cpu') * 1000).round(2)
+        recent['peak_mb'] = (pd.to_numeric(recent.pop('peak_bytes')) / 2 ** 20).round(2)
+        st.dataframe(recent, use_container_width=True, height=300, hide_index=True)
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.download_button(
+                label="📥 Prometheus Metrics",
+                data=PROFILER.prometheus_text(),
+                file_name="attrition_metrics.prom",
+                mime="text/plain",
+                use_container_width=True
+            )
+        with col2:
+            if st.button("🔄 Reset Profile", use_container_width=True):
+                PROFILER.reset()
+                st.rerun()
+
+def show_session_memory():
+    """Datasets every session holds, and whether they are in memory or spilled to disk"""
+    manager = get_memory_manager()
+    usage = pd.DataFrame(manager.usage())
+    
+    st.markdown("**Session datasets**")
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Resident", f"{manager.resident_bytes() / 2 ** 20:,.1f} MB",
+                help=f"Ceiling {manager.ceiling_bytes / 2 ** 20:,.0f} MB (ATTRITION_MEMORY_CEILING_MB)")
+    col2.metric("Spilled", f"{int((~usage['resident']).sum()) if len(usage) else 0:,} of {len(usage):,}",
+                help=f"Idle sessions spill after {manager.idle_seconds:,.0f} s (ATTRITION_SESSION_IDLE_SECONDS)")
+    col3.metric("Ceiling Evictions", f"{manager.evictions:,}")
+    if not usage.empty:
+        st.dataframe(usage.round(2), use_container_width=True, hide_index=True)
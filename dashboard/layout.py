@@ -0,0 +1,247 @@
+"""Page chrome: header, upload flow, headline metrics and tab navigation"""
+import time
+
+import streamlit as st
+
+from attrition.profiling import profiled
+from dashboard.memory import hold_in_session, session_value
+
+TAB_LABELS = {
+    'Overview': '📊 Overview',
+    'AI Prediction': '🤖 AI Prediction',
+    'Analytics': '📈 Analytics',
+    'Employee Data': '👥 Employee Data',
+}
+TAB_NAMES = {label: name for name, label in TAB_LABELS.items()}
+
+def show_professional_header():
+    """Ultimate professional header"""
+    st.markdown("""
+    <div class="main-header">
+        <div class="brand-section">
+            <div class="brand-icon">A</div>
+            <div class="brand-text">
+                <h1>AttritionAI Ultimate</h1>
+                <p>Next-Generation Employee Retention Intelligence</p>
+            </div>
+        </div>
+        <div>
+            <button class="export-btn" onclick="window.print()">📊 Export Ultimate Report</button>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+def show_upload_interface():
+    """Ultimate upload interface"""
+    st.markdown("""
+    <div class="upload-container">
+        <div style="font-size: 64px; margin-bottom: 24px;">🚀</div>
+        <div class="upload-title">Upload Your Employee Data</div>
+        <div class="upload-subtitle">Transform your workforce analytics with AI-powered insights and real-time processing</div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    from attrition.ingest import UPLOAD_TYPES
+    
+    uploaded_file = st.file_uploader(
+        "Choose a roster file",
+        type=UPLOAD_TYPES,
+        help="Drag and drop file here • Supports up to 500MB • CSV, gzip/zstd CSV, Parquet or Feather"
+    )
+    all_columns = st.checkbox(
+        "Keep every column",
+        value=False,
+        help="By default only the columns the dashboard and model use are read, which loads large files much "
+             "faster. Other columns are dropped, so they will not appear in the correlation matrix or the "
+             "Employee Data table; tick this to keep them."
+    )
+    if not all_columns:
+        st.caption("ℹ️ Columns the dashboard does not use will be left out of this upload")
+    
+    if uploaded_file is None:
+        show_resume_last_dataset()
+    
+    if uploaded_file is not None:
+        # pandas is only needed once a file arrives, not to draw the uploader
+        from attrition.ingest import read_roster
+        from dashboard.data import process_data_ultimate
+        
+        try:
+            with st.spinner("🔄 Processing your data with advanced algorithms..."):
+                data = read_roster(uploaded_file, uploaded_file.name, prune=not all_columns)
+                processed_data = process_data_ultimate(data)
+                hold_in_session('uploaded_data', processed_data)
+                
+                # Keep the roster across page reloads; the dashboard still
+                # works from session state if the database is unavailable
+                try:
+                    from dashboard.store import persist_roster
+                    st.session_state.dataset_id = persist_roster(processed_data, uploaded_file.name)
+                except Exception as e:
+                    st.warning(f"⚠️ Could not save this dataset for later sessions: {str(e)}")
+                
+                st.markdown(f"""
+                <div class="success-message">
+                    ✅ Successfully processed {len(data):,} employee records with advanced analytics!
+                </div>
+                """, unsafe_allow_html=True)
+                
+                time.sleep(1.5)
+                st.rerun()
+        except Exception as e:
+            st.error(f"❌ Error processing file: {str(e)}")
+
+def show_resume_last_dataset():
+    """Offer to reopen the most recently saved roster instead of re-uploading"""
+    from dashboard.store import latest_own_dataset, restore_latest_roster
+    
+    try:
+        latest = latest_own_dataset()
+    except Exception:
+        return
+    if latest is None:
+        return
+    
+    label = f"📂 Resume {latest['name']} ({latest['row_count']:,} records, saved {latest['created_at'].replace('T', ' ')})"
+    if st.button(label, key="resume_last_dataset", use_container_width=True):
+        restore_latest_roster()
+        st.rerun()
+
+def show_dashboard():
+    """Ultimate dashboard with real-time data processing"""
+    df = session_value('uploaded_data')
+    
+    st.markdown("""
+    <div class="welcome-section">
+        <div class="welcome-title">Ultimate Employee Attrition Intelligence Dashboard</div>
+        <div class="welcome-subtitle">Real-time insights powered by advanced AI algorithms and your actual workforce data</div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    show_ultimate_metrics_cards(df)
+    
+    # Enhanced navigation tabs
+    show_enhanced_navigation_tabs()
+    
+    # Content based on active tab; each tab module (and its plotting or ML
+    # dependencies) is imported the first time that tab is opened
+    if st.session_state.get('active_tab', 'Overview') == 'Overview':
+        from dashboard.tabs.overview import show_ultimate_overview_content
+        show_ultimate_overview_content(df)
+    elif st.session_state.get('active_tab') == 'AI Prediction':
+        from dashboard.tabs.prediction import show_ultimate_prediction_content
+        show_ultimate_prediction_content(df)
+    elif st.session_state.get('active_tab') == 'Analytics':
+        from dashboard.tabs.analytics import show_ultimate_analytics_content
+        show_ultimate_analytics_content(df)
+    elif st.session_state.get('active_tab') == 'Employee Data':
+        from dashboard.tabs.employee_data import show_ultimate_employee_data_content
+        show_ultimate_employee_data_content(df)
+    
+    from dashboard.admin import show_profiling_panel
+    show_profiling_panel()
+
+def get_roster_cube(df):
+    """The roster's aggregate cube, built once and then patched by delta uploads"""
+    cache = st.session_state.get('roster_cube')
+    if cache is None or cache[0] != id(df):
+        from dashboard.data import build_roster_cube
+        cache = (id(df), build_roster_cube(df))
+        st.session_state.roster_cube = cache
+    return cache[1]
+
+@profiled
+def show_ultimate_metrics_cards(df):
+    """Ultimate metrics cards with 100% accurate real data calculations"""
+    # Headline figures only change with the dataset, not with the active tab
+    cache = st.session_state.get('headline_metrics')
+    if cache is None or cache[0] != id(df):
+        from dashboard.data import calculate_headline_metrics
+        cache = (id(df), calculate_headline_metrics(df, get_roster_cube(df)))
+        st.session_state.headline_metrics = cache
+    metrics = cache[1]
+    total_employees = metrics['total_employees']
+    attrition_rate = metrics['attrition_rate']
+    retention_rate = metrics['retention_rate']
+    at_risk_count = metrics['at_risk_count']
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        trend_indicator = "positive" if total_employees > 1000 else "negative"
+        trend_text = f"↗ +{((total_employees - 1000) / 1000 * 100):.1f}%" if total_employees > 1000 else f"↘ -{((1000 - total_employees) / 1000 * 100):.1f}%"
+        
+        st.markdown(f"""
+        <div class="metric-card blue">
+            <div class="metric-icon" style="color: #3b82f6;">👥</div>
+            <div class="metric-label">Total Employees</div>
+            <div class="metric-value">{total_employees:,}</div>
+            <div class="metric-change {trend_indicator}">{trend_text} vs baseline</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        industry_avg = 12.5
+        benchmark_diff = attrition_rate - industry_avg
+        benchmark_color = "negative" if benchmark_diff > 0 else "positive"
+        benchmark_text = f"{'↑' if benchmark_diff > 0 else '↓'} {abs(benchmark_diff):.1f}% vs industry"
+        
+        st.markdown(f"""
+        <div class="metric-card red">
+            <div class="metric-icon" style="color: #dc2626;">📉</div>
+            <div class="metric-label">Attrition Rate</div>
+            <div class="metric-value">{attrition_rate:.1f}%</div>
+            <div class="metric-change {benchmark_color}">{benchmark_text}</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        retention_benchmark = 87.5
+        retention_diff = retention_rate - retention_benchmark
+        retention_trend = "positive" if retention_diff > 0 else "negative"
+        retention_text = f"{'↑' if retention_diff > 0 else '↓'} {abs(retention_diff):.1f}% vs industry"
+        
+        st.markdown(f"""
+        <div class="metric-card green">
+            <div class="metric-icon" style="color: #10b981;">✅</div>
+            <div class="metric-label">Retention Rate</div>
+            <div class="metric-value">{retention_rate:.1f}%</div>
+            <div class="metric-change {retention_trend}">{retention_text}</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col4:
+        risk_percentage = (at_risk_count / total_employees) * 100 if total_employees > 0 else 0
+        priority_level = "HIGH" if risk_percentage > 15 else "MEDIUM" if risk_percentage > 8 else "LOW"
+        priority_color = "#dc2626" if priority_level == "HIGH" else "#f59e0b" if priority_level == "MEDIUM" else "#10b981"
+        
+        st.markdown(f"""
+        <div class="metric-card orange">
+            <div class="metric-icon" style="color: #f59e0b;">⚠️</div>
+            <div class="metric-label">At Risk Employees</div>
+            <div class="metric-value">{at_risk_count}</div>
+            <div class="high-priority-badge" style="background-color: {priority_color}; color: white;">{priority_level} PRIORITY</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+def switch_tab():
+    """Radio callback: runs before the script, so the switch needs no st.rerun()"""
+    st.session_state.active_tab = TAB_NAMES[st.session_state.nav_tab]
+
+def show_enhanced_navigation_tabs():
+    """Enhanced navigation tabs"""
+    if 'active_tab' not in st.session_state:
+        st.session_state.active_tab = 'Overview'
+    
+    # Keep the radio in sync when active_tab is set elsewhere
+    if st.session_state.get('nav_tab') != TAB_LABELS[st.session_state.active_tab]:
+        st.session_state.nav_tab = TAB_LABELS[st.session_state.active_tab]
+    
+    st.radio(
+        "Navigation",
+        options=list(TAB_LABELS.values()),
+        key='nav_tab',
+        on_change=switch_tab,
+        horizontal=True,
+        label_visibility='collapsed'
+    )
@@ -0,0 +1,40 @@
+"""Session datasets held through the process-wide memory manager"""
+import streamlit as st
+
+# Session caches keyed by id() of the roster; a reloaded roster is a new
+# object, and its id may be one a freed roster had
+DERIVED_KEYS = ('roster_cube', 'headline_metrics', 'trend_index', 'exit_forecast', 'retention_plan',
+                'drift_profile', 'roster_risk', 'org_graph', 'location_index')
+
+@st.cache_resource
+def get_memory_manager():
+    """One manager per Streamlit process, sweeping idle sessions in the background"""
+    from attrition.memory import MemoryManager
+    return MemoryManager().start()
+
+def session_id():
+    """A token identifying this browser session to the memory manager"""
+    if 'memory_session_id' not in st.session_state:
+        import uuid
+        st.session_state.memory_session_id = uuid.uuid4().hex
+    return st.session_state.memory_session_id
+
+def hold_in_session(key, value):
+    """Store ``value`` in session state under ``key``, sized and spillable"""
+    st.session_state[key] = get_memory_manager().hold(session_id(), key, value)
+
+def session_value(key, default=None):
+    """The value stored with ``hold_in_session``, reloaded from disk if it was spilled"""
+    from attrition.memory import DatasetHandle
+    handle = st.session_state.get(key)
+    if handle is None:
+        return default
+    if not isinstance(handle, DatasetHandle):
+        # Set directly, e.g. by a test harness; not tracked
+        return handle
+    loads = handle.loads
+    value = handle.get()
+    if handle.loads != loads and key == 'uploaded_data':
+        for derived in DERIVED_KEYS:
+            st.session_state.pop(derived, None)
+    return value
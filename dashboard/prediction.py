@@ -0,0 +1,220 @@
+"""Single-employee risk prediction and recommendation logic"""
+import os
+
+import pandas as pd
+import streamlit as st
+
+from attrition.profiling import profiled
+
+# Form submissions from concurrent sessions that arrive within this window
+# are scored together in one model call
+MAX_BATCH_ROWS = int(os.environ.get('ATTRITION_MAX_BATCH_ROWS', 256))
+MAX_WAIT_MS = float(os.environ.get('ATTRITION_MAX_WAIT_MS', 5))
+# The form's choices for the heuristic estimate when no model is trained
+FALLBACK_DEPARTMENTS = ["Sales", "Engineering", "Marketing", "HR", "Finance"]
+
+@st.cache_resource
+def get_scoring_model():
+    """Load the trained model and calibration layer once per process"""
+    # scikit-learn is imported here rather than at module level so the app
+    # does not pay for it until the prediction tab is first opened
+    from attrition.scoring import load_scoring_model
+    return load_scoring_model()
+
+def department_options():
+    """Departments the model was trained on plus the short names that alias to them"""
+    scoring_model = get_scoring_model()
+    if scoring_model is None:
+        return FALLBACK_DEPARTMENTS
+    from attrition.scoring import DEPARTMENT_ALIASES
+    known = [str(name) for name in scoring_model.encoders['Department'].classes_]
+    return known + [alias for alias, name in DEPARTMENT_ALIASES.items() if name in known and alias not in known]
+
+@st.cache_resource
+def get_batch_scheduler():
+    """Process-wide micro-batcher in front of the scoring model, or None"""
+    scoring_model = get_scoring_model()
+    if scoring_model is None:
+        return None
+    from attrition.batching import BatchScheduler
+    return BatchScheduler(scoring_model.score, MAX_BATCH_ROWS, MAX_WAIT_MS)
+
+@st.cache_resource
+def get_whatif_simulator():
+    """Process-wide what-if simulator with a shared result memo, or None"""
+    scheduler = get_batch_scheduler()
+    if scheduler is None:
+        return None
+    from attrition.whatif import WhatIfSimulator
+    return WhatIfSimulator(scheduler.score)
+
+def employee_record(age, years_company, department, job_satisfaction, work_life_balance, monthly_salary, frequent_overtime):
+    """Form inputs as a raw employee row in the training data's column names"""
+    return {
+        'Age': age,
+        'YearsAtCompany': years_company,
+        'Department': department,
+        'JobSatisfaction': job_satisfaction,
+        'WorkLifeBalance': work_life_balance,
+        'MonthlyIncome': monthly_salary,
+        'OverTime': frequent_overtime,
+    }
+
+@profiled
+def generate_ultimate_prediction(age, years_company, department, job_satisfaction, work_life_balance, monthly_salary, frequent_overtime, performance_rating, df):
+    """Generate ultimate prediction with real data insights"""
+    scheduler = get_batch_scheduler()
+    
+    if scheduler is not None:
+        # Calibrated forest probability with the spread of per-tree votes
+        employee = pd.DataFrame([employee_record(age, years_company, department, job_satisfaction, work_life_balance, monthly_salary, frequent_overtime)])
+        scores = scheduler.score(employee)
+        base_risk = float(scores['probability'][0]) * 100
+        confidence_lower = float(scores['lower'][0]) * 100
+        confidence_upper = float(scores['upper'][0]) * 100
+        drivers = explain_employee(employee)
+        band_label = "Tree vote spread (middle 95%)"
+    else:
+        drivers = []
+        base_risk = calculate_enhanced_risk_score(age, years_company, department, job_satisfaction, work_life_balance, monthly_salary, frequent_overtime, performance_rating)
+        
+        # Adjust based on actual data patterns
+        if len(df) > 0:
+            if 'Age' in df.columns:
+                age_avg = df['Age'].mean()
+                if abs(age - age_avg) > 10:
+                    base_risk += 5
+            
+            if 'Department' in df.columns and 'Attrition' in df.columns:
+                dept_risk = df[df['Department'] == department]['Attrition'].mean() * 100
+                base_risk = (base_risk + dept_risk) / 2
+        
+        confidence_lower = max(0, base_risk - 12)
+        confidence_upper = min(100, base_risk + 12)
+        band_label = "Estimated range (±12 pts)"
+    
+    return {
+        'risk_score': base_risk,
+        'confidence_lower': confidence_lower,
+        'confidence_upper': confidence_upper,
+        'band_label': band_label,
+        'drivers': drivers,
+        'recommendations': generate_ultimate_recommendations(base_risk, age, years_company, department, job_satisfaction, work_life_balance, monthly_salary, frequent_overtime, performance_rating, drivers)
+    }
+
+def explain_employee(employee, n_drivers=3):
+    """Top risk drivers for one employee as (feature, percentage points) pairs"""
+    from attrition.explain import top_contributors
+    explanation = get_scoring_model().explain(employee)
+    return [(feature, points * 100) for feature, points in top_contributors(explanation['contributions'], n_drivers)[0]]
+
+def calculate_enhanced_risk_score(age, years_company, department, job_satisfaction, work_life_balance, monthly_salary, frequent_overtime, performance_rating):
+    """Enhanced risk calculation"""
+    risk_score = 0
+    
+    # Age factor
+    if age < 25 or age > 55:
+        risk_score += 15
+    elif 25 <= age <= 30:
+        risk_score += 10
+    
+    # Tenure factor
+    if years_company < 2:
+        risk_score += 20
+    elif years_company > 10:
+        risk_score += 5
+    
+    # Department factor
+    dept_risk = {'Sales': 15, 'Marketing': 12, 'HR': 8, 'Engineering': 5, 'Finance': 7}
+    risk_score += dept_risk.get(department, 10)
+    
+    # Job satisfaction factor
+    risk_score += (5 - job_satisfaction) * 12
+    
+    # Work-life balance factor
+    risk_score += (5 - work_life_balance) * 10
+    
+    # Salary factor
+    if monthly_salary < 3000:
+        risk_score += 15
+    elif monthly_salary < 5000:
+        risk_score += 8
+    
+    # Overtime factor
+    if frequent_overtime == "Yes":
+        risk_score += 12
+    
+    # Performance factor
+    if performance_rating <= 2:
+        risk_score += 20
+    elif performance_rating == 3:
+        risk_score += 5
+    
+    return min(risk_score, 100)
+
+def generate_ultimate_recommendations(risk_score, age, years_company, department, job_satisfaction, work_life_balance, monthly_salary, frequent_overtime, performance_rating, drivers=None):
+    """Generate ultimate personalized recommendations"""
+    if drivers:
+        return recommendations_from_drivers(drivers)
+    
+    recommendations = []
+    
+    if job_satisfaction <= 2:
+        recommendations.append({
+            'priority': 'CRITICAL',
+            'action': 'Immediate Manager Intervention',
+            'description': 'Schedule urgent 1-on-1 meeting to address satisfaction concerns',
+            'timeline': 'Within 24 hours',
+            'impact': 'High'
+        })
+    
+    if work_life_balance <= 2:
+        recommendations.append({
+            'priority': 'HIGH',
+            'action': 'Flexible Work Implementation',
+            'description': 'Offer remote work options and flexible scheduling immediately',
+            'timeline': 'Within 1 week',
+            'impact': 'High'
+        })
+    
+    if monthly_salary < 4000:
+        recommendations.append({
+            'priority': 'MEDIUM',
+            'action': 'Compensation Review',
+            'description': 'Conduct market analysis and salary adjustment',
+            'timeline': 'Within 2 weeks',
+            'impact': 'Medium'
+        })
+    
+    if frequent_overtime == "Yes":
+        recommendations.append({
+            'priority': 'HIGH',
+            'action': 'Workload Redistribution',
+            'description': 'Analyze team capacity and redistribute tasks',
+            'timeline': 'Within 1 week',
+            'impact': 'Medium'
+        })
+    
+    return recommendations
+
+def recommendations_from_drivers(drivers):
+    """One action per model risk driver, prioritised by how much risk it adds"""
+    from attrition.explain import DRIVER_ACTIONS
+    
+    recommendations = []
+    for feature, points in drivers:
+        action, description, timeline = DRIVER_ACTIONS[feature]
+        if points >= 10:
+            priority, impact = 'CRITICAL', 'High'
+        elif points >= 5:
+            priority, impact = 'HIGH', 'High'
+        else:
+            priority, impact = 'MEDIUM', 'Medium'
+        recommendations.append({
+            'priority': priority,
+            'action': action,
+            'description': f"{description} (adds {points:.1f} pts of risk)",
+            'timeline': timeline,
+            'impact': impact
+        })
+    return recommendations
@@ -0,0 +1,107 @@
+"""Shared roster database for the dashboard and helpers to save and restore sessions"""
+import streamlit as st
+
+from dashboard.memory import hold_in_session
+
+@st.cache_resource
+def get_roster_store():
+    """One WAL-mode SQLite connection shared by every session in the process"""
+    from attrition.storage import RosterStore
+    return RosterStore()
+
+def owner_token(create=False):
+    """Opaque token in the page URL (?owner=...) naming whoever saved a roster
+
+    It lives in the URL rather than session state so that a reload of the
+    same page can resume the roster, while other visitors, whose URLs carry
+    a different token or none, are never offered it.
+    """
+    params = st.experimental_get_query_params()
+    token = params.get('owner', [None])[0]
+    if token is None and create:
+        import secrets
+        token = secrets.token_urlsafe(16)
+        st.experimental_set_query_params(**params, owner=token)
+    return token
+
+def score_roster(df):
+    """Score every row with the trained model, or return None if there is none"""
+    from dashboard.prediction import get_scoring_model
+    scoring_model = get_scoring_model()
+    if scoring_model is None:
+        return None
+    return scoring_model.score(df)
+
+def persist_roster(df, name):
+    """Save a processed roster plus its model scores and return the dataset id"""
+    store = get_roster_store()
+    dataset_id = store.save_roster(df, name, owner=owner_token(create=True))
+    
+    # Old uploads would otherwise accumulate a roster table each
+    try:
+        store.prune_datasets(keep={dataset_id})
+    except Exception as e:
+        st.warning(f"⚠️ Could not prune saved datasets: {str(e)}")
+    
+    scores = score_roster(df)
+    if scores is not None:
+        id_col = next((col for col in ('EmployeeID', 'EmpID') if col in df.columns), None)
+        store.save_scores(
+            dataset_id,
+            scores['probability'],
+            employee_ids=df[id_col] if id_col else None,
+            departments=df['Department'] if 'Department' in df.columns else None,
+            risk_lower=scores['lower'],
+            risk_upper=scores['upper']
+        )
+    
+    # A few KB per upload; the drift view compares these instead of rosters
+    from attrition.drift import build_profile, load_baseline_profile
+    profile = build_profile(df, None if scores is None else scores['probability'],
+                            reference=load_baseline_profile(), name=name)
+    store.save_profile(dataset_id, profile)
+    return dataset_id
+
+def latest_own_dataset():
+    """Metadata of the newest roster saved under this page's owner token, or None"""
+    owner = owner_token()
+    if owner is None:
+        return None
+    return get_roster_store().latest_dataset(owner=owner)
+
+def restore_latest_roster():
+    """Load this owner's most recently saved roster into the session"""
+    store = get_roster_store()
+    latest = latest_own_dataset()
+    if latest is None:
+        return None
+    hold_in_session('uploaded_data', store.load_roster(latest['id']))
+    st.session_state.dataset_id = latest['id']
+    return latest
+
+def persist_roster_delta(df, changes):
+    """Save only the rows a delta upload changed, and score only those rows"""
+    dataset_id = st.session_state.get('dataset_id')
+    if dataset_id is None:
+        return None
+    store = get_roster_store()
+    positions = changes.positions
+    store.update_rows(dataset_id, df, positions)
+    
+    changed = df.iloc[positions]
+    scores = score_roster(changed) if len(changed) else None
+    if scores is not None:
+        id_col = next((col for col in ('EmployeeID', 'EmpID') if col in df.columns), None)
+        store.update_scores(
+            dataset_id,
+            positions,
+            scores['probability'],
+            employee_ids=changed[id_col] if id_col else None,
+            departments=changed['Department'] if 'Department' in df.columns else None,
+            risk_lower=scores['lower'],
+            risk_upper=scores['upper']
+        )
+    # The stored profile describes the roster before the change; the drift
+    # monitor re-profiles it on demand
+    store.discard_profile(dataset_id)
+    return dataset_id
@@ -0,0 +1,23 @@
+"""Global stylesheet for the dashboard"""
+import os
+from functools import lru_cache
+
+import streamlit as st
+
+STYLESHEET_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'static', 'styles.css')
+STYLESHEET_URL = 'app/static/styles.css'
+
+@lru_cache(maxsize=1)
+def load_stylesheet():
+    """Read the stylesheet from disk once per process"""
+    with open(STYLESHEET_PATH, encoding='utf-8') as f:
+        return f.read()
+
+def inject_styles():
+    """Emit the global stylesheet"""
+    if st.get_option('server.enableStaticServing'):
+        # The browser fetches and caches the file once; every rerun only
+        # sends this one-line import instead of the whole stylesheet
+        st.markdown(f'<style>@import url("{STYLESHEET_URL}");</style>', unsafe_allow_html=True)
+    else:
+        st.markdown(f"<style>\n{load_stylesheet()}</style>", unsafe_allow_html=True)
@@ -0,0 +1 @@
+"""Per-tab renderers; each module imports its own heavy dependencies"""
@@ -0,0 +1,376 @@
+"""Analytics tab: distributions, feature correlations, retention planning, location and manager rollups, drift"""
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from attrition.profiling import profiled
+from dashboard.prediction import get_scoring_model
+
+def age_distribution_figure(df):
+    """Histogram of employee ages (sampled ages if the roster has none)"""
+    if 'Age' in df.columns:
+        fig = px.histogram(df, x='Age', nbins=20, color_discrete_sequence=['#0ea5e9'])
+    else:
+        ages = np.random.normal(35, 10, len(df))
+        fig = px.histogram(x=ages, nbins=20, color_discrete_sequence=['#0ea5e9'])
+    fig.update_layout(
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        font=dict(family="Inter", size=12, color="#000000"),
+        height=300
+    )
+    return fig
+
+def salary_distribution_figure(df):
+    """Box plot of monthly income (sampled salaries if the roster has none)"""
+    if 'MonthlyIncome' in df.columns:
+        fig = px.box(df, y='MonthlyIncome', color_discrete_sequence=['#10b981'])
+    else:
+        salaries = np.random.lognormal(8.5, 0.5, len(df))
+        fig = px.box(y=salaries, color_discrete_sequence=['#10b981'])
+    
+    fig.update_layout(
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        font=dict(family="Inter", size=12, color="#000000"),
+        height=300
+    )
+    return fig
+
+def correlation_figure(df):
+    """Heatmap of correlations between the roster's numeric columns"""
+    numeric_cols = df.select_dtypes(include=[np.number]).columns
+    if len(numeric_cols) > 1:
+        corr_matrix = df[numeric_cols].corr()
+        fig = px.imshow(
+            corr_matrix, 
+            text_auto=True, 
+            aspect="auto", 
+            color_continuous_scale='RdBu_r',
+            zmin=-1, zmax=1
+        )
+    else:
+        # Sample correlation matrix
+        np.random.seed(42)
+        sample_data = np.random.rand(8, 8)
+        sample_data = (sample_data + sample_data.T) / 2
+        np.fill_diagonal(sample_data, 1)
+        labels = ['Age', 'Income', 'Satisfaction', 'Years', 'Performance', 'WorkLife', 'Education', 'Distance']
+        fig = px.imshow(
+            sample_data, 
+            text_auto=True, 
+            aspect="auto",
+            x=labels, y=labels, 
+            color_continuous_scale='RdBu_r',
+            zmin=0, zmax=1
+        )
+    
+    fig.update_layout(
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        font=dict(family="Inter", size=12, color="#000000"),
+        height=500
+    )
+    return fig
+
+@profiled
+def show_ultimate_analytics_content(df):
+    """Ultimate analytics with advanced insights"""
+    st.markdown("""
+    <div style="text-align: center; padding: 40px; background: linear-gradient(135deg, #f0f9ff, #e0f2fe); border-radius: 20px; margin-bottom: 30px;">
+        <div style="font-size: 32px; font-weight: 900; color: #000000; margin-bottom: 12px;">📊 Ultimate Analytics Engine</div>
+        <div style="font-size: 18px; color: #1f2937; font-weight: 600;">Advanced workforce intelligence powered by your real data</div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Real-time analytics based on actual data
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("📈 Age Distribution Analysis")
+        st.plotly_chart(age_distribution_figure(df), use_container_width=True)
+    
+    with col2:
+        st.subheader("💰 Salary Distribution Analysis")
+        st.plotly_chart(salary_distribution_figure(df), use_container_width=True)
+    
+    # Advanced correlation analysis
+    st.subheader("🔗 Advanced Feature Correlation Matrix")
+    st.plotly_chart(correlation_figure(df), use_container_width=True)
+    
+    show_retention_optimizer(df)
+    show_location_analytics(df)
+    show_manager_rollups(df)
+    show_drift_monitor(df)
+
+@profiled
+def show_retention_optimizer(df):
+    """Plan where a fixed retention budget removes the most attrition risk"""
+    scoring_model = get_scoring_model()
+    if scoring_model is None:
+        return
+    
+    st.subheader("💼 Retention Budget Optimizer")
+    with st.form("retention_optimizer_form"):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            budget = st.number_input("Annual budget ($)", min_value=10000, max_value=100000000, value=250000, step=10000)
+        with col2:
+            risk_threshold = st.slider("At-risk threshold (%)", 10, 90, 40, step=5)
+        with col3:
+            raise_pct = st.slider("Compensation review raise (%)", 2, 25, 10)
+        submitted = st.form_submit_button("🚀 Optimize Retention Plan", use_container_width=True, type="primary")
+    
+    if submitted:
+        from attrition.optimizer import optimize_retention
+        with st.spinner("🧠 Scoring interventions for every at-risk employee..."):
+            st.session_state.retention_plan = (id(df), optimize_retention(scoring_model, df, budget, risk_threshold / 100, raise_pct))
+    
+    if 'retention_plan' not in st.session_state or st.session_state.retention_plan[0] != id(df):
+        return
+    plan, summary = st.session_state.retention_plan[1]
+    
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Employees Treated", f"{summary['treated']:,}", f"of {summary['at_risk']:,} at risk", delta_color="off")
+    col2.metric("Budget Spent", f"${summary['spent']:,.0f}", f"of ${summary['budget']:,.0f}", delta_color="off")
+    col3.metric("Expected Exits Avoided", f"{summary['expected_exits_avoided']:,.1f}")
+    col4.metric("Cost per Exit Avoided", f"${summary['spent'] / summary['expected_exits_avoided']:,.0f}" if summary['expected_exits_avoided'] else "—")
+    
+    if len(plan):
+        col1, col2 = st.columns([1, 2])
+        with col1:
+            mix = plan.groupby('intervention').agg(employees=('cost', 'size'), cost=('cost', 'sum')).reset_index()
+            fig = px.bar(mix, x='intervention', y='cost', text='employees', color_discrete_sequence=['#0ea5e9'])
+            fig.update_layout(
+                plot_bgcolor='white',
+                paper_bgcolor='white',
+                font=dict(family="Inter", size=12, color="#000000"),
+                xaxis_title="",
+                yaxis_title="Spend ($)",
+                height=350
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        with col2:
+            shown = plan.drop(columns='row').head(50).copy()
+            for col in ('baseline_risk', 'new_risk', 'reduction'):
+                shown[col] = (shown[col] * 100).round(1)
+            st.dataframe(shown, use_container_width=True, height=350, hide_index=True)
+
+def roster_risk(df):
+    """Model risk score of every employee, computed once per dataset (None without a model)"""
+    cache = st.session_state.get('roster_risk')
+    if cache is None or cache[0] != id(df):
+        scoring_model = get_scoring_model()
+        cache = (id(df), scoring_model.score(df)['probability'] if scoring_model is not None else None)
+        st.session_state.roster_risk = cache
+    return cache[1]
+
+def patch_roster_risk(risk, new_df, changes):
+    """Risk scores for a roster after a delta upload, re-scoring only the changed rows"""
+    patched = np.empty(len(new_df))
+    patched[:len(risk)] = risk
+    positions = changes.positions
+    if len(positions):
+        patched[positions] = get_scoring_model().score(new_df.iloc[positions])['probability']
+    return patched
+
+def get_location_index(df):
+    """State/location/department aggregates of the roster, built once per dataset"""
+    cache = st.session_state.get('location_index')
+    if cache is None or cache[0] != id(df):
+        from attrition.geography import LocationIndex
+        cache = (id(df), LocationIndex(df, roster_risk(df)))
+        st.session_state.location_index = cache
+    return cache[1]
+
+@profiled
+def show_location_analytics(df):
+    """Attrition and predicted risk by state, drilling down to location and department"""
+    if 'State' not in df.columns:
+        return
+    
+    st.subheader("🗺️ Location Analytics")
+    index = get_location_index(df)
+    states = index.summary()
+    measures = {"Attrition rate": 'attrition_rate', "Mean predicted risk": 'mean_risk', "High-risk share": 'high_risk_share'}
+    measure = measures[st.radio("Color states by", list(measures), horizontal=True, key="location_measure")]
+    
+    fig = px.choropleth(
+        states.assign(**{measure: states[measure] * 100}),
+        locations='State',
+        locationmode='USA-states',
+        scope='usa',
+        color=measure,
+        hover_data=['employees', 'leavers', 'high_risk'],
+        color_continuous_scale='Reds'
+    )
+    fig.update_layout(
+        paper_bgcolor='white',
+        font=dict(family="Inter", size=12, color="#000000"),
+        coloraxis_colorbar_title="%",
+        height=420
+    )
+    st.plotly_chart(fig, use_container_width=True)
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        state = st.selectbox("State", states.sort_values('employees', ascending=False)['State'].tolist(), key="location_state")
+    # Below a state: its locations, or its departments when the roster has no LocationCode
+    shown = index.summary(state)
+    if 'LocationCode' in index.levels:
+        with col2:
+            location = st.selectbox("Location", ["All locations"] + shown['LocationCode'].tolist(), key="location_code")
+        if location != "All locations":
+            if 'Department' in index.levels:
+                shown = index.summary(state, location)
+            else:
+                shown = shown[shown['LocationCode'] == location]
+    shown = shown.copy()
+    for col in measures.values():
+        shown[col] = (shown[col] * 100).round(1)
+    st.dataframe(shown, use_container_width=True, height=300, hide_index=True)
+
+def get_org_graph(df):
+    """Supervisor hierarchy of the roster with its risk scores, built once per dataset"""
+    cache = st.session_state.get('org_graph')
+    if cache is None or cache[0] != id(df):
+        from attrition.orgchart import OrgGraph
+        cache = (id(df), OrgGraph(df, roster_risk(df)))
+        st.session_state.org_graph = cache
+    return cache[1]
+
+@profiled
+def show_manager_rollups(df):
+    """Span of control, team attrition and predicted risk per manager"""
+    from attrition.orgchart import supervisor_column
+    if supervisor_column(df) is None:
+        return
+    
+    st.subheader("👥 Manager Risk Rollups")
+    graph = get_org_graph(df)
+    depths = {"Direct reports": 1, "Two levels": 2, "Three levels": 3, "Whole organisation": None}
+    col1, col2 = st.columns([1, 2])
+    with col1:
+        depth = depths[st.selectbox("Team scope", list(depths), key="rollup_depth")]
+    with col2:
+        min_team = st.slider("Minimum team size", 1, 25, 3, key="rollup_min_team")
+    
+    rollup = graph.rollup(depth)
+    rollup = rollup[rollup['team_size'] >= min_team].sort_values(['high_risk_reports', 'mean_risk'], ascending=False)
+    
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Managers", f"{len(rollup):,}")
+    col2.metric("Median Span of Control", f"{rollup['span_of_control'].median():.0f}" if len(rollup) else "—")
+    col3.metric("Teams with High-Risk Reports", f"{(rollup['high_risk_reports'] > 0).sum():,}")
+    col4.metric("Org Depth", f"{graph.depth.max()} levels")
+    if not len(rollup):
+        st.info("ℹ️ No manager has a team of that size.")
+        return
+    
+    shown = rollup.head(50).copy()
+    for col in ('attrition_rate', 'mean_risk'):
+        shown[col] = (shown[col] * 100).round(1)
+    st.dataframe(shown, use_container_width=True, height=350, hide_index=True)
+    
+    manager = st.selectbox("Show team of", shown['manager'].tolist(), key="rollup_manager")
+    team = graph.team(shown.index[shown['manager'].tolist().index(manager)], depth)
+    st.dataframe(df.iloc[team], use_container_width=True, height=300)
+
+def current_drift_profile(df, baseline):
+    """Profile of the roster in this session, from the store when it was saved there"""
+    cache = st.session_state.get('drift_profile')
+    if cache is not None and cache[0] == id(df):
+        return cache[1]
+    from attrition.drift import build_profile
+    profile = build_profile(df, roster_risk(df), reference=baseline, name='Current dataset')
+    st.session_state.drift_profile = (id(df), profile)
+    return profile
+
+@profiled
+def show_drift_monitor(df):
+    """Feature and risk-score drift of this roster against training and earlier uploads"""
+    from attrition.drift import PSI_MODERATE, PSI_SIGNIFICANT, SCORE_FEATURE, compare_profiles, load_baseline_profile, retraining_verdict
+    from dashboard.store import get_roster_store, owner_token
+    
+    st.subheader("🛰️ Data & Prediction Drift Monitor")
+    baseline = load_baseline_profile()
+    owner = owner_token()
+    try:
+        # Only this owner's uploads; other visitors' rosters are not theirs to compare
+        history = get_roster_store().recent_profiles(owner=owner) if owner is not None else []
+    except Exception:
+        history = []
+    
+    dataset_id = st.session_state.get('dataset_id')
+    saved = next((entry for entry in history if entry['id'] == dataset_id), None)
+    current = saved['profile'] if saved is not None else current_drift_profile(df, baseline)
+    if saved is None and dataset_id is not None:
+        # The saved roster was changed in place by a delta upload
+        try:
+            get_roster_store().save_profile(dataset_id, current)
+        except Exception:
+            pass
+    
+    references = {}
+    if baseline is not None:
+        references['Training set'] = baseline
+    for entry in history:
+        if entry['id'] != dataset_id:
+            references[f"{entry['name']} ({entry['created_at'].replace('T', ' ')})"] = entry['profile']
+    if not references:
+        st.info("ℹ️ No reference to compare against yet. Retrain with train_model.py to record the training profile, or upload another roster.")
+        return
+    
+    reference_name = st.selectbox("Compare against", list(references), key="drift_reference")
+    report = compare_profiles(references[reference_name], current)
+    verdict = retraining_verdict(report)
+    score_row = report[report['feature'] == SCORE_FEATURE]
+    
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Model Status", "Retrain recommended" if verdict['retrain'] else "Stable")
+    col2.metric("Largest Feature PSI", f"{verdict['max_psi']:.3f}" if verdict['max_psi'] is not None else "—")
+    col3.metric("Risk Score PSI", f"{score_row['psi'].iloc[0]:.3f}" if len(score_row) and score_row['psi'].notna().iloc[0] else "—")
+    for reason in verdict['reasons']:
+        st.warning(f"⚠️ {reason}")
+    
+    col1, col2 = st.columns([3, 2])
+    with col1:
+        colors = {'stable': '#10b981', 'moderate': '#f59e0b', 'significant': '#dc2626', 'n/a': '#9ca3af'}
+        fig = px.bar(report.fillna({'psi': 0}), x='feature', y='psi', color='status', color_discrete_map=colors)
+        fig.add_hline(y=PSI_MODERATE, line_dash="dot", line_color="#f59e0b")
+        fig.add_hline(y=PSI_SIGNIFICANT, line_dash="dash", line_color="#dc2626")
+        fig.update_layout(
+            plot_bgcolor='white',
+            paper_bgcolor='white',
+            font=dict(family="Inter", size=12, color="#000000"),
+            xaxis_title="",
+            yaxis_title="PSI",
+            height=350
+        )
+        st.plotly_chart(fig, use_container_width=True)
+    with col2:
+        st.dataframe(report.round(3), use_container_width=True, height=350, hide_index=True)
+    
+    # Every stored upload against the training profile: O(bins) per upload
+    if baseline is not None and len(history) > 1:
+        rows = []
+        for entry in reversed(history):
+            past = compare_profiles(baseline, entry['profile']).set_index('feature')['psi']
+            rows.append({
+                'upload': entry['created_at'].replace('T', ' '),
+                'Largest feature PSI': past.drop(SCORE_FEATURE, errors='ignore').max(),
+                'Risk score PSI': past.get(SCORE_FEATURE, np.nan),
+            })
+        trend = px.line(pd.DataFrame(rows), x='upload', y=['Largest feature PSI', 'Risk score PSI'], markers=True)
+        trend.add_hline(y=PSI_SIGNIFICANT, line_dash="dash", line_color="#dc2626")
+        trend.update_layout(
+            plot_bgcolor='white',
+            paper_bgcolor='white',
+            font=dict(family="Inter", size=12, color="#000000"),
+            xaxis_title="",
+            yaxis_title="PSI vs training",
+            legend_title="",
+            height=300
+        )
+        st.plotly_chart(trend, use_container_width=True)
@@ -0,0 +1,156 @@
+"""Employee Data tab: filtering, search, export and incremental roster changes"""
+from datetime import datetime
+
+import streamlit as st
+
+from attrition.profiling import profiled
+from dashboard.memory import hold_in_session
+
+@profiled
+def show_ultimate_employee_data_content(df):
+    """Ultimate employee data explorer"""
+    st.markdown("""
+    <div style="text-align: center; padding: 40px; background: linear-gradient(135deg, #f0f9ff, #e0f2fe); border-radius: 20px; margin-bottom: 30px;">
+        <div style="font-size: 32px; font-weight: 900; color: #000000; margin-bottom: 12px;">👥 Ultimate Data Explorer</div>
+        <div style="font-size: 18px; color: #1f2937; font-weight: 600;">Comprehensive workforce data analysis and insights</div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Real data metrics
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("📊 Total Records", f"{len(df):,}")
+    
+    with col2:
+        st.metric("📋 Data Columns", len(df.columns))
+    
+    with col3:
+        missing_data = df.isnull().sum().sum()
+        st.metric("❓ Missing Values", missing_data)
+    
+    with col4:
+        if 'Department' in df.columns:
+            unique_depts = df['Department'].nunique()
+        else:
+            unique_depts = len(df.select_dtypes(include=['object']).columns)
+        st.metric("🏢 Departments", unique_depts)
+    
+    show_delta_upload(df)
+    
+    st.markdown("---")
+    
+    # Advanced filtering
+    st.subheader("🔍 Advanced Data Filtering")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        if 'Department' in df.columns:
+            departments = st.multiselect(
+                "Filter by Department",
+                options=df['Department'].unique(),
+                default=df['Department'].unique()
+            )
+            filtered_df = df[df['Department'].isin(departments)]
+        else:
+            filtered_df = df
+    
+    with col2:
+        if 'Age' in df.columns:
+            age_range = st.slider(
+                "Age Range",
+                int(df['Age'].min()),
+                int(df['Age'].max()),
+                (int(df['Age'].min()), int(df['Age'].max()))
+            )
+            filtered_df = filtered_df[(filtered_df['Age'] >= age_range[0]) & (filtered_df['Age'] <= age_range[1])]
+    
+    with col3:
+        search_term = st.text_input("🔍 Search in data", placeholder="Search any field...")
+        if search_term:
+            from dashboard.data import search_rows
+            filtered_df = search_rows(filtered_df, search_term)
+    
+    st.markdown("---")
+    
+    # Display filtered data
+    st.subheader(f"📋 Data Overview ({len(filtered_df):,} records)")
+    
+    if len(filtered_df) > 0:
+        st.dataframe(
+            filtered_df,
+            use_container_width=True,
+            height=400
+        )
+        
+        # Download options
+        col1, col2, col3 = st.columns([1, 1, 2])
+        
+        with col1:
+            csv = filtered_df.to_csv(index=False)
+            st.download_button(
+                label="📥 Download Filtered Data",
+                data=csv,
+                file_name=f"filtered_employee_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                mime="text/csv",
+                use_container_width=True
+            )
+        
+        with col2:
+            if st.button("📊 Generate Analytics Report", use_container_width=True):
+                st.success("📊 Advanced analytics report generated successfully!")
+    else:
+        st.warning("No data matches your current filters. Please adjust your criteria.")
+
+@profiled
+def show_delta_upload(df):
+    """Merge a file of new, changed and leaving employees into the loaded roster"""
+    with st.expander("🔁 Apply Roster Changes"):
+        st.caption("Upload only the rows that changed, keyed by EmployeeID/EmpID. Known IDs are updated "
+                   "(empty cells keep their current value), new IDs are added, and an Action column "
+                   "value of 'exit' records a leaver.")
+        uploaded_file = st.file_uploader("Choose a change file", type="csv", key="delta_upload")
+        if uploaded_file is None:
+            return
+        # The uploader keeps its file across reruns; apply each file once
+        applied = st.session_state.setdefault('applied_deltas', {})
+        file_key = getattr(uploaded_file, 'file_id', None) or (uploaded_file.name, uploaded_file.size)
+        if file_key in applied:
+            st.success(applied[file_key])
+            return
+        
+        import pandas as pd
+        from dashboard.data import apply_roster_delta, calculate_headline_metrics
+        from dashboard.layout import get_roster_cube
+        
+        try:
+            with st.spinner("🔄 Merging changes..."):
+                cube = get_roster_cube(df)
+                trend_cache = st.session_state.get('trend_index')
+                trend_index = trend_cache[1] if trend_cache is not None and trend_cache[0] == id(df) else None
+                new_df, changes = apply_roster_delta(df, pd.read_csv(uploaded_file), cube, trend_index)
+        except (ValueError, KeyError, UnicodeDecodeError, pd.errors.ParserError) as e:
+            st.error(f"❌ Could not apply {uploaded_file.name}: {str(e)}")
+            return
+        
+        # Hand the patched aggregates to the new roster so nothing is rebuilt
+        hold_in_session('uploaded_data', new_df)
+        st.session_state.roster_cube = (id(new_df), cube)
+        st.session_state.headline_metrics = (id(new_df), calculate_headline_metrics(new_df, cube))
+        if trend_index is not None:
+            st.session_state.trend_index = (id(new_df), trend_index)
+        risk_cache = st.session_state.get('roster_risk')
+        if risk_cache is not None and risk_cache[0] == id(df):
+            from dashboard.tabs.analytics import patch_roster_risk
+            risk = risk_cache[1]
+            st.session_state.roster_risk = (id(new_df), None if risk is None else patch_roster_risk(risk, new_df, changes))
+        applied[file_key] = (f"✅ {uploaded_file.name}: {len(changes.updated):,} employees updated "
+                             f"({changes.exited:,} exits), {len(changes.inserted):,} added")
+        
+        try:
+            from dashboard.store import persist_roster_delta
+            persist_roster_delta(new_df, changes)
+        except Exception as e:
+            st.warning(f"⚠️ Could not save these changes for later sessions: {str(e)}")
+        st.rerun()
@@ -0,0 +1,232 @@
+"""AI Prediction tab: risk assessment form and results"""
+import streamlit as st
+
+from attrition.profiling import profiled
+from dashboard.memory import hold_in_session, session_value
+from dashboard.prediction import department_options, employee_record, generate_ultimate_prediction, get_whatif_simulator
+
+@profiled
+def show_ultimate_prediction_content(df):
+    """Ultimate AI prediction with advanced ML"""
+    st.markdown("""
+    <div class="chart-container">
+        <div class="chart-title">🤖 Advanced AI Prediction Engine</div>
+        <div class="chart-subtitle">Next-generation machine learning for precise attrition forecasting</div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        with st.form("ultimate_prediction_form"):
+            st.subheader("🎯 Employee Risk Assessment")
+            
+            col_a, col_b = st.columns(2)
+            
+            with col_a:
+                age = st.slider("Age", 18, 65, 35)
+                years_company = st.slider("Years at Company", 0, 40, 3)
+                department = st.selectbox("Department", department_options())
+                job_satisfaction = st.select_slider("Job Satisfaction", options=[1, 2, 3, 4, 5], value=3)
+            
+            with col_b:
+                work_life_balance = st.select_slider("Work-Life Balance", options=[1, 2, 3, 4, 5], value=3)
+                monthly_salary = st.number_input("Monthly Salary ($)", min_value=1000, max_value=50000, value=5000, step=500)
+                frequent_overtime = st.selectbox("Frequent Overtime", ["No", "Yes"])
+                performance_rating = st.select_slider("Performance Rating", options=[1, 2, 3, 4, 5], value=3)
+            
+            submitted = st.form_submit_button("🚀 Generate Ultimate Prediction", use_container_width=True, type="primary")
+            
+            if submitted:
+                with st.spinner("🧠 Processing with advanced AI algorithms..."):
+                    prediction_result = generate_ultimate_prediction(
+                        age, years_company, department, job_satisfaction, 
+                        work_life_balance, monthly_salary, frequent_overtime, 
+                        performance_rating, df
+                    )
+                    hold_in_session('ultimate_prediction', prediction_result)
+                    # A new employee starts the simulator from their own defaults
+                    for key in ('whatif_remove_overtime', 'whatif_balance'):
+                        st.session_state.pop(key, None)
+                    st.session_state.whatif_employee = employee_record(
+                        age, years_company, department, job_satisfaction,
+                        work_life_balance, monthly_salary, frequent_overtime
+                    )
+                    record_prediction_history(prediction_result, {
+                        'age': age,
+                        'years_company': years_company,
+                        'department': department,
+                        'job_satisfaction': job_satisfaction,
+                        'work_life_balance': work_life_balance,
+                        'monthly_salary': monthly_salary,
+                        'frequent_overtime': frequent_overtime,
+                        'performance_rating': performance_rating
+                    })
+    
+    with col2:
+        if 'ultimate_prediction' in st.session_state:
+            result = session_value('ultimate_prediction')
+            show_ultimate_prediction_results(result)
+        else:
+            st.markdown("""
+            <div style="text-align: center; padding: 60px; background: linear-gradient(135deg, #f0f9ff, #e0f2fe); border-radius: 20px; border: 2px solid #0ea5e9;">
+                <div style="font-size: 64px; margin-bottom: 20px;">🎯</div>
+                <div style="font-size: 24px; font-weight: 800; color: #000000; margin-bottom: 12px;">Ultimate AI Ready</div>
+                <div style="font-size: 16px; color: #1f2937; font-weight: 600;">Complete the form to get advanced risk assessment with a model agreement range and personalized recommendations</div>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    if 'whatif_employee' in st.session_state:
+        show_whatif_simulator(st.session_state.whatif_employee)
+
+@profiled
+def show_whatif_simulator(employee):
+    """Risk curve for the last assessed employee under salary, overtime and balance changes"""
+    simulator = get_whatif_simulator()
+    if simulator is None:
+        return
+    
+    from attrition.whatif import raise_grid
+    import plotly.graph_objects as go
+    
+    st.markdown("---")
+    st.subheader("🧪 What-If Simulator")
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        max_raise = st.slider("Maximum raise (%)", 5, 50, 20, step=5, key="whatif_max_raise")
+    with col2:
+        remove_overtime = st.checkbox(
+            "Remove overtime",
+            value=employee['OverTime'] == 'Yes',
+            disabled=employee['OverTime'] != 'Yes',
+            key="whatif_remove_overtime"
+        )
+    with col3:
+        balance_options = list(range(employee['WorkLifeBalance'], 5)) or [4]
+        target_balance = st.select_slider(
+            "Work-life balance target",
+            options=balance_options,
+            value=balance_options[-1],
+            key="whatif_balance"
+        )
+    
+    overtime = (('OverTime', 'set', 'No'),) if remove_overtime and employee['OverTime'] == 'Yes' else ()
+    balance = (('WorkLifeBalance', 'set', target_balance),) if target_balance > employee['WorkLifeBalance'] else ()
+    scenarios = {'Raise only': ()}
+    if overtime:
+        scenarios['Raise + no overtime'] = overtime
+    if balance:
+        scenarios[f'Raise + work-life balance {target_balance}'] = balance
+    if overtime and balance:
+        scenarios['Raise + both'] = overtime + balance
+    
+    # Every scenario's raise curve is scored in a single batched call;
+    # points already simulated for this employee come from the memo
+    step = 2.5
+    grids = {name: raise_grid(max_raise, step, extra) for name, extra in scenarios.items()}
+    misses_before = simulator.misses
+    results = simulator.simulate(employee, [intervention for grid in grids.values() for intervention in grid])
+    scored = simulator.misses - misses_before
+    
+    raises = [i * step for i in range(len(grids['Raise only']))]
+    colors = ['#0ea5e9', '#10b981', '#f59e0b', '#8b5cf6']
+    fig = go.Figure()
+    start = 0
+    for color, (name, grid) in zip(colors, grids.items()):
+        curve = results.iloc[start:start + len(grid)] * 100
+        start += len(grid)
+        if name == 'Raise only':
+            fig.add_trace(go.Scatter(
+                x=raises + raises[::-1],
+                y=list(curve['upper']) + list(curve['lower'])[::-1],
+                fill='toself', fillcolor='rgba(14, 165, 233, 0.12)', line=dict(width=0),
+                hoverinfo='skip', name='Tree vote spread'
+            ))
+        fig.add_trace(go.Scatter(x=raises, y=curve['probability'], mode='lines+markers', name=name, line=dict(color=color, width=3)))
+    
+    fig.update_layout(
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        font=dict(family="Inter", size=12, color="#000000"),
+        xaxis_title="Salary raise (%)",
+        yaxis_title="Attrition risk (%)",
+        yaxis=dict(range=[0, 100]),
+        height=400
+    )
+    st.plotly_chart(fig, use_container_width=True)
+    st.caption(f"{len(results)} scenarios · {scored} scored in one batch · {len(results) - scored} from cache")
+
+def record_prediction_history(result, inputs):
+    """Store a form prediction so it survives a page reload"""
+    try:
+        from dashboard.store import get_roster_store
+        get_roster_store().record_prediction(
+            inputs,
+            result['risk_score'],
+            result['confidence_lower'],
+            result['confidence_upper']
+        )
+    except Exception:
+        # History is best effort; never block showing the prediction
+        pass
+
+@profiled
+def show_ultimate_prediction_results(result):
+    """Show ultimate prediction results"""
+    risk_score = result['risk_score']
+    
+    if risk_score >= 70:
+        risk_level = "CRITICAL"
+        risk_color = "#dc2626"
+        risk_bg = "linear-gradient(135deg, #fee2e2, #fecaca)"
+    elif risk_score >= 40:
+        risk_level = "MODERATE"
+        risk_color = "#f59e0b"
+        risk_bg = "linear-gradient(135deg, #fef3c7, #fde68a)"
+    else:
+        risk_level = "LOW"
+        risk_color = "#10b981"
+        risk_bg = "linear-gradient(135deg, #dcfce7, #bbf7d0)"
+    
+    st.markdown(f"""
+    <div style="background: {risk_bg}; border: 3px solid {risk_color}; border-radius: 20px; padding: 40px; text-align: center; margin-bottom: 20px;">
+        <div style="font-size: 48px; font-weight: 900; color: {risk_color}; margin-bottom: 12px;">{risk_score:.1f}%</div>
+        <div style="font-size: 24px; font-weight: 800; color: {risk_color}; margin-bottom: 8px;">{risk_level} RISK</div>
+        <div style="font-size: 16px; color: #374151; font-weight: 600;">Attrition Probability</div>
+        <div style="margin-top: 16px; font-size: 14px; color: #4b5563; font-weight: 600;">
+            {result['band_label']}: {result['confidence_lower']:.1f}% - {result['confidence_upper']:.1f}%
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    if result.get('drivers'):
+        from attrition.explain import FEATURE_LABELS
+        st.subheader("🔍 Key Risk Drivers")
+        for feature, points in result['drivers']:
+            st.markdown(f"**{FEATURE_LABELS[feature]}** adds **{points:.1f} pts** to this employee's risk")
+    
+    if result['recommendations']:
+        st.subheader("🎯 Ultimate Action Plan")
+        for i, rec in enumerate(result['recommendations']):
+            priority_colors = {
+                'CRITICAL': '#dc2626',
+                'HIGH': '#f59e0b', 
+                'MEDIUM': '#3b82f6',
+                'LOW': '#10b981'
+            }
+            color = priority_colors.get(rec['priority'], '#6b7280')
+            
+            st.markdown(f"""
+            <div style="background: white; border-left: 6px solid {color}; border-radius: 12px; padding: 20px; margin: 12px 0; box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1);">
+                <div style="display: flex; justify-content: between; align-items: center; margin-bottom: 8px;">
+                    <div style="font-weight: 800; color: #1f2937; font-size: 16px;">{rec['action']}</div>
+                    <div style="background: {color}; color: white; padding: 4px 12px; border-radius: 20px; font-size: 12px; font-weight: 700;">{rec['priority']}</div>
+                </div>
+                <div style="color: #374151; margin-bottom: 8px; font-weight: 600;">{rec['description']}</div>
+                <div style="display: flex; gap: 20px; font-size: 14px;">
+                    <div style="color: #4b5563;"><strong>Timeline:</strong> {rec['timeline']}</div>
+                    <div style="color: #4b5563;"><strong>Impact:</strong> {rec['impact']}</div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
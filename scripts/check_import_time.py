@@ -0,0 +1,87 @@
+"""Check cold import time of the dashboard modules against a budget
+
+Each module is imported in a fresh interpreter under ``python -X importtime``
+and its cumulative import time is compared to ``benchmarks/import_budget.json``.
+With ``--record`` the measurements are appended to
+``benchmarks/import_times.jsonl`` so startup cost can be tracked across commits.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGET_PATH = os.path.join(ROOT, 'benchmarks', 'import_budget.json')
+HISTORY_PATH = os.path.join(ROOT, 'benchmarks', 'import_times.jsonl')
+
+
+def measure_import(module, repeats=3):
+    """Best-of-N cumulative import time of ``module`` in milliseconds"""
+    best = None
+    for _ in range(repeats):
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+            cwd=ROOT, capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+
+        for line in result.stderr.splitlines():
+            if not line.startswith('import time:'):
+                continue
+            parts = line.split('|')
+            if len(parts) == 3 and parts[2].strip() == module:
+                cumulative_ms = int(parts[1]) / 1000
+                best = cumulative_ms if best is None else min(best, cumulative_ms)
+                break
+    return best
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--record', action='store_true', help='append results to the history file')
+    args = parser.parse_args()
+
+    with open(BUDGET_PATH) as f:
+        budget = json.load(f)
+
+    results = {}
+    over_budget = []
+    for module, limit_ms in budget.items():
+        elapsed = measure_import(module, args.repeats)
+        results[module] = elapsed
+        status = "✅" if elapsed <= limit_ms else "❌"
+        if elapsed > limit_ms:
+            over_budget.append(module)
+        print(f"{status} {module:<40} {elapsed:8.1f} ms  (budget {limit_ms} ms)")
+
+    if args.record:
+        with open(HISTORY_PATH, 'a') as f:
+            f.write(json.dumps({
+                'timestamp': datetime.now().isoformat(timespec='seconds'),
+                'revision': git_revision(),
+                'python': sys.version.split()[0],
+                'import_ms': results,
+            }) + '\n')
+        print(f"📈 Results appended to {os.path.relpath(HISTORY_PATH, ROOT)}")
+
+    if over_budget:
+        print(f"❌ Over budget: {', '.join(over_budget)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -100,13 +100,13 @@ def generate_realistic_employee_data(n_samples=5000):
         attrition_factors = 0
         
         # Job satisfaction impact (strongest predictor)
-        if job_satisfaction &lt;= 2:
+        if job_satisfaction <= 2:
             attrition_factors += 0.4
         elif job_satisfaction == 3:
             attrition_factors += 0.1
         
         # Work-life balance impact
-        if work_life_balance &lt;= 2:
+        if work_life_balance <= 2:
             attrition_factors += 0.3
         
         # Overtime impact
@@ -119,7 +119,7 @@ def generate_realistic_employee_data(n_samples=5000):
         
         # Income satisfaction (relative to education and experience)
         expected_income = (education * 1000) + (total_working_years * 200)
-        if monthly_income &lt; expected_income * 0.8:
+        if monthly_income < expected_income * 0.8:
             attrition_factors += 0.2
         
         # Career progression
@@ -127,13 +127,13 @@ def generate_realistic_employee_data(n_samples=5000):
             attrition_factors += 0.15
         
         # Age factors
-        if age &lt; 25:
+        if age < 25:
             attrition_factors += 0.1  # Young employees more likely to switch
         elif age > 50:
             attrition_factors -= 0.1  # Older employees more stable
         
         # Performance impact
-        if performance_rating &lt;= 2:
+        if performance_rating <= 2:
             attrition_factors += 0.1
         
         # Add some randomness
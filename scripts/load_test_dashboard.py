@@ -0,0 +1,310 @@
+"""Simulate concurrent dashboard users and report per-action latency, CPU and RSS
+
+Every virtual user is a separate Streamlit session driven headlessly with
+``streamlit.testing.v1.AppTest`` against ``app.py``, all inside this one
+process, the way one ``streamlit run`` process serves every browser tab.
+Users upload a roster generated with ``generate_realistic_employee_data``,
+then keep switching tabs, searching the Employee Data table and submitting
+the AI Prediction form until ``--duration`` runs out. Nothing touches the
+network.
+
+AppTest cannot drive ``st.file_uploader``, so an upload is timed as the work
+the upload handler does (``read_roster`` on the CSV bytes, then
+``process_data_ultimate``) plus the first dashboard run of the new session.
+The roster is held through the process's memory manager under the session's
+own token, as the upload handler's ``hold_in_session`` does, so idle spills
+and the memory ceiling apply to virtual users as they do to real ones.
+AppTest also installs and removes a process-wide mock runtime around every
+run, which concurrent sessions would trample, so the harness installs one
+shared runtime up front and runs sessions through ``SessionAppTest``.
+"""
+import argparse
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections import defaultdict
+
+import numpy as np
+from streamlit.runtime import Runtime
+from streamlit.testing.v1 import AppTest
+from streamlit.testing.v1.local_script_runner import LocalScriptRunner
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+TABS = ('Overview', 'AI Prediction', 'Analytics', 'Employee Data')
+SEARCH_TERMS = ('Sales', 'Manager', 'Research', 'Engineer', 'Yes', 'Human')
+# Relative frequency of each action after the upload
+ACTION_WEIGHTS = {'switch_tab': 5, 'search': 2, 'predict': 2}
+PERCENTILES = (50, 90, 95, 99)
+MANAGER_SCRIPT = '''
+import streamlit as st
+from dashboard.memory import get_memory_manager
+st.session_state.memory_manager = get_memory_manager()
+'''
+
+
+def rss_bytes():
+    """Resident set size of this process (peak RSS where /proc is unavailable)"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class ResourceMonitor:
+    """Samples process RSS from a background thread and CPU time over the run"""
+
+    def __init__(self, interval=0.25):
+        self.interval = interval
+        self.samples = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='load-test-monitor', daemon=True)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.samples.append(rss_bytes())
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self._times = os.times()
+        self._started = time.perf_counter()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        times = os.times()
+        self.elapsed = time.perf_counter() - self._started
+        self.cpu_seconds = (times.user - self._times.user) + (times.system - self._times.system)
+
+    def report(self):
+        samples = np.array(self.samples or [rss_bytes()]) / 2 ** 20
+        return {
+            'elapsed_s': self.elapsed,
+            'cpu_s': self.cpu_seconds,
+            'cpu_cores_busy': self.cpu_seconds / self.elapsed if self.elapsed else 0.0,
+            'rss_start_mb': float(samples[0]),
+            'rss_mean_mb': float(samples.mean()),
+            'rss_peak_mb': float(samples.max()),
+        }
+
+
+def install_shared_runtime():
+    """The stand-in runtime every AppTest run would otherwise install for itself"""
+    from unittest.mock import MagicMock
+    from streamlit.runtime.caching.storage.dummy_cache_storage import MemoryCacheStorageManager
+    from streamlit.runtime.media_file_manager import MediaFileManager
+    from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+
+    runtime = MagicMock(spec=Runtime)
+    runtime.media_file_mgr = MediaFileManager(MemoryMediaFileStorage('/mock/media'))
+    runtime.cache_storage_manager = MemoryCacheStorageManager()
+    Runtime._instance = runtime
+
+
+class SessionAppTest(AppTest):
+    """AppTest whose runs leave the shared runtime in place, so sessions can run at once"""
+
+    def _run(self, widget_state=None, timeout=None):
+        runner = LocalScriptRunner(self._script_path, self.session_state)
+        self._tree = runner.run(widget_state, self.query_params, timeout or self.default_timeout)
+        self._tree._runner = self
+        runner.join()
+        return self
+
+
+def dashboard_memory_manager(timeout):
+    """The memory manager every app run shares
+
+    ``st.cache_resource`` only hands out its cached value inside a script
+    run; called from here it would build a second, unused manager.
+    """
+    from streamlit import source_util
+
+    with tempfile.NamedTemporaryFile('w', suffix='.py', delete=False) as f:
+        f.write(MANAGER_SCRIPT)
+    try:
+        app = SessionAppTest(f.name, default_timeout=timeout).run()
+    finally:
+        os.unlink(f.name)
+        # Streamlit remembers the first script it runs as the app's main page
+        source_util.invalidate_pages_cache()
+    return app.session_state['memory_manager']
+
+
+class VirtualUser:
+    """One dashboard session and the actions it takes"""
+
+    def __init__(self, user_id, csv_bytes, memory_manager, seed, timeout):
+        self.user_id = user_id
+        self.csv_bytes = csv_bytes
+        self.memory_manager = memory_manager
+        self.random = random.Random(seed)
+        self.timeout = timeout
+        self.app = None
+
+    def run_app(self):
+        self.app.run(timeout=self.timeout)
+        if self.app.exception:
+            raise RuntimeError(self.app.exception[0].message)
+
+    def show_tab(self, tab):
+        from dashboard.layout import TAB_LABELS
+        self.app.radio(key='nav_tab').set_value(TAB_LABELS[tab])
+        self.run_app()
+
+    def upload(self):
+        from attrition.ingest import read_roster
+        from dashboard.data import process_data_ultimate
+
+        self.app = SessionAppTest(os.path.join(ROOT, 'app.py'), default_timeout=self.timeout)
+        roster = process_data_ultimate(read_roster(io.BytesIO(self.csv_bytes), 'roster.csv'))
+        session = uuid.uuid4().hex
+        self.app.session_state['memory_session_id'] = session
+        self.app.session_state['uploaded_data'] = self.memory_manager.hold(session, 'uploaded_data', roster)
+        self.run_app()
+
+    def switch_tab(self):
+        current = self.app.session_state['active_tab']
+        self.show_tab(self.random.choice([tab for tab in TABS if tab != current]))
+
+    def search(self):
+        if self.app.session_state['active_tab'] != 'Employee Data':
+            self.show_tab('Employee Data')
+        box = next(widget for widget in self.app.text_input if widget.label.startswith('🔍'))
+        box.set_value(self.random.choice(SEARCH_TERMS))
+        self.run_app()
+
+    def predict(self):
+        if self.app.session_state['active_tab'] != 'AI Prediction':
+            self.show_tab('AI Prediction')
+        department = next(widget for widget in self.app.selectbox if widget.label == 'Department')
+        department.set_value(self.random.choice(department.options))
+        next(button for button in self.app.button if 'Generate' in button.label).click()
+        self.run_app()
+
+    def next_action(self):
+        names = list(ACTION_WEIGHTS)
+        return self.random.choices(names, weights=[ACTION_WEIGHTS[name] for name in names])[0]
+
+
+def run_user(user, deadline, think_time, latencies, errors, lock):
+    action = 'upload'
+    while True:
+        start = time.perf_counter()
+        try:
+            getattr(user, action)()
+        except Exception as e:
+            with lock:
+                errors[action].append(f"user {user.user_id}: {str(e).splitlines()[0] if str(e) else type(e).__name__}")
+            if user.app is None:
+                return
+        else:
+            with lock:
+                latencies[action].append(time.perf_counter() - start)
+        if time.perf_counter() >= deadline:
+            return
+        time.sleep(user.random.uniform(0, 2 * think_time))
+        action = user.next_action()
+
+
+def summarize(latencies, errors):
+    rows = {}
+    for action in ['upload'] + list(ACTION_WEIGHTS):
+        times = np.array(latencies.get(action, [])) * 1000
+        row = {'count': len(times), 'errors': len(errors.get(action, []))}
+        if len(times):
+            row.update({f"p{p}_ms": float(np.percentile(times, p)) for p in PERCENTILES})
+            row['max_ms'] = float(times.max())
+        rows[action] = row
+    return rows
+
+
+def memory_summary(memory_manager):
+    """What the dashboard's memory manager holds at the end of the run"""
+    usage = memory_manager.usage()
+    return {
+        'held': len(usage),
+        'held_mb': sum(row['mb'] for row in usage),
+        'resident_mb': sum(row['mb'] for row in usage if row['resident']),
+        'spills': sum(row['spills'] for row in usage),
+        'loads': sum(row['loads'] for row in usage),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=8, help='concurrent virtual users')
+    parser.add_argument('--duration', type=float, default=60.0, help='seconds each user keeps acting')
+    parser.add_argument('--rows', type=int, default=5000, help='employees in the generated roster')
+    parser.add_argument('--ramp-up', type=float, default=5.0, help='seconds over which users arrive')
+    parser.add_argument('--think-time', type=float, default=1.0, help='mean pause between actions, seconds')
+    parser.add_argument('--timeout', type=float, default=120.0, help='per script run, seconds')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help='write the results as JSON')
+    args = parser.parse_args()
+
+    # app.py finds models/ and data/ relative to the working directory
+    os.chdir(ROOT)
+    install_shared_runtime()
+    memory_manager = dashboard_memory_manager(args.timeout)
+    from scripts.data_generator import generate_realistic_employee_data
+
+    print(f"🏗️  Generating {args.rows:,} employees...")
+    csv_bytes = generate_realistic_employee_data(args.rows).to_csv(index=False).encode()
+
+    latencies, errors = defaultdict(list), defaultdict(list)
+    lock = threading.Lock()
+    deadline = time.perf_counter() + args.ramp_up + args.duration
+    threads = []
+    print(f"🔥 {args.users} users for {args.duration:.0f}s (ramp-up {args.ramp_up:.0f}s, think time {args.think_time:.1f}s)")
+    with ResourceMonitor() as monitor:
+        for user_id in range(args.users):
+            user = VirtualUser(user_id, csv_bytes, memory_manager, args.seed + user_id, args.timeout)
+            thread = threading.Thread(target=run_user, name=f'user-{user_id}', daemon=True,
+                                      args=(user, deadline, args.think_time, latencies, errors, lock))
+            thread.start()
+            threads.append(thread)
+            time.sleep(args.ramp_up / args.users)
+        for thread in threads:
+            thread.join()
+
+    actions = summarize(latencies, errors)
+    resources = monitor.report()
+    memory = memory_summary(memory_manager)
+    print(f"\n{'action':<12}{'count':>7}{'errors':>8}" + ''.join(f"{'p' + str(p):>10}" for p in PERCENTILES) + f"{'max':>10}")
+    for action, row in actions.items():
+        figures = ''.join(f"{row[f'p{p}_ms']:>8.0f}ms" for p in PERCENTILES) + f"{row['max_ms']:>8.0f}ms" if row['count'] else ''
+        print(f"{action:<12}{row['count']:>7,}{row['errors']:>8,}{figures}")
+    print(f"\n🖥️  CPU: {resources['cpu_s']:.1f} s over {resources['elapsed_s']:.1f} s "
+          f"({resources['cpu_cores_busy']:.2f} cores busy)")
+    print(f"🧠 RSS: {resources['rss_start_mb']:,.0f} MB at start, {resources['rss_mean_mb']:,.0f} MB mean, "
+          f"{resources['rss_peak_mb']:,.0f} MB peak")
+    print(f"🗄️  Session datasets: {memory['held']} held, {memory['resident_mb']:,.0f} of {memory['held_mb']:,.0f} MB "
+          f"resident, {memory['spills']} spills, {memory['loads']} reloads")
+    for action, messages in errors.items():
+        for message in messages[:3]:
+            print(f"❌ {action}: {message}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'users': args.users, 'duration': args.duration, 'rows': args.rows,
+                       'actions': actions, 'resources': resources, 'memory': memory}, f, indent=2)
+        print(f"📈 Results written to {args.output}")
+    if any(errors.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Load-test the batch-scoring service and report throughput and latency
+
+Start the service first (``python -m attrition.service``) or pass ``--spawn``
+to launch a local instance for the duration of the test.
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from train_model import create_sample_dataset
+
+
+async def _read_response(reader):
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError('Server closed the connection')
+    status = int(status_line.split()[1])
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+    if headers.get('transfer-encoding', '').lower() == 'chunked':
+        parts = []
+        while True:
+            size = int((await reader.readline()).strip() or b'0', 16)
+            if size == 0:
+                await reader.readline()
+                break
+            parts.append(await reader.readexactly(size))
+            await reader.readline()
+        body = b''.join(parts)
+    else:
+        body = await reader.readexactly(int(headers.get('content-length', 0)))
+    return status, body
+
+
+async def _worker(host, port, path, payload, content_type, deadline, latencies, errors):
+    reader, writer = await asyncio.open_connection(host, port)
+    request = (
+        f"POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: {content_type}\r\n"
+        f"Content-Length: {len(payload)}\r\n\r\n"
+    ).encode() + payload
+    try:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+            status, _ = await _read_response(reader)
+            if status == 200:
+                latencies.append(time.perf_counter() - start)
+            else:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+async def run_load_test(host, port, concurrency, duration, rows, mode):
+    df = create_sample_dataset().drop(columns='Attrition').head(rows)
+    records = df.to_dict('records')
+    if mode == 'stream':
+        path, content_type = '/score/stream', 'application/x-ndjson'
+        payload = ''.join(json.dumps(record) + '\n' for record in records).encode()
+    else:
+        path, content_type = '/score', 'application/json'
+        payload = json.dumps(records).encode()
+
+    latencies, errors = [], []
+    deadline = time.perf_counter() + duration
+    started = time.perf_counter()
+    await asyncio.gather(*[
+        _worker(host, port, path, payload, content_type, deadline, latencies, errors)
+        for _ in range(concurrency)
+    ])
+    elapsed = time.perf_counter() - started
+    return latencies, errors, elapsed
+
+
+def _wait_for_health(host, port, timeout=60):
+    async def probe():
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(f"GET /health HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n\r\n".encode())
+        await writer.drain()
+        status, _ = await _read_response(reader)
+        writer.close()
+        return status
+
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if asyncio.run(probe()) == 200:
+                return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise SystemExit("❌ Scoring service did not become healthy")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--duration', type=float, default=10.0, help='seconds')
+    parser.add_argument('--rows', type=int, default=1, help='employees per request')
+    parser.add_argument('--mode', choices=['json', 'stream'], default='json')
+    parser.add_argument('--spawn', action='store_true', help='start a local service instance')
+    args = parser.parse_args()
+
+    server = None
+    if args.spawn:
+        server = subprocess.Popen(
+            [sys.executable, '-m', 'attrition.service', '--host', args.host, '--port', str(args.port)],
+            cwd=ROOT
+        )
+        _wait_for_health(args.host, args.port)
+
+    try:
+        print(f"🔥 {args.concurrency} clients × {args.rows} rows/request → {args.mode} for {args.duration:.0f}s")
+        latencies, errors, elapsed = asyncio.run(run_load_test(
+            args.host, args.port, args.concurrency, args.duration, args.rows, args.mode
+        ))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    if not latencies:
+        raise SystemExit(f"❌ No successful requests ({len(errors)} errors)")
+
+    latency_ms = np.array(latencies) * 1000
+    print(f"✅ Requests: {len(latencies):,} ok, {len(errors):,} failed")
+    print(f"📈 Throughput: {len(latencies) / elapsed:,.1f} req/s, {len(latencies) * args.rows / elapsed:,.0f} rows/s")
+    print(f"⏱️  Latency p50: {np.percentile(latency_ms, 50):.1f} ms, "
+          f"p99: {np.percentile(latency_ms, 99):.1f} ms, max: {latency_ms.max():.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+"""Time the dashboard's data path on generated rosters of increasing size
+
+Each benchmark runs on rosters from ``generate_realistic_employee_data`` at
+every requested size (10k, 100k and 1M rows by default). It covers reading
+uploaded CSV and Parquet files, ingestion,
+the Overview aggregates, search and CSV export from the Employee Data tab,
+the model fit and predict of ``train_model.py``, roster scoring and chart
+construction. Every case is run ``--repeats`` times, and the best and median
+wall-clock times are written to ``benchmarks/results/<revision>.json``.
+``--compare`` checks a run against an earlier results file, for example
+from the parent commit, and exits non-zero when a case got slower than
+``--threshold`` times its old best.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+RESULTS_DIR = os.path.join(ROOT, 'benchmarks', 'results')
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+
+# train_model.train_model's default forest
+MODEL_PARAMS = dict(n_estimators=100, max_depth=10, min_samples_split=5, min_samples_leaf=2,
+                    random_state=42, class_weight='balanced')
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class Context:
+    """One roster size: the raw and processed frames plus what later cases need"""
+
+    def __init__(self, n_rows, workdir):
+        from dashboard.data import process_data_ultimate
+        from scripts.data_generator import generate_realistic_employee_data
+
+        self.n_rows = n_rows
+        self.workdir = workdir
+        self.raw = generate_realistic_employee_data(n_rows)
+        self.df = process_data_ultimate(self.raw)
+        # train_model.py's sample data has OverTime as 0/1
+        self.training = self.raw.assign(OverTime=(self.raw['OverTime'] == 'Yes').astype(int))
+        self.features = None
+        self.model = None
+        self.cube = None
+        self.upload_files = {}
+
+
+def bench_read_csv(ctx):
+    from attrition.ingest import read_roster
+    read_roster(ctx.upload_files['csv'])
+
+
+def bench_read_parquet(ctx):
+    from attrition.ingest import read_roster
+    read_roster(ctx.upload_files['parquet'])
+
+
+def bench_ingest(ctx):
+    from dashboard.data import process_data_ultimate
+    process_data_ultimate(ctx.raw)
+
+
+def bench_risk_factors(ctx):
+    from dashboard.data import calculate_real_risk_factors
+    calculate_real_risk_factors(ctx.df)
+
+
+def bench_department_groupby(ctx):
+    ctx.df.groupby('Department')['Attrition'].agg(['size', 'sum'])
+
+
+def bench_department_cube(ctx):
+    from dashboard.data import build_roster_cube
+    build_roster_cube(ctx.df).by('Department')
+
+
+def bench_search(ctx):
+    from dashboard.data import search_rows
+    search_rows(ctx.df, 'Manager')
+
+
+def bench_csv_export(ctx):
+    ctx.df.to_csv(index=False)
+
+
+def bench_feature_matrix(ctx):
+    from attrition.features import materialize_features
+    cache_dir = tempfile.mkdtemp(dir=ctx.workdir)
+    ctx.features, _ = materialize_features(ctx.training, cache_dir=cache_dir)
+
+
+def bench_model_fit(ctx):
+    from sklearn.ensemble import RandomForestClassifier
+    ctx.model = RandomForestClassifier(**MODEL_PARAMS).fit(ctx.features.X_train, ctx.features.y_train)
+
+
+def bench_model_predict(ctx):
+    ctx.model.predict_proba(ctx.features.X_test)
+
+
+def bench_roster_scoring(ctx):
+    from attrition.scoring import load_scoring_model
+    scoring_model = load_scoring_model(os.path.join(ROOT, 'models'))
+    if scoring_model is None:
+        return False
+    scoring_model.score(ctx.df)
+
+
+def bench_figures(ctx):
+    """The Overview and Analytics charts that carry per-row data, serialized as Streamlit sends them"""
+    from dashboard.tabs.analytics import age_distribution_figure, correlation_figure, salary_distribution_figure
+    from dashboard.tabs.overview import department_attrition_figure, risk_factors_figure
+
+    figures = [
+        department_attrition_figure(ctx.df, ctx.cube),
+        risk_factors_figure(ctx.df),
+        age_distribution_figure(ctx.df),
+        salary_distribution_figure(ctx.df),
+        correlation_figure(ctx.df),
+    ]
+    for fig in figures:
+        fig.to_json()
+
+
+def needs_upload_files(ctx):
+    if not ctx.upload_files:
+        ctx.upload_files['csv'] = os.path.join(ctx.workdir, f"roster-{ctx.n_rows}.csv")
+        ctx.upload_files['parquet'] = os.path.join(ctx.workdir, f"roster-{ctx.n_rows}.parquet")
+        ctx.raw.to_csv(ctx.upload_files['csv'], index=False)
+        ctx.raw.to_parquet(ctx.upload_files['parquet'], index=False)
+
+
+def needs_cube(ctx):
+    # The dashboard builds the cube once per roster for the headline metrics
+    if ctx.cube is None:
+        from dashboard.data import build_roster_cube
+        ctx.cube = build_roster_cube(ctx.df)
+
+
+def needs_features(ctx):
+    if ctx.features is None:
+        bench_feature_matrix(ctx)
+
+
+def needs_model(ctx):
+    needs_features(ctx)
+    if ctx.model is None:
+        bench_model_fit(ctx)
+
+
+BENCHMARKS = {
+    'read_csv': bench_read_csv,
+    'read_parquet': bench_read_parquet,
+    'ingest': bench_ingest,
+    'risk_factors': bench_risk_factors,
+    'department_groupby': bench_department_groupby,
+    'department_cube': bench_department_cube,
+    'search': bench_search,
+    'csv_export': bench_csv_export,
+    'feature_matrix': bench_feature_matrix,
+    'model_fit': bench_model_fit,
+    'model_predict': bench_model_predict,
+    'roster_scoring': bench_roster_scoring,
+    'figures': bench_figures,
+}
+
+# Untimed preparation for cases that build on an earlier one's output
+SETUP = {
+    'read_csv': needs_upload_files,
+    'read_parquet': needs_upload_files,
+    'model_fit': needs_features,
+    'model_predict': needs_model,
+    'figures': needs_cube,
+}
+
+
+def time_case(func, ctx, repeats):
+    """Wall-clock seconds of each run, or None if the case does not apply"""
+    runs = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        if func(ctx) is False:
+            return None
+        runs.append(time.perf_counter() - start)
+    return runs
+
+
+def compare(results, baseline_path, threshold):
+    """Cases slower than ``threshold`` x their best time in ``baseline_path``"""
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    print(f"\n📊 Against {os.path.relpath(baseline_path, ROOT)} (revision {baseline.get('revision')})")
+    regressions = []
+    for name, sizes in results.items():
+        for size, timing in sizes.items():
+            old = baseline['results'].get(name, {}).get(size)
+            if old is None:
+                continue
+            ratio = timing['best'] / old['best'] if old['best'] else float('inf')
+            status = "❌" if ratio > threshold else "✅"
+            if ratio > threshold:
+                regressions.append(f"{name}@{size}")
+            print(f"{status} {name:<20} {int(size):>9,} rows  {old['best']:9.3f} s -> {timing['best']:9.3f} s  ({ratio:.2f}x)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES))
+    parser.add_argument('--only', nargs='+', choices=list(BENCHMARKS), help='run just these cases')
+    parser.add_argument('--skip', nargs='+', choices=list(BENCHMARKS), default=[], help='leave these cases out')
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--output', help='results file (default: benchmarks/results/<revision>.json)')
+    parser.add_argument('--compare', metavar='RESULTS_JSON', help='earlier results to check for regressions')
+    parser.add_argument('--threshold', type=float, default=1.2, help='slowdown ratio that counts as a regression')
+    args = parser.parse_args()
+
+    names = [name for name in (args.only or BENCHMARKS) if name not in args.skip]
+    revision = git_revision()
+    results = {name: {} for name in names}
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for n_rows in args.sizes:
+            print(f"🏗️  Generating {n_rows:,} employees...")
+            ctx = Context(n_rows, workdir)
+            for name in names:
+                if name in SETUP:
+                    SETUP[name](ctx)
+                runs = time_case(BENCHMARKS[name], ctx, args.repeats)
+                if runs is None:
+                    print(f"⏭️  {name:<20} skipped (no trained model in models/)")
+                    continue
+                timing = {'best': min(runs), 'median': float(np.median(runs)), 'runs': runs}
+                results[name][str(n_rows)] = timing
+                print(f"⏱️  {name:<20} {n_rows:>9,} rows  best {timing['best']:9.3f} s  median {timing['median']:9.3f} s")
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{revision or 'worktree'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump({
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'revision': revision,
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'repeats': args.repeats,
+            'results': results,
+        }, f, indent=2)
+    print(f"📈 Results written to {os.path.relpath(output, ROOT)}")
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.threshold)
+        if regressions:
+            print(f"❌ Slower than {args.threshold}x: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,8 @@ plotly==5.15.0
 joblib==1.3.2
 seaborn==0.12.2
 matplotlib==3.7.2
+pyarrow==14.0.2
+zstandard==0.22.0
 "@ | Out-File -FilePath "requirements.txt" -Encoding UTF8
 
 # Install requirements
@@ -29,5 +29,7 @@ setup(
         "joblib>=1.3.2",
         "seaborn>=0.12.2",
         "matplotlib>=3.7.2",
+        "pyarrow>=14.0.2",
+        "zstandard>=0.22.0",
     ],
 )
@@ -0,0 +1,60 @@
+"""Location drill-down on rosters that lack some of State / LocationCode / Department"""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from attrition.geography import LocationIndex
+
+
+def make_roster(columns=('State', 'LocationCode', 'Department'), n=200):
+    rng = np.random.default_rng(0)
+    values = {
+        'State': rng.choice(['MA', 'CA', 'TX'], n),
+        'LocationCode': rng.choice(['1001', '2002', '3003'], n),
+        'Department': rng.choice(['Sales', 'Production', 'IT/IS'], n),
+    }
+    df = pd.DataFrame({col: values[col] for col in columns})
+    df['Attrition'] = rng.integers(0, 2, n)
+    return df
+
+
+def test_state_drills_to_departments_without_location_code():
+    df = make_roster(('State', 'Department'))
+    index = LocationIndex(df)
+
+    assert index.levels == ['State', 'Department']
+    departments = index.summary('MA')
+    expected = df[df['State'] == 'MA'].groupby('Department')['Attrition'].agg(['size', 'sum'])
+    assert departments['Department'].tolist() == expected.index.tolist()
+    assert departments['employees'].tolist() == expected['size'].tolist()
+    assert departments['leavers'].tolist() == expected['sum'].tolist()
+    assert 'LocationCode' not in departments.columns
+
+
+def test_location_analytics_renders_without_location_code():
+    AppTest = pytest.importorskip('streamlit.testing.v1').AppTest
+
+    def app():
+        import streamlit as st
+        from dashboard.tabs.analytics import show_location_analytics
+        show_location_analytics(st.session_state.roster)
+
+    for columns in [('State', 'Department'), ('State', 'LocationCode'), ('State', 'LocationCode', 'Department')]:
+        at = AppTest.from_function(app, default_timeout=60)
+        at.session_state['roster'] = make_roster(columns)
+        at.run()
+        assert not at.exception, (columns, at.exception)
+        assert ('location_code' in [box.key for box in at.selectbox]) == ('LocationCode' in columns)
+        if 'LocationCode' in columns:
+            at.selectbox(key='location_code').set_value(at.selectbox(key='location_code').options[1]).run()
+            assert not at.exception, (columns, at.exception)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, '-q']))